@@ -0,0 +1,376 @@
+"""Benchmark the library's hot paths against the fake SPI radio used by the tests.
+
+Each case is measured for:
+
+- ``time_ns``: wall time per operation (the best mean of several repeats). This is
+  machine-specific, so it is only compared to the baseline if ``--time-tolerance``
+  is given.
+- ``alloc_bytes``: memory allocated by the library's own code (as traced by
+  `tracemalloc` in ``circuitpython_nrf24l01/*`` frames) that is still held after 1
+  operation, including the operation's return value. Allocations made by the fake
+  radio and by this script are excluded.
+- ``spi_transactions``: SPI transactions per operation.
+- ``spi_bytes``: bytes transferred over the SPI bus per operation.
+- ``spi_sessions``: times the SPI device was opened per operation.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py                  # compare to baseline.json
+    python benchmarks/run_benchmarks.py --save           # update baseline.json
+    python benchmarks/run_benchmarks.py -o results.json  # also write the results
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "tests"))
+
+# pylint: disable=wrong-import-position,import-error
+from conftest import RadioState, ShimSpiDev, ShimDigitalIO  # noqa: E402
+from circuitpython_nrf24l01.rf24 import RF24  # noqa: E402
+from circuitpython_nrf24l01.wrapper import SPIDevCtx  # noqa: E402
+from circuitpython_nrf24l01.fake_ble import FakeBLE  # noqa: E402
+from circuitpython_nrf24l01.rf24_network import RF24Network  # noqa: E402
+from circuitpython_nrf24l01.rf24_mesh import RF24Mesh  # noqa: E402
+from circuitpython_nrf24l01.profiler import SpiProfiler  # noqa: E402
+from circuitpython_nrf24l01.network.structs import (  # noqa: E402
+    RF24NetworkFrame,
+    RF24NetworkHeader,
+)
+
+# pylint: enable=wrong-import-position,import-error
+
+BASELINE = os.path.join(HERE, "baseline.json")
+PACKAGE = os.path.join(os.path.dirname(HERE), "circuitpython_nrf24l01", "*")
+METRICS = ("time_ns", "alloc_bytes", "spi_transactions", "spi_bytes", "spi_sessions")
+TIME_SLACK_NS = 5000  # timer noise that dominates the fastest cases
+_RESET_REGISTERS = {reg: bytes(val) for reg, val in RadioState.registers.items()}
+
+
+def _reset_state():
+    """Restore the fake radio's (class-level) state shared by all instances."""
+    RadioState.registers.clear()
+    RadioState.registers.update(
+        {reg: bytearray(val) for reg, val in _RESET_REGISTERS.items()}
+    )
+    RadioState.rx_fifo = []
+    RadioState.tx_fifo = []
+
+
+def _new_node(cls, **kwargs):
+    """Create a node of type ``cls`` on a fresh fake SPI bus."""
+    _reset_state()
+    spi = ShimSpiDev()
+    node = cls(spi, ShimDigitalIO(), ShimDigitalIO(), **kwargs)
+    radio = getattr(node, "_rf24", node)
+    radio.airtime_wait = False  # only measure the Python side of a transmission
+    return node, spi
+
+
+def _complete_tx(spi: ShimSpiDev):
+    """Make every uploaded payload count as transmitted (and acknowledged)."""
+
+    def tx_payload(payload):
+        RadioState.registers[7][0] |= 0x20
+        return RadioState.registers[7] + bytes(len(payload))
+
+    spi.state.commands[0xA0] = tx_payload
+    spi.state.commands[0xB0] = tx_payload
+
+
+def _inject(payload: bytes, pipe: int = 1):
+    """Put a received ``payload`` into the fake radio's RX FIFO."""
+    RadioState.registers[0x11][0] = len(payload)
+    RadioState.rx_fifo.append(bytearray(payload))
+    RadioState.registers[7][0] &= 0xF1
+    RadioState.registers[7][0] |= pipe << 1
+
+
+# Each case creates its node(s) and returns (node, spi, operation)
+def case_rf24_send():
+    """Send a full 32-byte payload with auto-ack."""
+    radio, spi = _new_node(RF24)
+    _complete_tx(spi)
+    payload = b"\xFF" * 32
+    return radio, spi, lambda: radio.send(payload)
+
+
+def case_rf24_send_persistent():
+    """Send a full payload over an SPI device that stays open between sessions."""
+    _reset_state()
+    spi = ShimSpiDev()
+    radio = RF24(
+        SPIDevCtx(spi, ShimDigitalIO(), persistent=True), None, ShimDigitalIO()
+    )
+    radio.airtime_wait = False
+    _complete_tx(spi)
+    payload = b"\xFF" * 32
+    return radio, spi, lambda: radio.send(payload)
+
+
+def case_rf24_read():
+    """Read a received payload into a new `bytearray`."""
+    radio, spi = _new_node(RF24)
+    payload = b"\xFF" * 32
+
+    def read():
+        _inject(payload)
+        return radio.read()
+
+    return radio, spi, read
+
+
+def case_rf24_read_into():
+    """Read a received payload into a preallocated buffer."""
+    radio, spi = _new_node(RF24)
+    payload, buf = (b"\xFF" * 32, bytearray(32))
+
+    def read_into():
+        _inject(payload)
+        return radio.read_into(buf)
+
+    return radio, spi, read_into
+
+
+def case_ble_advertise():
+    """Broadcast a BLE advertisement with some service data."""
+    ble, spi = _new_node(FakeBLE)
+    _complete_tx(spi)
+    ble.name = "bench"
+    return ble, spi, lambda: ble.advertise(b"\x01\x02\x03\x04", data_type=0x16)
+
+
+def case_ble_available():
+    """Validate and decode a received BLE advertisement."""
+    ble, spi = _new_node(FakeBLE)
+    captured = []
+    ble.name = "bench"
+    ble.send = captured.append
+    ble.advertise(b"\x01\x02\x03\x04", data_type=0x16)
+    del ble.send
+    payload = bytes(captured[0])
+
+    def available():
+        _inject(payload, pipe=0)
+        ble.available()
+        return ble.read()
+
+    return ble, spi, available
+
+
+def _network_case(message: bytes):
+    """Write a network frame carrying ``message`` from the master to a child."""
+    net, spi = _new_node(RF24Network, node_address=0)
+    _complete_tx(spi)
+    frame = RF24NetworkFrame(RF24NetworkHeader(0o1, 1), message)
+    return net, spi, lambda: net.write(frame)
+
+
+def case_network_write():
+    """Write a network frame that fits in 1 payload."""
+    return _network_case(b"\xFF" * 20)
+
+
+def case_network_write_fragmented():
+    """Write a network frame that is split into several fragments."""
+    return _network_case(b"\xFF" * 100)
+
+
+def case_network_route():
+    """Forward a received network frame to another child of the master."""
+    net, spi = _new_node(RF24Network, node_address=0)
+    _complete_tx(spi)
+    frame = RF24NetworkFrame(RF24NetworkHeader(0o2, 1), b"1234")
+    frame.header.from_node = 0o1
+    payload = bytes(frame.pack())
+
+    def route():  # master receives a frame that it forwards to another child
+        _inject(payload)
+        return net.update()
+
+    return net, spi, route
+
+
+def case_mesh_dhcp():
+    """Assign mesh addresses to node IDs on the master."""
+    mesh, spi = _new_node(RF24Mesh, node_id=0)
+    _complete_tx(spi)
+    node_ids = iter(range(1 << 30))
+
+    def assign():
+        node_id = next(node_ids) % 250 + 1
+        mesh.set_address(node_id, (node_id % 5) + 1)
+
+    return mesh, spi, assign
+
+
+def case_mesh_lookup():
+    """Look up a node's address and ID in the master's mesh list."""
+    mesh, spi = _new_node(RF24Mesh, node_id=0)
+    for node_id in range(1, 51):
+        mesh.set_address(node_id, node_id)
+
+    def lookup():
+        mesh.lookup_address(25)
+        mesh.lookup_node_id(25)
+
+    return mesh, spi, lookup
+
+
+CASES: Dict[str, Callable[[], Tuple[object, ShimSpiDev, Callable]]] = {
+    "RF24.send": case_rf24_send,
+    "RF24.send(persistent)": case_rf24_send_persistent,
+    "RF24.read": case_rf24_read,
+    "RF24.read_into": case_rf24_read_into,
+    "FakeBLE.advertise": case_ble_advertise,
+    "FakeBLE.available": case_ble_available,
+    "RF24Network.write": case_network_write,
+    "RF24Network.write(fragmented)": case_network_write_fragmented,
+    "RF24Network.update(routing)": case_network_route,
+    "RF24Mesh.set_address": case_mesh_dhcp,
+    "RF24Mesh.lookup": case_mesh_lookup,
+}
+
+
+def library_alloc(operation: Callable) -> int:
+    """Get the bytes allocated in the library's frames that are still held after
+    1 call to ``operation`` (including the returned object)."""
+    only_lib = [tracemalloc.Filter(True, PACKAGE)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(only_lib)
+    result = operation()  # keep the returned object alive while measuring
+    after = tracemalloc.take_snapshot().filter_traces(only_lib)
+    tracemalloc.stop()
+    del result
+    return sum(max(0, stat.size_diff) for stat in after.compare_to(before, "lineno"))
+
+
+def measure(case: Callable, iterations: int, repeats: int) -> Dict[str, float]:
+    """Measure 1 benchmark case."""
+    node, spi, operation = case()
+    for _ in range(10):  # warm up any lazily allocated state
+        operation()
+
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            operation()
+        mean = (time.perf_counter_ns() - start) / iterations
+        best = mean if best is None else min(best, mean)
+
+    allocated = max(library_alloc(operation) for _ in range(10))
+
+    sessions = []
+    opener = spi.open
+    spi.open = lambda bus, dev: sessions.append(opener(bus, dev))
+    with SpiProfiler(node) as profiler:
+        for _ in range(iterations):
+            operation()
+    del spi.open
+    total = profiler.total()
+    return {
+        "time_ns": round(best, 1),
+        "alloc_bytes": allocated,
+        "spi_transactions": total.transactions / iterations,
+        "spi_bytes": total.bytes / iterations,
+        "spi_sessions": len(sessions) / iterations,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    time_tolerance: Optional[float],
+    alloc_tolerance: float,
+) -> list:
+    """Get a list of regressions from the ``baseline``. SPI usage must not grow;
+    allocations (and time, if ``time_tolerance`` is given) may grow by the given
+    fraction."""
+    regressions = []
+    for name, metrics in results.items():
+        if name not in baseline:
+            continue
+        for metric, value in metrics.items():
+            old = baseline[name].get(metric)
+            if old is None:
+                continue
+            limit = old
+            if metric == "time_ns":
+                if time_tolerance is None:
+                    continue  # timing is machine-specific; only informational
+                limit = old * (1 + time_tolerance) + TIME_SLACK_NS
+            elif metric == "alloc_bytes":
+                limit = old * (1 + alloc_tolerance) + 64
+            if value > limit:
+                regressions.append(
+                    "{} {}: {} > {} (baseline {})".format(
+                        name, metric, value, round(limit, 1), old
+                    )
+                )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks, then return 1 if any result regressed from the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--save", action="store_true", help="save the results as the new baseline"
+    )
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        help="allowed fraction of slowdown (default: timing is not compared)",
+    )
+    parser.add_argument(
+        "--alloc-tolerance",
+        type=float,
+        default=0.1,
+        help="allowed fraction of extra allocated memory (default: 0.1)",
+    )
+    parser.add_argument("-k", help="only run cases whose name contains this string")
+    args = parser.parse_args()
+    RadioState.logger.setLevel(logging.WARNING)
+
+    results = {}
+    for name, case in CASES.items():
+        if args.k and args.k not in name:
+            continue
+        results[name] = measure(case, args.iterations, args.repeats)
+        print(
+            "{:<32}".format(name),
+            ", ".join("{}={}".format(k, results[name][k]) for k in METRICS),
+        )
+    report = {"python": platform.python_version(), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out_file:
+            json.dump(report, out_file, indent=2, sort_keys=True)
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as out_file:
+            json.dump(report, out_file, indent=2, sort_keys=True)
+            out_file.write("\n")
+        return 0
+    if not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as in_file:
+        baseline = json.load(in_file)["results"]
+    regressions = compare(results, baseline, args.time_tolerance, args.alloc_tolerance)
+    for regression in regressions:
+        print("REGRESSION:", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Benchmark network scenarios on the simulated RF medium (in simulated time).
+
+Scenarios:
+
+- ``throughput``: payload data per second between 2 `RF24` nodes using `RF24.send()`.
+- ``routing``: the latency of a `RF24Network` message that is routed through each
+  level of the network tree up to the master node.
+- ``mesh``: how long `RF24MeshNoMaster` nodes take to get an address from the master
+  (it ends when all nodes joined or ``--duration`` passed).
+
+Usage::
+
+    python benchmarks/simulate_network.py --nodes 20 --loss 0.05 mesh
+
+Simulated time passes slower than real time while nodes poll their radio. Joining
+20 mesh nodes takes about half a minute; the real time grows with the number of
+nodes that join at once (the ``real_s`` result reports it).
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "tests"))
+
+# pylint: disable=wrong-import-position,import-error
+from simulator import Medium  # noqa: E402
+from circuitpython_nrf24l01.rf24 import RF24  # noqa: E402
+from circuitpython_nrf24l01.rf24_network import RF24Network  # noqa: E402
+from circuitpython_nrf24l01.rf24_mesh import RF24Mesh, RF24MeshNoMaster  # noqa: E402
+from circuitpython_nrf24l01.network.structs import RF24NetworkHeader  # noqa: E402
+
+# pylint: enable=wrong-import-position,import-error
+
+
+def throughput(medium: Medium, args) -> dict:
+    """Send as many payloads as possible for ``args.duration`` seconds."""
+    tx_node, rx_node = (medium.add_node(RF24), medium.add_node(RF24))
+    rx_node.open_rx_pipe(1, b"1Node")
+    rx_node.listen = True
+    tx_node.open_tx_pipe(b"1Node")
+    tx_node.listen = False
+    end = medium.now_ns + int(args.duration * 1000000000)
+    sent = failed = 0
+    while medium.now_ns < end:
+        if tx_node.send(b"\xFF" * 32):
+            sent += 1
+        else:
+            failed += 1
+        rx_node.flush_rx()
+    return {"payloads": sent, "failed": failed, "bps": sent * 256 / args.duration}
+
+
+def _serve(medium: Medium, node, inbox: list):
+    node.interrupt_config(data_recv=True, data_sent=False, data_fail=False)
+    while True:
+        node.update()
+        while node.available():
+            inbox.append((medium.now_ns, node.read()))
+        medium.wait_irq(node, 0.01)  # idle until a payload is received
+
+
+def routing(medium: Medium, args) -> dict:
+    """Send a message from the deepest node of a network branch to the master."""
+    addresses = [0, 0o1, 0o11, 0o111, 0o1111]
+    nodes = [medium.add_node(RF24Network, addr) for addr in addresses]
+    inbox: list = []
+    for node in nodes[:-1]:
+        medium.spawn(_serve, medium, node, inbox if node is nodes[0] else [])
+    latencies = []
+    for i in range(args.messages):
+        start = medium.now_ns
+        nodes[-1].send(RF24NetworkHeader(0, "T"), bytes([i & 0xFF]) * 8)
+        medium.run(0.05)
+        if inbox:
+            latencies.append((inbox.pop()[0] - start) / 1000000)
+            inbox.clear()
+    return {
+        "hops": len(addresses) - 1,
+        "delivered": len(latencies),
+        "latency_ms": sum(latencies) / len(latencies) if latencies else None,
+    }
+
+
+def mesh(medium: Medium, args) -> dict:
+    """Join ``args.nodes`` mesh nodes (that boot at random times) to the master."""
+    master = medium.add_node(RF24Mesh, 0)
+    joined = {}
+
+    def join(node, boot_delay: float):
+        medium.clock.sleep(boot_delay)
+        start = medium.now_ns
+        if node.renew_address(args.duration):
+            joined[node.node_id] = (medium.now_ns - start) / 1000000
+        _serve(medium, node, [])
+
+    medium.spawn(_serve, medium, master, [])
+    rand = random.Random(args.seed)
+    for node_id in range(1, args.nodes + 1):
+        node = medium.add_node(RF24MeshNoMaster, node_id)
+        medium.spawn(join, node, rand.random())
+    end = medium.now_ns + int(args.duration * 1000000000)
+    while len(joined) < args.nodes and medium.now_ns < end:
+        medium.run(0.1)
+    times = sorted(joined.values())
+    return {
+        "nodes": args.nodes,
+        "joined": len(times),
+        "median_ms": times[len(times) // 2] if times else None,
+        "max_ms": times[-1] if times else None,
+    }
+
+
+SCENARIOS = {"throughput": throughput, "routing": routing, "mesh": mesh}
+
+
+def main():
+    """Run the chosen scenario and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--nodes", type=int, default=20, help="mesh nodes to join")
+    parser.add_argument("--messages", type=int, default=20, help="routed messages")
+    parser.add_argument("--duration", type=float, default=30, help="simulated seconds")
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with Medium(loss=args.loss, latency=args.latency, seed=args.seed) as medium:
+        result = SCENARIOS[args.scenario](medium, args)
+        result["simulated_s"] = medium.now_ns / 1000000000
+        result["stats"] = medium.stats
+    result["real_s"] = round(time.perf_counter() - start, 3)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
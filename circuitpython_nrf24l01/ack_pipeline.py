@@ -0,0 +1,172 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""ack_pipeline module containing the ACK payload manager class AckPayloadPipeline"""
+import time
+
+try:
+    from typing import Union, Optional, List, Tuple
+except ImportError:
+    pass
+from .rf24 import RF24
+
+
+class AckPipeStats:
+    """The delivery statistics of the ACK payloads queued for 1 pipe."""
+
+    def __init__(self):
+        #: The number of ACK payloads delivered.
+        self.delivered: int = 0
+        #: The latency (in nanoseconds) of the last delivered ACK payload.
+        self.last_ns: int = 0
+        #: The highest latency (in nanoseconds) of a delivered ACK payload.
+        self.max_ns: int = 0
+        #: The sum of the latencies (in nanoseconds) of all delivered ACK payloads.
+        self.total_ns: int = 0
+
+    @property
+    def mean_ns(self) -> int:
+        """The average latency (in nanoseconds) of the delivered ACK payloads."""
+        return self.total_ns // self.delivered if self.delivered else 0
+
+    def record(self, latency: int):
+        """Count a delivered ACK payload that was queued ``latency`` nanoseconds ago."""
+        self.delivered += 1
+        self.last_ns = latency
+        self.max_ns = max(self.max_ns, latency)
+        self.total_ns += latency
+
+
+class AckPayloadPipeline:
+    """Keep the TX FIFO of a listening `RF24` object stocked with queued ACK
+    payloads."""
+
+    def __init__(self, radio: RF24):
+        #: The managed `RF24` object.
+        self.radio = radio
+        #: The received payloads as ``(pipe, payload)`` tuples.
+        self.rx_queue: List[Tuple[int, bytearray]] = []
+        #: The `AckPipeStats` of each pipe.
+        self.stats = [AckPipeStats() for _ in range(6)]
+        # ACK payloads (& when they were queued) that wait for a TX FIFO slot
+        self._queues: List[List[Tuple[Union[bytes, bytearray], int]]] = [
+            [] for _ in range(6)
+        ]
+        # the pipe & queued time of each ACK payload in the TX FIFO (in FIFO order)
+        self._loaded: List[Tuple[int, int]] = []
+        self._next_pipe = 0  # round-robin start when stocking the TX FIFO
+        if not radio.ack:
+            radio.ack = True
+        radio.flush_tx()  # the pipeline owns the TX FIFO
+
+    def queue(self, buf: Union[bytes, bytearray], pipe: int):
+        """Queue an ACK payload for the next packets received on a ``pipe``."""
+        if not 0 <= pipe <= 5:
+            raise IndexError("pipe number must be in range [0, 5]")
+        if not buf or len(buf) > 32:
+            raise ValueError("payload must have a byte length in range [1, 32]")
+        self._queues[pipe].append((buf, time.monotonic_ns()))
+        self._stock()
+
+    def pending(self, pipe: Optional[int] = None) -> int:
+        """The number of ACK payloads not yet delivered (for 1 or all pipes)."""
+        if pipe is None:
+            return sum(len(q) for q in self._queues) + len(self._loaded)
+        loaded = [p for p, _ in self._loaded if p == pipe]
+        return len(self._queues[pipe]) + len(loaded)
+
+    def update(self) -> int:
+        """Collect received payloads and restock the TX FIFO; returns the number
+        of ACK payloads delivered."""
+        radio, received = (self.radio, [])
+        burst = radio.drain()
+        now = time.monotonic_ns()
+        for i in range(burst.count):
+            pipe, payload = burst[i]
+            self.rx_queue.append((pipe, bytearray(payload)))
+            received.append(pipe)
+        delivered = 0
+        if self._loaded:
+            radio.clear_status_flags(False, True, False)  # also gets TX_DS
+            # the ACK payloads most likely sent are the oldest ones loaded for
+            # the pipes that received payloads, then the oldest ones loaded
+            order = self._match(received)
+            delivered = self._count_sent(radio.irq_ds, len(order))
+            order += [i for i in range(len(self._loaded)) if i not in order]
+            for i in sorted(order[:delivered], reverse=True):
+                pipe, queued_ns = self._loaded.pop(i)
+                self.stats[pipe].record(now - queued_ns)
+        self._stock()
+        return delivered
+
+    def _match(self, received: List[int]) -> List[int]:
+        """Pair each received payload's pipe with the oldest (unpaired) ACK payload
+        loaded for that pipe; returns the paired indices of the loaded payloads."""
+        matched: List[int] = []
+        for pipe in received:
+            for i, (loaded_pipe, _) in enumerate(self._loaded):
+                if loaded_pipe == pipe and i not in matched:
+                    matched.append(i)
+                    break
+        return matched
+
+    def _count_sent(self, data_sent: bool, matched: int) -> int:
+        """The number of loaded ACK payloads that left the TX FIFO since the last
+        `update()` (according to its level and the TX_DS flag)."""
+        loaded = len(self._loaded)
+        fifo = self.radio.fifo(True)  # bit 1 = TX FIFO is full; bit 0 = empty
+        if fifo & 1:
+            return loaded
+        if fifo & 2 or loaded == 1 or not data_sent:
+            return 0
+        if loaded == 2:
+            return 1
+        # 1 or 2 of the 3 loaded are left; the received payloads break the tie
+        return max(1, min(2, matched))
+
+    def _stock(self):
+        """Load queued ACK payloads (fairly among the pipes) until the TX FIFO
+        is full."""
+        while len(self._loaded) < 3:
+            for i in range(6):
+                pipe = (self._next_pipe + i) % 6
+                if self._queues[pipe]:
+                    break
+            else:
+                return
+            buf, queued_ns = self._queues[pipe][0]
+            if not self.radio.load_ack(buf, pipe):
+                return
+            del self._queues[pipe][0]
+            self._loaded.append((pipe, queued_ns))
+            self._next_pipe = (pipe + 1) % 6
+
+    def available(self) -> bool:
+        """Is there a received payload in the `rx_queue`?"""
+        if not self.rx_queue:
+            self.update()
+        return bool(self.rx_queue)
+
+    def read(self) -> Optional[Tuple[int, bytearray]]:
+        """Pop the next ``(pipe, payload)`` from the `rx_queue`."""
+        if self.available():
+            return self.rx_queue.pop(0)
+        return None
@@ -0,0 +1,176 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""airtime module containing functions that calculate on-air time & throughput"""
+try:
+    from typing import Dict, Iterable, List, Tuple, Union
+except ImportError:
+    pass
+
+TX_SETTLING = 130
+"""The time (in microseconds) that the radio's PLL takes to settle before a packet is
+transmitted or before an ACK packet can be received."""
+
+
+# the keys that batch() accepts in a configuration
+_SETTINGS = (
+    "payload_length",
+    "data_rate",
+    "crc",
+    "address_length",
+    "ack",
+    "ack_length",
+    "ard",
+    "arc",
+)
+
+
+def _bit_time(data_rate: int) -> float:
+    """The time (in microseconds) that 1 bit takes on air."""
+    if data_rate not in (1, 2, 250):
+        raise ValueError("data_rate must be 1 (Mbps), 2 (Mbps), or 250 (kbps)")
+    return 1 if data_rate == 1 else (0.5 if data_rate == 2 else 4)
+
+
+def packet_time(
+    payload_length: int = 32,
+    data_rate: int = 1,
+    crc: int = 2,
+    address_length: int = 5,
+) -> float:
+    """Calculate how long (in microseconds) 1 packet occupies the channel."""
+    # preamble, address, packet control field (9 bits), payload & CRC
+    bits = 8 * (1 + address_length + payload_length + crc) + 9
+    return bits * _bit_time(data_rate)
+
+
+def transmit_time(
+    payload_length: int = 32,
+    data_rate: int = 1,
+    crc: int = 2,
+    address_length: int = 5,
+    ack: bool = True,
+    ack_length: int = 0,
+) -> float:
+    """Calculate how long (in microseconds) 1 successful transmission takes."""
+    result = TX_SETTLING + packet_time(payload_length, data_rate, crc, address_length)
+    if ack:
+        result += TX_SETTLING + packet_time(ack_length, data_rate, crc, address_length)
+    return result
+
+
+def retry_time(
+    payload_length: int = 32,
+    data_rate: int = 1,
+    crc: int = 2,
+    address_length: int = 5,
+    ard: int = 1500,
+    arc: int = 3,
+) -> float:
+    """Calculate the worst-case time (in microseconds) that an acknowledged
+    transmission can take before it is considered failed."""
+    attempt = TX_SETTLING + packet_time(payload_length, data_rate, crc, address_length)
+    return (arc + 1) * (attempt + ard)
+
+
+def throughput(
+    payload_length: int = 32,
+    data_rate: int = 1,
+    crc: int = 2,
+    address_length: int = 5,
+    ack: bool = True,
+    ack_length: int = 0,
+) -> float:
+    """Calculate the theoretical maximum throughput (in bits per second) of
+    payload data."""
+    return (
+        payload_length
+        * 8000000
+        / transmit_time(payload_length, data_rate, crc, address_length, ack, ack_length)
+    )
+
+
+def radio_config(radio) -> Dict[str, Union[int, bool]]:
+    """Get the current settings of an `RF24` object that affect the on-air time."""
+    return {
+        "payload_length": 32
+        if radio.get_dynamic_payloads(0)
+        else radio.get_payload_length(0),
+        "data_rate": radio.data_rate,
+        "crc": radio.crc,
+        "address_length": radio.address_length,
+        "ack": radio.get_auto_ack(0),
+        "ard": radio.ard,
+        "arc": radio.arc,
+    }
+
+
+def _tx_timing(radio) -> Tuple[int, int]:
+    """Estimate the duration (in nanoseconds) of an `RF24` object's 1st transmission
+    attempt and the interval between its automatic re-transmissions."""
+    # use the shadow registers; polling the radio here would defeat the purpose
+    # pylint: disable=protected-access
+    rf_setup = radio._rf_setup & 0x28
+    data_rate = (2 if rf_setup == 8 else 250) if rf_setup else 1
+    crc = 0
+    if radio._aa or radio._config & 8:
+        crc = 2 if radio._config & 4 else 1
+    ack = bool(radio._aa & 1) and not radio._tx_no_ack
+    # assume the ACK packet is empty; the remaining wait is polled anyway
+    attempt = transmit_time(radio._tx_pl_len, data_rate, crc, radio._addr_len, ack)
+    if not ack:
+        return int(attempt * 1000), int(attempt * 1000)
+    ard = (radio._retry_setup >> 4) * 250 + 250
+    retry = retry_time(radio._tx_pl_len, data_rate, crc, radio._addr_len, ard, 0)
+    return int(attempt * 1000), int(retry * 1000)
+
+
+def batch(
+    configs: Iterable[Dict[str, Union[int, bool]]]
+) -> List[Tuple[float, float, float]]:
+    """Calculate the `transmit_time()`, `retry_time()`, and `throughput()` for
+    multiple configurations."""
+    results = []
+    for config in configs:
+        unknown = [key for key in config if key not in _SETTINGS]
+        if unknown:
+            raise TypeError("unknown setting(s): {}".format(", ".join(unknown)))
+        link = (
+            int(config.get("payload_length", 32)),
+            int(config.get("data_rate", 1)),
+            int(config.get("crc", 2)),
+            int(config.get("address_length", 5)),
+        )
+        ack, ack_len = (bool(config.get("ack", True)), int(config.get("ack_length", 0)))
+        if ack:
+            retry = retry_time(
+                *link, int(config.get("ard", 1500)), int(config.get("arc", 3))
+            )
+        else:
+            retry = transmit_time(*link, False)
+        results.append(
+            (
+                transmit_time(*link, ack, ack_len),
+                retry,
+                throughput(*link, ack, ack_len),
+            )
+        )
+    return results
@@ -0,0 +1,198 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""burst module containing the helpers that group several commands of an `RF24`
+object into as few SPI bus sessions as possible"""
+# these helpers implement RF24 methods, so they use the RF24 object's internals
+# pylint: disable=protected-access
+import time
+
+try:
+    from typing import List, Tuple, Union
+except ImportError:
+    pass
+
+
+class RxBurst:
+    """The payloads collected from the RX FIFO by `RF24.drain()`."""
+
+    def __init__(self):
+        #: The number of payloads collected by the last call to `RF24.drain()`.
+        self.count: int = 0
+        #: The pipe number that received each collected payload.
+        self.pipes = bytearray(3)
+        #: The length of each collected payload.
+        self.lengths = bytearray(3)
+        #: The buffers (32 bytes each) that hold the collected payloads.
+        self.payloads: List[bytearray] = [bytearray(32) for _ in range(3)]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Tuple[int, memoryview]:
+        if not 0 <= index < self.count:
+            raise IndexError("RxBurst index out of range")
+        pl_view = memoryview(self.payloads[index])
+        return (self.pipes[index], pl_view[: self.lengths[index]])
+
+
+def _drain(radio, burst: RxBurst) -> RxBurst:
+    """Collect every payload in the RX FIFO into ``burst`` (for `RF24.drain()`)."""
+    burst.count = 0
+    if radio._batch:
+        radio._flush_batch()
+    # R_RX_PL_WID also reports STATUS; a NOP suffices for static payloads
+    cmd, cmd_len = (0x60, 2) if radio._features & 4 else (0xFF, 1)
+    out_buf, in_buf = (radio._out, radio._in)
+    with radio._spi as spi:
+        while burst.count < 3:
+            if burst.count:
+                radio._cycle_csn()
+            out_buf[0] = cmd
+            spi.write_readinto(out_buf, in_buf, out_end=cmd_len, in_end=cmd_len)
+            pipe = in_buf[0] >> 1 & 7
+            if pipe > 5:
+                break  # RX FIFO is empty
+            length = in_buf[1] if cmd_len > 1 else radio._pl_len[pipe]
+            if not 0 < length <= 32:
+                break  # corrupt payload width; leave it for flush_rx()
+            radio._cycle_csn()
+            out_buf[0] = 0x61
+            spi.write_readinto(
+                out_buf, radio._rx_pl, out_end=length + 1, in_end=length + 1
+            )
+            burst.pipes[burst.count] = pipe
+            burst.lengths[burst.count] = length
+            burst.payloads[burst.count][:length] = radio._rx_view[1 : length + 1]
+            burst.count += 1
+        if burst.count:
+            radio._cycle_csn()
+            out_buf[0] = 0x27  # clear RX_DR flag in STATUS register
+            out_buf[1] = 0x40
+            spi.write_readinto(out_buf, in_buf, out_end=2, in_end=2)
+    return burst
+
+
+class StreamResult:
+    """The report returned by `RF24.stream()`."""
+
+    def __init__(self, count: int):
+        #: A `list` of `bool` values describing if each payload was transmitted.
+        self.success: List[bool] = [False] * count
+        #: A `list` of how many times each payload exhausted the auto-retries.
+        self.retries: List[int] = [0] * count
+        #: The total time (in nanoseconds) spent streaming the payloads.
+        self.elapsed_ns: int = 0
+
+    def __len__(self) -> int:
+        return len(self.success)
+
+
+class _TxStream:
+    """The TX FIFO bookkeeping of 1 call to `RF24.stream()`."""
+
+    def __init__(
+        self,
+        radio,
+        payloads: List[Union[bytes, bytearray, memoryview]],
+        cmd: int,
+        max_retries: int,
+    ):
+        self._radio = radio
+        self._payloads = payloads
+        self._cmd = cmd
+        self._max_retries = max_retries
+        self.report = StreamResult(len(payloads))
+        self.pending: List[int] = []  # indices of payloads in the TX FIFO
+        self.loaded = 0  # the number of payloads loaded into the TX FIFO so far
+
+    def run(self) -> StreamResult:
+        """Transmit all payloads while keeping the TX FIFO full."""
+        radio, total = (self._radio, len(self._payloads))
+        start_timer = time.monotonic_ns()
+        radio._ce_pin.value = False
+        radio.flush_tx()
+        radio.clear_status_flags(False)
+        while self.loaded < total or self.pending:
+            while self.loaded < total and len(self.pending) < 3:
+                radio._reg_write_bytes(self._cmd, self._payloads[self.loaded])
+                self.pending.append(self.loaded)
+                self.loaded += 1
+            radio._ce_pin.value = True
+            radio.update()
+            flags = radio._in[0] & 0x30
+            if not flags:
+                continue
+            failed = bool(flags & 0x10)
+            if failed:  # stop transmitting while the TX FIFO is resolved
+                radio._ce_pin.value = False
+            radio.clear_status_flags(False)
+            if radio._reg_read(0x17) & 0x10:  # TX FIFO is empty
+                self._settle(0, 0, 0, failed)
+            elif failed or self.loaded < total:
+                # the number of payloads that fit in the TX FIFO tells
+                # how many of the pending payloads were transmitted
+                new, dummies = self._fill(failed)
+                self._settle(3 - new - dummies, new, dummies, failed)
+            # else wait for the last payloads to finish
+        radio._ce_pin.value = False
+        self.report.elapsed_ns = time.monotonic_ns() - start_timer
+        return self.report
+
+    def _fill(self, pad: bool) -> Tuple[int, int]:
+        """Load payloads (and dummies if ``pad``) until the TX FIFO is full;
+        returns the number of payloads and dummies that were loaded."""
+        count, dummies = (0, 0)
+        while True:
+            if self.loaded + count < len(self._payloads):
+                data = self._payloads[self.loaded + count]
+            elif pad:
+                data = self._radio._fit_payload(b"\0")
+            else:
+                return count, dummies
+            self._radio._reg_write_bytes(self._cmd, data)
+            if self._radio._in[0] & 1:  # TX FIFO was full; data was discarded
+                return count, dummies
+            if self.loaded + count < len(self._payloads):
+                count += 1
+            else:
+                dummies += 1
+
+    def _settle(self, in_fifo: int, new: int, dummies: int, failed: bool):
+        """Record the outcome of the pending payloads given the number of them
+        still ``in_fifo`` and the ``new`` payloads & ``dummies`` just loaded."""
+        pending, report = (self.pending, self.report)
+        done = len(pending) - in_fifo
+        for i in pending[:done]:
+            report.success[i] = True
+        del pending[:done]
+        pending.extend(range(self.loaded, self.loaded + new))
+        self.loaded += new
+        rewrite = bool(dummies)
+        if failed:
+            report.retries[pending[0]] += 1
+            if report.retries[pending[0]] > self._max_retries:
+                del pending[0]  # give up on this payload
+                rewrite = True
+        if rewrite:  # only FLUSH_TX can remove payloads from the TX FIFO
+            self._radio.flush_tx()
+            for i in pending:
+                self._radio._reg_write_bytes(self._cmd, self._payloads[i])
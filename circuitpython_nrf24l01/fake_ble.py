@@ -62,6 +62,11 @@ def chunk(buf: Union[bytes, bytearray], data_type: int = 0x16) -> bytearray:
 def whitener(buf: Union[bytes, bytearray], coef: int) -> bytearray:
     """Whiten and de-whiten data according to the given coefficient."""
     data = bytearray(buf)
+    _whiten_into(data, coef)
+    return data
+
+
+def _whiten_into(data: Union[bytearray, memoryview], coef: int):
     for i, byte in enumerate(data):
         res, mask = (0, 1)
         for _ in range(8):
@@ -71,23 +76,44 @@ def whitener(buf: Union[bytes, bytearray], coef: int) -> bytearray:
             mask <<= 1
             coef >>= 1
         data[i] = byte ^ res
-    return data
 
 
 def crc24_ble(
-    data: Union[bytes, bytearray], deg_poly: int = 0x65B, init_val: int = 0x555555
+    data: Union[bytes, bytearray, memoryview],
+    deg_poly: int = 0x65B,
+    init_val: int = 0x555555,
 ) -> bytearray:
     """This function calculates a checksum of various sized buffers."""
+    crc = _crc24(data, len(data), deg_poly, init_val)
+    return reverse_bits((crc).to_bytes(3, "big"))
+
+
+def _crc24(
+    data: Union[bytes, bytearray, memoryview],
+    end: int,
+    deg_poly: int = 0x65B,
+    init_val: int = 0x555555,
+) -> int:
     crc = init_val
-    for byte in data:
-        crc ^= swap_bits(byte) << 16
+    for i in range(end):
+        crc ^= swap_bits(data[i]) << 16
         for _ in range(8):
             if crc & 0x800000:
                 crc = (crc << 1) ^ deg_poly
             else:
                 crc <<= 1
         crc &= 0xFFFFFF
-    return reverse_bits((crc).to_bytes(3, "big"))
+    return crc
+
+
+def _crc_matches(data: Union[bytearray, memoryview], end: int) -> bool:
+    """Compare the bit-reversed checksum at ``data[end:end + 3]`` to the
+    checksum of ``data[:end]`` without copying either."""
+    crc = _crc24(data, end)
+    for i in range(3):
+        if swap_bits(data[end + i]) != (crc >> (16 - i * 8)) & 0xFF:
+            return False
+    return True
 
 
 BLE_FREQ = (2, 26, 80)
@@ -332,13 +358,16 @@ class FakeBLE(RF24):
     def available(self) -> bool:
         """A `bool` describing if there is a payload in the `rx_queue`."""
         if super().available():
-            self.rx_cache = super().read(self.payload_length)  # type: ignore
-            self.rx_cache = self.whiten(reverse_bits(self.rx_cache))
-            end = self.rx_cache[1] + 2
-            self.rx_cache = self.rx_cache[: end + 3]
-            if end < 30 and self.rx_cache[end : end + 3] == crc24_ble(
-                self.rx_cache[:end]
-            ):
+            # de-whiten the payload in place to avoid allocating on every read
+            view = super().read_view(self.payload_length)
+            assert view is not None  # payload_length is never 0
+            for i, byte in enumerate(view):
+                view[i] = swap_bits(byte)
+            _whiten_into(view, (self._curr_freq + 37) | 0x40)
+            end = view[1] + 2
+            # only copy the payload once its checksum is valid
+            if end < 30 and _crc_matches(view, end):
+                self.rx_cache = bytearray(view[: end + 3])
                 # print("recv'd:", self.rx_cache)
                 # print("crc:", self.rx_cache[end: end + 3])
                 self.rx_queue.append(QueueElement(self.rx_cache))
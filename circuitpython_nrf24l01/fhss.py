@@ -0,0 +1,206 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""fhss module containing the frequency hopping classes HopTable & FhssLink"""
+import time
+
+try:
+    from typing import Union, Sequence, Optional, List, Tuple
+except ImportError:
+    pass
+from .rf24 import RF24
+
+
+class HopTable:
+    """A pseudo-random sequence of distinct channels derived from a seed."""
+
+    def __init__(
+        self,
+        seed: int,
+        channels: Optional[Sequence[int]] = None,
+        length: Optional[int] = None,
+    ):
+        pool = list(range(84)) if channels is None else list(channels)
+        if (
+            not pool
+            or len(set(pool)) != len(pool)
+            or not all(0 <= channel <= 125 for channel in pool)
+        ):
+            raise ValueError("channels must be distinct values in range [0, 125]")
+        # Fisher-Yates shuffle using a small LCG (same result on every platform)
+        state = seed % 65537
+        for i in range(len(pool) - 1, 0, -1):
+            state = (state * 75 + 74) % 65537
+            j = state % (i + 1)
+            pool[i], pool[j] = pool[j], pool[i]
+        if length is not None:
+            if not 1 <= length <= len(pool):
+                raise ValueError("length must be in range [1, {}]".format(len(pool)))
+            pool = pool[:length]
+        #: The channels in the order they are used.
+        self.channels = bytes(pool)
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def __getitem__(self, index: int) -> int:
+        return self.channels[index % len(self.channels)]
+
+
+class FhssLink:
+    """Hop an `RF24` object's channel along a `HopTable` that is shared with the
+    other end of the link."""
+
+    def __init__(
+        self,
+        radio: RF24,
+        table: HopTable,
+        dwell: int = 0,
+        hop_every: int = 1,
+        sync_timeout: int = 100,
+    ):
+        #: The managed `RF24` object.
+        self.radio = radio
+        #: The shared `HopTable`.
+        self.table = table
+        #: The time (in milliseconds) spent on each channel (0 hops by packet count).
+        self.dwell = dwell
+        #: The number of packets sent on each channel (if `dwell` is 0).
+        self.hop_every = max(1, hop_every)
+        #: The time (in milliseconds) without a received packet that loses the sync.
+        self.sync_timeout = sync_timeout
+        #: The time (in milliseconds) spent on each channel while finding the sync.
+        self.park_time: int = max(sync_timeout, 2 * dwell) * len(table)
+        #: The received payloads as ``(pipe, payload)`` tuples.
+        self.rx_queue: List[Tuple[int, bytearray]] = []
+        #: Is a receiving link following the transmitter's hops?
+        self.synced: bool = False
+        #: The number of times a receiving link found the sync.
+        self.syncs: int = 0
+        #: The number of channel changes.
+        self.hops: int = 0
+        self._index, self._count = (0, 0)
+        self._epoch = time.monotonic_ns()  # when slot 0 started (time basis)
+        self._last_rx = self._parked_at = self._epoch
+        # times of the 1st & last packets received in the current slot (time basis)
+        self._first: Optional[int] = None
+        self._last = 0
+        radio.channel = table[0]
+
+    @property
+    def index(self) -> int:
+        """The position of the current channel in the `table`."""
+        return self._index
+
+    @property
+    def channel(self) -> int:
+        """The current channel."""
+        return self.table[self._index]
+
+    def _hop(self, index: int):
+        self._count, self._first = (0, None)
+        index %= len(self.table)
+        if index == self._index:
+            return
+        self._index = index
+        self.hops += 1
+        radio = self.radio
+        if radio.ce_pin and radio.listen:  # RF_CH only applies in standby
+            radio.ce_pin = False
+            radio.channel = self.table[index]
+            radio.ce_pin = True
+        else:
+            radio.channel = self.table[index]
+
+    def _slot(self, now: int) -> int:
+        return (now - self._epoch) // (self.dwell * 1000000)
+
+    def send(
+        self, buf: Union[bytes, bytearray], ask_no_ack: bool = False
+    ) -> Union[bool, bytearray]:
+        """Transmit a payload on the current channel of the hop sequence; returns
+        the ACK payload (if any) or whether the payload was acknowledged."""
+        if self.dwell:
+            self._hop(self._slot(time.monotonic_ns()))
+        result = self.radio.send(buf, ask_no_ack)
+        if not self.dwell:
+            self._count += 1
+            if self._count >= self.hop_every:  # hop even if the payload failed
+                self._hop(self._index + 1)
+        return result if isinstance(result, bytearray) else bool(result)
+
+    def update(self) -> int:
+        """Collect received payloads and follow the transmitter's hops; returns
+        the number of payloads collected."""
+        burst = self.radio.drain()
+        now = time.monotonic_ns()
+        for i in range(burst.count):
+            pipe, payload = burst[i]
+            self.rx_queue.append((pipe, bytearray(payload)))
+        dwell_ns = self.dwell * 1000000
+        if burst.count:
+            self._last_rx = now
+            if not self.synced:
+                self.synced = True
+                self.syncs += 1
+                if dwell_ns:  # assume the transmitter is halfway through this slot
+                    self._epoch = now - self._index * dwell_ns - dwell_ns // 2
+            if not dwell_ns:
+                self._count += burst.count
+                if self._count >= self.hop_every:
+                    self._hop(self._index + 1)
+            else:
+                if self._first is None:
+                    self._first = now
+                self._last = now
+        elif self.synced and now - self._last_rx > self.sync_timeout * 1000000:
+            self.synced = False
+            self._parked_at = now
+        if not self.synced:
+            if now - self._parked_at > self.park_time * 1000000:
+                self._parked_at = now  # wait for the transmitter on another channel
+                self._hop(self._index + 1)
+        elif dwell_ns and self._slot(now) % len(self.table) != self._index:
+            self._adjust(dwell_ns)
+            self._hop(self._slot(now))
+        return burst.count
+
+    def _adjust(self, dwell_ns: int):
+        """Correct the estimated start of the transmitter's slots using the
+        packets received in the slot that just ended."""
+        if self._first is None:
+            return
+        start = self._epoch + self._slot(self._first) * dwell_ns
+        # the transmitter's slot started between (last - dwell) and first
+        estimate = (self._last - dwell_ns + self._first) // 2
+        self._epoch += (estimate - start) // 2
+
+    def available(self) -> bool:
+        """Is there a received payload in the `rx_queue`?"""
+        if not self.rx_queue:
+            self.update()
+        return bool(self.rx_queue)
+
+    def read(self) -> Optional[Tuple[int, bytearray]]:
+        """Pop the next ``(pipe, payload)`` from the `rx_queue`."""
+        if self.available():
+            return self.rx_queue.pop(0)
+        return None
@@ -22,9 +22,10 @@
 """A module to hold all usually accessible RF24 API via the RF24Network API"""
 # pylint: disable=missing-docstring
 import time
+from micropython import const
 
 try:
-    from typing import Tuple, Union, List, Optional
+    from typing import Any, Tuple, Union, List, Optional
 except ImportError:
     pass
 import busio  # type:ignore[import]
@@ -160,6 +161,9 @@ class RadioMixin:
         self._rf24.print_pipes()
 
 
+_CACHE_SIZE = const(32)  # max entries of the Physical Address & next hop caches
+
+
 def _lvl_2_addr(level: int) -> int:
     """translate decimal tree ``level`` into an octal node address"""
     level_addr = 0
@@ -195,20 +199,50 @@ class NetworkMixin(RadioMixin):
         self.queue: Union[FrameQueueFrag, FrameQueue] = FrameQueueFrag()
         #: A buffer containing the last frame handled by the network node
         self.frame_buf = RF24NetworkFrame()
-        self.address_suffix = bytearray([0xC3, 0x3C, 0x33, 0xCE, 0x3E, 0xE3])
-        """Each byte in this `bytearray` corresponds to the unique byte per pipe and
+        # pre-allocated buffer that received payloads are read into
+        self._rx_buf = bytearray(32)
+        self._rx_view = memoryview(self._rx_buf)
+        # pre-allocated buffer that outgoing frames (or fragments) are staged in
+        self._tx_buf = bytearray(32)
+        self._tx_view = memoryview(self._tx_buf)
+        # cached Physical Addresses & next hops (cleared when their inputs change)
+        self._addr_cache: dict = {}
+        self._route_cache: dict = {}
+        self._suffix = b"\xC3\x3C\x33\xCE\x3E\xE3"
+        self._prefix = b"\xCC"
+
+    @property
+    def address_suffix(self) -> bytes:
+        """Each byte in this `bytes` object corresponds to the unique byte per pipe and
         child node."""
-        self.address_prefix = bytearray([0xCC])
+        return self._suffix
+
+    @address_suffix.setter
+    def address_suffix(self, suffix: Union[bytes, bytearray]):
+        self._suffix = bytes(suffix)
+        self._addr_cache.clear()
+
+    @property
+    def address_prefix(self) -> bytes:
         """The base case for all pipes' address' bytes before mutating with
         `address_suffix`."""
+        return self._prefix
+
+    @address_prefix.setter
+    def address_prefix(self, prefix: Union[bytes, bytearray]):
+        self._prefix = bytes(prefix)
+        self._addr_cache.clear()
 
     def _begin(self, n_addr: int):
+        self._addr_cache.clear()
+        self._route_cache.clear()
         # prep radio
         self._rf24.listen = False
-        self._rf24.auto_ack = 0x3E
-        self._rf24.set_auto_retries(250 * (((n_addr % 6) + 1) * 2 + 3) + 250, 5)
-        for i in range(6):
-            self._rf24.open_rx_pipe(i, self._pipe_address(n_addr, i))
+        with self._rf24.batch():
+            self._rf24.auto_ack = 0x3E
+            self._rf24.set_auto_retries(250 * (((n_addr % 6) + 1) * 2 + 3) + 250, 5)
+            for i in range(6):
+                self._rf24.open_rx_pipe(i, self._pipe_address(n_addr, i))
         self._rf24.listen = True
 
         # setup address-related instance attributes
@@ -307,6 +341,7 @@ class NetworkMixin(RadioMixin):
     def multicast_level(self, lvl: int):
         lvl = min(4, max(lvl, 0))
         self._net_lvl = lvl
+        self._addr_cache.clear()
         self._rf24.listen = False
         self._rf24.open_rx_pipe(0, self._pipe_address(_lvl_2_addr(lvl), 0))
         self._rf24.listen = True
@@ -316,8 +351,18 @@ class NetworkMixin(RadioMixin):
         """Get address for the parent node (read-only)."""
         return self._parent
 
-    def _pipe_address(self, node_addr: int, pipe_number: int) -> bytearray:
+    def _pipe_address(self, node_addr: int, pipe_number: int) -> bytes:
         """translate node address for use on any pipe number"""
+        key = (node_addr << 4) | (pipe_number << 1) | bool(self.allow_multicast)
+        result = self._addr_cache.get(key)
+        if result is None:
+            if len(self._addr_cache) >= _CACHE_SIZE:
+                self._addr_cache.clear()
+            result = bytes(self._make_pipe_address(node_addr, pipe_number))
+            self._addr_cache[key] = result
+        return result
+
+    def _make_pipe_address(self, node_addr: int, pipe_number: int) -> bytearray:
         result, count, dec = (bytearray(self.address_prefix[:] * 5), 1, node_addr)
         while dec:
             if not self.allow_multicast or (
@@ -340,11 +385,11 @@ class NetworkMixin(RadioMixin):
         """keep the network layer current; returns the received message type"""
         ret_val = 0  # sentinel indicating there is nothing to report
         while True:
-            temp_buf = self._rf24.read()
-            if temp_buf is None:
+            temp_len = self._rf24.read_into(self._rx_buf)
+            if not temp_len:
                 return ret_val
             if (
-                not self.frame_buf.unpack(temp_buf)
+                not self.frame_buf.unpack(self._rx_view[:temp_len])
                 or not is_address_valid(self.frame_buf.header.to_node)
                 or not is_address_valid(self.frame_buf.header.from_node)
             ):
@@ -453,6 +498,10 @@ class NetworkMixin(RadioMixin):
         """Get (from `queue`) the next available frame."""
         return self.queue.dequeue()
 
+    def read_into(self, frame: RF24NetworkFrame) -> bool:
+        """Copy (from `queue`) the next available frame into a ``frame``."""
+        return self.queue.dequeue_into(frame)
+
     def multicast(
         self,
         message: Union[bytes, bytearray],
@@ -538,40 +587,40 @@ class NetworkMixin(RadioMixin):
 
     def _write_to_pipe(self, to_node: int, to_pipe: int, is_multicast: bool) -> bool:
         """send prepared frame to a particular node's pipe"""
-        result = False  # type: Union[bool, bytearray, List[Union[bool, bytearray]]]
+        result = False  # type: Union[None, bool, bytearray, List[Any]]
         if to_node == self._addr:
             return self.queue.enqueue(self.frame_buf)
         self._rf24.auto_ack = 0x3E + (not is_multicast)
         self.listen = False
         # print("Sending", self.frame_buf.header.to_string(), "to pipe", to_pipe)
         self._rf24.open_tx_pipe(self._pipe_address(to_node, to_pipe))
-        if len(self.frame_buf.message) <= MAX_FRAG_SIZE:
-            result = self._rf24.send(self.frame_buf.pack(), send_only=True)
+        message = self.frame_buf.message
+        if len(message) <= MAX_FRAG_SIZE:
+            result = self._rf24.send(
+                self._stage(message, 0, len(message)), send_only=True
+            )
             if not result:
                 result = self._tx_standby(self.tx_timeout)
         else:
             # break message into fragments and send the multiple resulting frames
-            total = bool(len(self.frame_buf.message) % MAX_FRAG_SIZE) + int(
-                len(self.frame_buf.message) / MAX_FRAG_SIZE
+            total = bool(len(message) % MAX_FRAG_SIZE) + int(
+                len(message) / MAX_FRAG_SIZE
             )
             msg_t = self.frame_buf.header.message_type
             for count in range(total):
-                buf_start = count * MAX_FRAG_SIZE
-                buf_end = count * MAX_FRAG_SIZE + MAX_FRAG_SIZE
+                length = MAX_FRAG_SIZE
                 self.frame_buf.header.reserved = total - count
                 if count == total - 1:
                     self.frame_buf.header.message_type = MSG_FRAG_LAST
                     self.frame_buf.header.reserved = msg_t
-                    buf_end = len(self.frame_buf.message)
+                    length = len(message) - count * MAX_FRAG_SIZE
                 elif not count:
                     self.frame_buf.header.message_type = MSG_FRAG_FIRST
                 else:
                     self.frame_buf.header.message_type = MSG_FRAG_MORE
 
                 result = self._rf24.send(
-                    self.frame_buf.header.pack()
-                    + self.frame_buf.message[buf_start:buf_end],
-                    send_only=True,
+                    self._stage(message, count * MAX_FRAG_SIZE, length), send_only=True
                 )
                 retries = 3
                 while not result and retries:
@@ -585,7 +634,25 @@ class NetworkMixin(RadioMixin):
                 if not result:
                     break
             self.frame_buf.header.message_type = msg_t
-        return result  # type: ignore
+        return bool(result)
+
+    def _stage(
+        self, message: Union[bytes, bytearray, memoryview], offset: int, length: int
+    ) -> Union[bytearray, memoryview]:
+        """Copy ``frame_buf.header`` & ``length`` bytes of a ``message`` (starting at
+        an ``offset``) into the TX staging buffer; returns the staged frame.
+
+        A fragment is copied by index, so only a frame shorter than the buffer
+        (at most 1 per message) allocates a view of the buffer."""
+        end = 8 + length
+        self.frame_buf.header.pack_into(self._tx_buf)
+        if length == len(message):
+            self._tx_buf[8:end] = message
+        else:  # slicing the message would allocate a view per fragment
+            for i in range(length):
+                self._tx_buf[8 + i] = message[offset + i]
+        # a full frame (like every fragment but the last) is the whole buffer
+        return self._tx_buf if end == len(self._tx_buf) else self._tx_view[:end]
 
     def _tx_standby(self, delta_time: int) -> bool:
         result = False
@@ -598,13 +665,21 @@ class NetworkMixin(RadioMixin):
         self, to_node: int, send_type: int, is_multicast: bool = False
     ) -> Tuple[int, int, bool]:
         """translate msg route into node address, pipe number, & multicast flag."""
-        conv_to_node, conv_to_pipe = (self._parent, self._parent_pipe)
         if send_type > TX_ROUTED:
-            is_multicast, conv_to_pipe, conv_to_node = (True, 0, to_node)
-        elif to_node & self._mask == self._addr:  # to_node is a descendant
-            conv_to_pipe = 5
-            if not to_node & (self._mask_inv << 3):
-                conv_to_node = to_node  # to_node is a direct child
-            else:  # to_node is a descendant of a descendant
-                conv_to_node = to_node & ((self._mask << 3) | 7)
-        return (conv_to_node, conv_to_pipe, is_multicast)
+            return (to_node, 0, True)
+        route = self._route_cache.get(to_node)
+        if route is None:
+            conv_to_node, conv_to_pipe = (self._parent, self._parent_pipe)
+            if to_node & self._mask == self._addr:  # to_node is a descendant
+                conv_to_pipe = 5
+                if not to_node & (self._mask_inv << 3):
+                    conv_to_node = to_node  # to_node is a direct child
+                else:  # to_node is a descendant of a descendant
+                    conv_to_node = to_node & ((self._mask << 3) | 7)
+            if len(self._route_cache) >= _CACHE_SIZE:
+                self._route_cache.clear()
+            route = (conv_to_node, conv_to_pipe, False)
+            self._route_cache[to_node] = route
+        if is_multicast:
+            return (route[0], route[1], True)
+        return route
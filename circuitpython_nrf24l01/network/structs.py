@@ -22,14 +22,16 @@
 """These classes are used to structure/store the payload data for wireless network
 transactions."""
 import struct
+import time
 
 try:
-    from typing import Union, Optional, List
+    from typing import Union, Optional, List, Dict, Tuple
 except ImportError:
     pass
 from .constants import (
     NETWORK_EXT_DATA,
     NETWORK_MULTICAST_ADDR,
+    MAX_FRAG_SIZE,
     MSG_FRAG_FIRST,
     MSG_FRAG_MORE,
     MSG_FRAG_LAST,
@@ -51,47 +53,95 @@ def is_address_valid(address: Optional[int]) -> bool:
     return True
 
 
+class _Struct:
+    """A fallback for `struct.Struct` (not available on CircuitPython)."""
+
+    def __init__(self, fmt: str):
+        self.format = fmt
+        self.size = struct.calcsize(fmt)
+
+    def pack(self, *values) -> bytes:
+        """Pack the ``values`` into a new `bytes` object."""
+        return struct.pack(self.format, *values)
+
+    def pack_into(self, buffer, offset: int, *values):
+        """Pack the ``values`` into ``buffer`` starting at ``offset``."""
+        struct.pack_into(self.format, buffer, offset, *values)
+
+    def unpack_from(self, buffer, offset: int = 0) -> tuple:
+        """Unpack the values from ``buffer`` starting at ``offset``."""
+        return struct.unpack_from(self.format, buffer, offset)
+
+
+try:
+    _HEADER = struct.Struct("HHHBB")  # type: Union[struct.Struct, _Struct]
+except AttributeError:
+    _HEADER = _Struct("HHHBB")
+
+
 class RF24NetworkHeader:
     """The header information used for routing network messages."""
 
+    __slots__ = ("from_node", "to_node", "_msg_t", "frame_id", "reserved")
     __next_id = 0
 
     def __init__(self, to_node: int = None, message_type: Union[str, int] = None):
         self.from_node: int = 0o7777  #: |uint16_t|
         self.to_node: int = 0 if to_node is None else (to_node & 0xFFF)  #: |uint16_t|
-        if isinstance(message_type, str):
-            # convert the first char to int if `message_type` is a string
-            self.message_type = ord(message_type[0])  #: The type of message.
-        else:
-            self.message_type = 0 if message_type is None else message_type & 0xFF
+        self.message_type = 0 if message_type is None else message_type
         self.frame_id = RF24NetworkHeader.__next_id  #: |uint16_t|
         RF24NetworkHeader.__next_id = (RF24NetworkHeader.__next_id + 1) & 0xFFFF
         self.reserved = 0  #: A single byte reserved for network usage.
 
+    @property
+    def message_type(self) -> int:
+        """The type of message."""
+        return self._msg_t
+
+    @message_type.setter
+    def message_type(self, msg_t: Union[str, int]):
+        if isinstance(msg_t, str):
+            # convert the first char to int if `message_type` is a string
+            msg_t = ord(msg_t[0]) if msg_t else 0
+        self._msg_t = msg_t & 0xFF
+
     def unpack(self, buffer) -> bool:
         """Decode header data from the first 8 bytes of a frame's buffer."""
-        if len(buffer) < 8:
+        return self.unpack_from(buffer)
+
+    def unpack_from(self, buffer, offset: int = 0) -> bool:
+        """Decode header data from 8 bytes of a ``buffer`` (without slicing it)."""
+        if len(buffer) - offset < 8:
             return False
         (
             self.from_node,
             self.to_node,
             self.frame_id,
-            self.message_type,
+            self._msg_t,
             self.reserved,
-        ) = struct.unpack("HHHBB", buffer[:8])
+        ) = _HEADER.unpack_from(buffer, offset)
         return True
 
     def pack(self) -> bytes:
         """This function |internal_use|"""
-        msg_t = self.message_type
-        if isinstance(self.message_type, str) and self.message_type:
-            msg_t = ord(self.message_type[0])
-        return struct.pack(
-            "HHHBB",
+        return _HEADER.pack(
+            self.from_node & 0xFFF,
+            self.to_node & 0xFFF,
+            self.frame_id & 0xFFFF,
+            self._msg_t,
+            self.reserved & 0xFF,
+        )
+
+    def pack_into(self, buffer: Union[bytearray, memoryview], offset: int = 0):
+        """Encode the header data into 8 bytes of a ``buffer`` (without allocating
+        a new buffer)."""
+        _HEADER.pack_into(
+            buffer,
+            offset,
             self.from_node & 0xFFF,
             self.to_node & 0xFFF,
             self.frame_id & 0xFFFF,
-            msg_t & 0xFF,
+            self._msg_t,
             self.reserved & 0xFF,
         )
 
@@ -100,13 +150,10 @@ class RF24NetworkHeader:
 
     def to_string(self) -> str:
         """:Returns: A `str` describing all of the header's attributes."""
-        msg_t = self.message_type
-        if isinstance(self.message_type, str) and self.message_type:
-            msg_t = ord(self.message_type[0])
         return "from {} to {} type {} id {} reserved {}".format(
             oct(self.from_node),
             oct(self.to_node),
-            msg_t & 0xFF,
+            self._msg_t,
             self.frame_id,
             self.reserved,
         )
@@ -119,6 +166,8 @@ class RF24NetworkHeader:
 class RF24NetworkFrame:
     """Structure of a single frame."""
 
+    __slots__ = ("header", "message")
+
     def __init__(
         self, header: RF24NetworkHeader = None, message: Union[bytes, bytearray] = None
     ):
@@ -131,18 +180,37 @@ class RF24NetworkFrame:
             RF24NetworkHeader() if header is None else header
         )
         #: The entire message or a fragment of a message allocated to the frame.
-        self.message: Union[bytes, bytearray] = bytes(0) if message is None else message
+        self.message: Union[bytes, bytearray, memoryview] = (
+            bytes(0) if message is None else message
+        )
 
-    def unpack(self, buffer: Union[bytes, bytearray]) -> bool:
+    def unpack(self, buffer: Union[bytes, bytearray, memoryview]) -> bool:
         """Decode the `header` & `message` from a ``buffer``."""
-        if self.header.unpack(buffer):
-            self.message = buffer[8:]
+        return self.unpack_from(buffer)
+
+    def unpack_from(
+        self, buffer: Union[bytes, bytearray, memoryview], offset: int = 0
+    ) -> bool:
+        """Decode the `header` & `message` from a ``buffer`` starting at an
+        ``offset``."""
+        if self.header.unpack_from(buffer, offset):
+            self.message = buffer[offset + 8 :]
             return True
         return False
 
     def pack(self) -> bytes:
         """This attribute |internal_use|"""
-        return self.header.pack() + bytes(self.message)
+        buf = bytearray(8 + len(self.message))
+        self.pack_into(buf)
+        return bytes(buf)
+
+    def pack_into(self, buffer: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """Encode the `header` & `message` into a ``buffer`` starting at an
+        ``offset``; returns the number of bytes written."""
+        end = offset + 8 + len(self.message)
+        self.header.pack_into(buffer, offset)
+        buffer[offset + 8 : end] = self.message
+        return end - offset
 
     def __len__(self) -> int:
         return 8 + len(self.message)
@@ -153,80 +221,232 @@ class RF24NetworkFrame:
 
 
 class FrameQueue:
-    """A class that wraps a `list` with RF24Network Queue behavior."""
+    """A fixed-capacity ring buffer of frames with RF24Network Queue behavior."""
 
     def __init__(self, queue: Union["FrameQueue", "FrameQueueFrag"] = None):
-        #: The maximum number of frames that can be enqueued at once. Defaults to 6.
-        self.max_queue_size: int = 6
-        self._queue: List[RF24NetworkFrame] = []
+        self._slots: List[RF24NetworkFrame] = []
+        self._keys: List[Optional[tuple]] = []  # duplicate index key of each slot
+        self._index: set = set()  # keys of the enqueued frames
+        self._head = 0  # slot of the oldest frame
+        self._count = 0
+        self.max_queue_size = 6 if queue is None else queue.max_queue_size
         if queue is not None:
             while queue:
-                self._queue.append(queue.dequeue())  # type: ignore[arg-type]
-            self.max_queue_size = queue.max_queue_size
+                self._put(queue.dequeue())  # type: ignore[arg-type]
         super().__init__()
 
+    @property
+    def max_queue_size(self) -> int:
+        """The maximum number of frames that can be enqueued at once. Defaults to 6."""
+        return len(self._slots)
+
+    @max_queue_size.setter
+    def max_queue_size(self, size: int):
+        if size < self._count:
+            raise ValueError("max_queue_size cannot be less than the enqueued frames")
+        capacity = len(self._slots)
+        order = [(self._head + i) % capacity for i in range(self._count)]
+        slots = [self._slots[i] for i in order]
+        keys = [self._keys[i] for i in order]
+        self._slots = slots + [RF24NetworkFrame() for _ in range(size - self._count)]
+        self._keys = keys + [None] * (size - self._count)
+        self._head = 0
+
+    @staticmethod
+    def _key(header: RF24NetworkHeader) -> tuple:
+        return (header.from_node & 0xFFF, header.frame_id & 0xFFFF, header.message_type)
+
+    def _put(self, frame: RF24NetworkFrame):
+        """Move a ``frame`` into the next slot (without copying it)."""
+        index = (self._head + self._count) % len(self._slots)
+        self._slots[index] = frame
+        self._keys[index] = key = self._key(frame.header)
+        self._index.add(key)
+        self._count += 1
+
     def enqueue(self, frame: RF24NetworkFrame) -> bool:
         """Add a `RF24NetworkFrame` to the queue."""
-        if self.max_queue_size == len(self._queue):
+        if self._count >= len(self._slots):
             return False
-        for frm in self._queue:
-            if (
-                frm.header.from_node == frame.header.from_node
-                and frm.header.frame_id == frame.header.frame_id
-                and frm.header.message_type == frame.header.message_type
-            ):
-                return False  # already enqueued this frame
-        new_frame = RF24NetworkFrame()
-        new_frame.unpack(frame.pack())
-        self._queue.append(new_frame)
+        key = self._key(frame.header)
+        if key in self._index:
+            return False  # already enqueued this frame
+        index = (self._head + self._count) % len(self._slots)
+        slot = self._slots[index]
+        header, src = (slot.header, frame.header)
+        header.from_node, header.frame_id, header.message_type = key
+        header.to_node = src.to_node & 0xFFF
+        header.reserved = src.reserved & 0xFF
+        slot.message = bytes(frame.message)
+        self._keys[index] = key
+        self._index.add(key)
+        self._count += 1
         return True
 
+    def _copy_head(self, frame: RF24NetworkFrame) -> RF24NetworkFrame:
+        """Copy the First Out element into a ``frame`` that the caller owns."""
+        slot = self._slots[self._head]
+        header, src = (frame.header, slot.header)
+        header.from_node, header.to_node = (src.from_node, src.to_node)
+        header.frame_id, header.reserved = (src.frame_id, src.reserved)
+        header.message_type = src.message_type
+        frame.message = slot.message  # a `bytes` object (never modified in place)
+        return frame
+
+    def _pop(self):
+        """Remove the First Out element (its slot is reused by `enqueue()`)."""
+        head = self._head
+        self._index.discard(self._keys[head])
+        self._keys[head] = None
+        self._head = (head + 1) % len(self._slots)
+        self._count -= 1
+
     def peek(self) -> Optional[RF24NetworkFrame]:
         """:Returns: The First Out element without removing it from the queue."""
-        return None if not self._queue else self._queue[0]
+        return None if not self._count else self._copy_head(RF24NetworkFrame())
 
     def dequeue(self) -> Optional[RF24NetworkFrame]:
         """:Returns: The First Out element and removes it from the queue."""
-        return None if not self._queue else self._queue.pop(0)
+        if not self._count:
+            return None
+        frame = self._copy_head(RF24NetworkFrame())
+        self._pop()
+        return frame
+
+    def dequeue_into(self, frame: RF24NetworkFrame) -> bool:
+        """Copy the First Out element into a ``frame`` and remove it from the queue."""
+        if not self._count:
+            return False
+        self._copy_head(frame)
+        self._pop()
+        return True
 
     def __len__(self) -> int:
         """:Returns: The number of the enqueued frames."""
-        return len(self._queue)
+        return self._count
+
+
+class _Reassembly:
+    """The partially reassembled message from 1 sender."""
+
+    def __init__(self, size: int, count: int, now: int):
+        self.buf = bytearray(size)  # sized for the number of fragments
+        self.length = 0  # number of bytes received so far
+        self.count = count  # the count (``reserved``) of the last fragment received
+        self.updated = now  # when the last fragment was received
 
 
 class FrameQueueFrag(FrameQueue):
-    """A specialized `FrameQueue` with an additional cache for fragmented frames."""
+    """A specialized `FrameQueue` with a reassembly table for fragmented frames."""
 
     def __init__(self, queue: Union["FrameQueue", "FrameQueueFrag"] = None):
         super().__init__(queue)
-        self._frags = RF24NetworkFrame()  # initialize cache
+        #: The time (in milliseconds) to wait for the next fragment of a message.
+        self.frag_timeout: int = 1000
+        #: The maximum number of bytes used by all partially reassembled messages.
+        self.max_frag_memory: int = 1024
+        #: The number of partial messages discarded because of the `frag_timeout`.
+        self.frags_expired: int = 0
+        #: The number of partial messages discarded because of the `max_frag_memory`.
+        self.frags_evicted: int = 0
+        #: The number of fragments discarded (missing first or out of sequence).
+        self.frags_dropped: int = 0
+        if isinstance(queue, FrameQueueFrag):
+            self.frag_timeout = queue.frag_timeout
+            self.max_frag_memory = queue.max_frag_memory
+        # partial messages keyed on the sender's (from_node, frame_id)
+        self._frags: Dict[Tuple[int, int], _Reassembly] = {}
+        self._frag_memory = 0
+
+    def _discard(self, key: Tuple[int, int]):
+        self._frag_memory -= len(self._frags.pop(key).buf)
+
+    def _expire(self, now: int):
+        timeout = self.frag_timeout * 1000000
+        for key in [k for k, v in self._frags.items() if now - v.updated > timeout]:
+            self._discard(key)
+            self.frags_expired += 1
+
+    def _begin(
+        self, key: Tuple[int, int], count: int, now: int
+    ) -> Optional[_Reassembly]:
+        if key in self._frags:  # the sender restarted the message
+            self._discard(key)
+        size = max(count, 2) * MAX_FRAG_SIZE
+        if size > self.max_frag_memory:
+            return None
+        while self._frag_memory + size > self.max_frag_memory:
+            oldest = min(self._frags, key=lambda k: self._frags[k].updated)
+            self._discard(oldest)
+            self.frags_evicted += 1
+        entry = self._frags[key] = _Reassembly(size, count, now)
+        self._frag_memory += size
+        return entry
+
+    def _continue(
+        self, key: Tuple[int, int], header: RF24NetworkHeader
+    ) -> Optional[_Reassembly]:
+        """Get the partial message that a fragment (not the first) belongs to;
+        returns `None` if the fragment is out of sequence."""
+        entry = self._frags.get(key)
+        if entry is None:
+            # print("dropping fragment due to missing 1st fragment")
+            return None
+        if header.message_type == MSG_FRAG_LAST:
+            # the fragments' count goes down to 2; the last fragment has no count
+            if entry.count != 2:
+                # print("dropping message with missing fragments")
+                self._discard(key)
+                return None
+        elif entry.count - 1 != header.reserved:
+            # print("dropping non sequential fragment")
+            return None
+        return entry
+
+    def _append(
+        self, key: Tuple[int, int], entry: _Reassembly, frame: RF24NetworkFrame
+    ) -> bool:
+        """Copy a fragment's message into its partial message."""
+        end = entry.length + len(frame.message)
+        if end > len(entry.buf):  # more fragments than the first fragment's count
+            self._discard(key)
+            return False
+        entry.buf[entry.length : end] = frame.message
+        entry.length = end
+        return True
+
+    def _finish(
+        self, key: Tuple[int, int], entry: _Reassembly, frame: RF24NetworkFrame
+    ) -> bool:
+        """Enqueue a reassembled message using its last fragment's header."""
+        self._discard(key)
+        header = frame.header
+        message, header.message_type = (frame.message, header.reserved)
+        frame.message = memoryview(entry.buf)[: entry.length]  # type: ignore[assignment]
+        result = super().enqueue(frame)
+        frame.message = message
+        if header.reserved != NETWORK_EXT_DATA:
+            header.message_type = MSG_FRAG_LAST
+        # else External data needs to be propagated back to update() (by reference)
+        return result
 
     def enqueue(self, frame: RF24NetworkFrame) -> bool:
         """Add a `RF24NetworkFrame` to the queue."""
-        if frame.header.message_type in (MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_LAST):
-            if frame.header.message_type == MSG_FRAG_FIRST:
-                self._frags.unpack(frame.pack())  # make copy not reference
-                return True
-            if (
-                self._frags.header.from_node is not None  # if not just initialized
-                and frame.header.to_node == self._frags.header.to_node
-                and frame.header.frame_id == self._frags.header.frame_id
-            ):
-                if (
-                    self._frags.header.reserved - 1 != frame.header.reserved
-                    and frame.header.message_type != MSG_FRAG_LAST
-                ):
-                    # print("dropping non sequential fragment")
-                    return False
-                self._frags.header.unpack(frame.header.pack())
-                self._frags.message += frame.message[:]
-                if frame.header.message_type == MSG_FRAG_LAST:
-                    if frame.header.reserved == NETWORK_EXT_DATA:
-                        # External data needs to be propagated back to update()
-                        frame.header.message_type = NETWORK_EXT_DATA  # by reference
-                    self._frags.header.message_type = frame.header.reserved
-                    return super().enqueue(self._frags)
-                return True
-            # print("dropping fragment due to missing 1st fragment")
+        header = frame.header
+        msg_t = header.message_type
+        if msg_t not in (MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_LAST):
+            return super().enqueue(frame)
+        now = time.monotonic_ns()
+        self._expire(now)
+        key = (header.from_node & 0xFFF, header.frame_id & 0xFFFF)
+        if msg_t == MSG_FRAG_FIRST:
+            entry = self._begin(key, header.reserved, now)
+        else:
+            entry = self._continue(key, header)
+        if entry is None or not self._append(key, entry, frame):
+            self.frags_dropped += 1
             return False
-        return super().enqueue(frame)
+        if msg_t == MSG_FRAG_LAST:
+            return self._finish(key, entry, frame)
+        entry.count, entry.updated = (header.reserved, now)
+        return True
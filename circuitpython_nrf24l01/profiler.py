@@ -0,0 +1,209 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""profiler module containing the SPI transaction profiler class SpiProfiler"""
+import time
+
+try:
+    from typing import Dict, List, Optional
+except ImportError:
+    pass
+
+UNATTRIBUTED = "(unattributed)"
+"""The label of transactions that did not happen during a profiled method call."""
+
+
+class SpiCost:
+    """The SPI bus usage attributed to 1 API (see `SpiProfiler.report`)."""
+
+    def __init__(self):
+        #: The number of times the API was called.
+        self.calls: int = 0
+        #: The number of SPI transactions.
+        self.transactions: int = 0
+        #: The number of bytes transferred (in each direction) over the SPI bus.
+        self.bytes: int = 0
+        #: The total time (in nanoseconds) spent in SPI transactions.
+        self.elapsed_ns: int = 0
+        #: A `dict` of how many times each command byte was sent.
+        self.commands: Dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        return "<SpiCost calls={} transactions={} bytes={} elapsed_ns={}>".format(
+            self.calls, self.transactions, self.bytes, self.elapsed_ns
+        )
+
+
+class _ProfiledBus:
+    """A stand-in for an `RF24` object's SPI device that records every transaction."""
+
+    def __init__(self, profiler: "SpiProfiler", spi):
+        self._profiler = profiler
+        self._device = spi
+        self._bus = None
+
+    def __enter__(self):
+        self._bus = self._device.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._device.__exit__(*exc)
+
+    def __getattr__(self, name: str):
+        return getattr(self._device, name)
+
+    def write_readinto(self, out_buf, in_buf, **kwargs):
+        """Time & record a transaction of the wrapped SPI bus."""
+        start = time.monotonic_ns()
+        self._bus.write_readinto(out_buf, in_buf, **kwargs)  # type: ignore[union-attr]
+        elapsed = time.monotonic_ns() - start
+        length = kwargs.get("out_end")
+        self._profiler._record(  # pylint: disable=protected-access
+            out_buf[0], len(out_buf) if length is None else length, elapsed
+        )
+
+
+class SpiProfiler:
+    """Count and time the SPI transactions made by an `RF24` object (or a network
+    node), and attribute them to the public method that made them."""
+
+    def __init__(self, node):
+        self._node = node
+        self._radio = getattr(node, "_rf24", node)
+        self._label: Optional[str] = None
+        self._wrapped: List[tuple] = []
+        self.report: Dict[str, SpiCost] = {}
+        """A `dict` of `SpiCost` objects keyed by the name of the profiled method
+        (e.g. ``"RF24.send"``)."""
+
+    @property
+    def enabled(self) -> bool:
+        """Is this profiler currently recording?"""
+        return bool(self._wrapped)
+
+    def start(self):
+        """Start recording SPI transactions."""
+        if self._wrapped:
+            return
+        radio = self._radio
+        radio._spi = _ProfiledBus(self, radio._spi)  # pylint: disable=protected-access
+        self._wrapped.append((radio, "_spi"))
+        objs = [self._node] if self._node is radio else [self._node, radio]
+        for obj in objs:
+            cls = type(obj)
+            props = {}  # properties are class attributes; wrap them in a subclass
+            for name in dir(cls):
+                attr = getattr(cls, name, None)
+                if name[:1] == "_" or name in obj.__dict__:
+                    continue  # don't shadow an instance attribute
+                label = "{}.{}".format(cls.__name__, name)
+                if isinstance(attr, property):
+                    props[name] = property(
+                        None if attr.fget is None else self._wrap(attr.fget, label),
+                        None if attr.fset is None else self._wrap(attr.fset, label),
+                    )
+                elif callable(attr):
+                    setattr(obj, name, self._wrap(getattr(obj, name), label))
+                    self._wrapped.append((obj, name))
+            if props:
+                obj.__class__ = type(cls.__name__, (cls,), props)
+                self._wrapped.append((obj, cls))
+
+    def stop(self):
+        """Stop recording SPI transactions and restore the profiled objects."""
+        for obj, name in self._wrapped:
+            if name == "_spi":
+                # pylint: disable=protected-access
+                obj._spi = obj._spi._device
+            elif isinstance(name, type):
+                obj.__class__ = name
+            else:
+                delattr(obj, name)
+        self._wrapped.clear()
+
+    def reset(self):
+        """Discard everything recorded so far."""
+        self.report = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _wrap(self, method, label: str):
+        def profiled(*args, **kwargs):
+            if self._label is not None:  # attribute to the outermost call only
+                return method(*args, **kwargs)
+            self._label = label
+            self._cost(label).calls += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._label = None
+
+        return profiled
+
+    def _cost(self, label: str) -> SpiCost:
+        if label not in self.report:
+            self.report[label] = SpiCost()
+        return self.report[label]
+
+    def _record(self, command: int, length: int, elapsed: int):
+        cost = self._cost(UNATTRIBUTED if self._label is None else self._label)
+        cost.transactions += 1
+        cost.bytes += length
+        cost.elapsed_ns += elapsed
+        cost.commands[command] = cost.commands.get(command, 0) + 1
+
+    def total(self) -> SpiCost:
+        """Get the sum of all recorded costs."""
+        result = SpiCost()
+        for cost in self.report.values():
+            result.calls += cost.calls
+            result.transactions += cost.transactions
+            result.bytes += cost.bytes
+            result.elapsed_ns += cost.elapsed_ns
+            for cmd, count in cost.commands.items():
+                result.commands[cmd] = result.commands.get(cmd, 0) + count
+        return result
+
+    def print_report(self):
+        """Print the recorded costs of each profiled method."""
+        for label, cost in sorted(self.report.items()):
+            print(
+                "{}: {} calls, {} transactions, {} bytes, {} us".format(
+                    label,
+                    cost.calls,
+                    cost.transactions,
+                    cost.bytes,
+                    cost.elapsed_ns // 1000,
+                )
+            )
+            print(
+                "    commands:",
+                ", ".join(
+                    "{:02X}x{}".format(cmd, count)
+                    for cmd, count in sorted(cost.commands.items())
+                ),
+            )
@@ -0,0 +1,210 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""radio_group module containing the multi-radio manager class RadioGroup"""
+import time
+
+try:
+    from typing import Union, Sequence, Optional, List, Tuple
+except ImportError:
+    pass
+from .rf24 import RF24
+from .airtime import _tx_timing
+
+
+# RadioGroup polls its radios in 1 loop, so it uses their shadow registers instead
+# of getters (like RF24.listen) that read the radio with the default shadow policy
+# pylint: disable=protected-access
+def _listening(radio: RF24) -> bool:
+    """Is a radio in RX mode?"""
+    return bool(radio._config & 1)
+
+
+def _tx_durations(radio: RF24) -> Tuple[int, int]:
+    """Get the expected duration (in nanoseconds) of a radio's 1st transmission
+    attempt and of all its automatic attempts."""
+    attempt, retry = _tx_timing(radio)
+    return attempt, attempt + retry * (radio._retry_setup & 0x0F)
+
+
+# pylint: enable=protected-access
+
+
+class TxRequest:
+    """A payload queued for transmission by a `RadioGroup`."""
+
+    def __init__(
+        self, buf: Union[bytes, bytearray], ask_no_ack: bool, radio: Optional[int]
+    ):
+        #: The payload to transmit.
+        self.buf = buf
+        #: Does the payload ask for no ACK packet?
+        self.ask_no_ack = ask_no_ack
+        #: The index of the radio that must transmit the payload (`None` means any).
+        self.radio = radio
+        #: The result (like the result of `RF24.send()`); `None` until `done`.
+        self.result: Union[None, bool, bytearray] = None
+
+    @property
+    def done(self) -> bool:
+        """Has the transmission finished?"""
+        return self.result is not None
+
+
+class RadioGroup:
+    """Drive several `RF24` objects (that share 1 SPI bus) from 1 loop."""
+
+    def __init__(self, radios: Sequence[RF24]):
+        #: The managed `RF24` objects.
+        self.radios = list(radios)
+        #: The `TxRequest` objects that wait for an idle radio.
+        self.tx_queue: List[TxRequest] = []
+        #: The received payloads as ``(radio index, pipe, payload)`` tuples.
+        self.rx_queue: List[Tuple[int, int, bytearray]] = []
+        self._active: List[Optional[TxRequest]] = [None] * len(self.radios)
+        self._due = [0] * len(self.radios)  # when to poll an active transmission
+        self._deadline = [0] * len(self.radios)  # when to abort it
+
+    def __len__(self) -> int:
+        return len(self.radios)
+
+    @property
+    def pending(self) -> int:
+        """The number of queued and ongoing transmissions."""
+        return len(self.tx_queue) + len(self._active) - self._active.count(None)
+
+    def queue(
+        self,
+        buf: Union[bytes, bytearray],
+        radio: Optional[int] = None,
+        ask_no_ack: bool = False,
+    ) -> TxRequest:
+        """Queue a payload for transmission by a specific (or any idle) radio."""
+        if radio is not None and not 0 <= radio < len(self.radios):
+            raise IndexError("radio index {} is out of range".format(radio))
+        radios = self.radios if radio is None else [self.radios[radio]]
+        if all(_listening(r) for r in radios):
+            raise ValueError("no radio in TX mode can transmit the payload")
+        request = TxRequest(buf, ask_no_ack, radio)
+        self.tx_queue.append(request)
+        return request
+
+    def update(self) -> int:
+        """Poll every radio once; returns the number of finished transmissions
+        and received payloads."""
+        count, now = (0, time.monotonic_ns())
+        for index, radio in enumerate(self.radios):
+            request = self._active[index]
+            if request is not None and now >= self._due[index]:
+                radio.update()
+                if radio.irq_ds or radio.irq_df or now >= self._deadline[index]:
+                    self._finish(index, radio, request)
+                    count += 1
+            if _listening(radio):
+                count += self._drain(index, radio)
+            elif self._active[index] is None:
+                self._start(index, radio, now)
+        return count
+
+    def _finish(self, index: int, radio: RF24, request: TxRequest):
+        radio.ce_pin = False
+        if radio.irq_ds:
+            request.result = True
+            if radio.irq_dr and not request.ask_no_ack:
+                request.result = radio.read()
+        else:  # failed or timed out
+            request.result = False
+            radio.flush_tx()
+        self._active[index] = None
+
+    def _drain(self, index: int, radio: RF24) -> int:
+        burst = radio.drain()
+        for i in range(burst.count):
+            pipe, payload = burst[i]
+            self.rx_queue.append((index, pipe, bytearray(payload)))
+        return burst.count
+
+    def _start(self, index: int, radio: RF24, now: int):
+        for request in self.tx_queue:
+            if request.radio is None or request.radio == index:
+                break
+        else:
+            return
+        if radio.irq_df or radio.tx_full:
+            radio.flush_tx()
+        if not radio.write(request.buf, request.ask_no_ack):
+            return
+        self.tx_queue.remove(request)
+        self._active[index] = request
+        attempt, total = _tx_durations(radio)
+        # the radio has twice the longest expected time to assert an IRQ flag
+        self._deadline[index] = now + 2 * total
+        self._due[index] = now
+        if radio.airtime_wait:  # don't poll before the 1st attempt could finish
+            self._due[index] += attempt
+
+    def send(
+        self,
+        buf: Union[bytes, bytearray, Sequence[Union[bytes, bytearray]]],
+        radio: Optional[int] = None,
+        ask_no_ack: bool = False,
+    ) -> Union[bool, bytearray, List[Union[bool, bytearray]]]:
+        """Transmit payload(s) using all idle radios at the same time."""
+        if isinstance(buf, (list, tuple)):
+            requests = [self.queue(b, radio, ask_no_ack) for b in buf]
+        else:
+            requests = [self.queue(buf, radio, ask_no_ack)]  # type: ignore[arg-type]
+        while not all(request.done for request in requests):
+            if self.update():
+                continue
+            if self._active.count(None) == len(self._active):
+                # no radio could start a queued payload (it stopped transmitting)
+                for request in requests:
+                    if not request.done:
+                        self.tx_queue.remove(request)
+                        request.result = False
+                break
+            self._idle()
+        if isinstance(buf, (list, tuple)):
+            return [request.result for request in requests]  # type: ignore[misc]
+        return requests[0].result  # type: ignore[return-value]
+
+    def _idle(self):
+        """Sleep until the first ongoing transmission could be finished."""
+        if any(_listening(radio) for radio in self.radios):
+            return  # listening radios need to be drained
+        due = [self._due[i] for i, req in enumerate(self._active) if req is not None]
+        if due:
+            remaining = min(due) - time.monotonic_ns()
+            if remaining > 0:
+                time.sleep(remaining / 1000000000)
+
+    def available(self) -> bool:
+        """Is there a received payload in the `rx_queue`?"""
+        if not self.rx_queue:
+            self.update()
+        return bool(self.rx_queue)
+
+    def read(self) -> Optional[Tuple[int, int, bytearray]]:
+        """Pop the next ``(radio index, pipe, payload)`` from the `rx_queue`."""
+        if self.available():
+            return self.rx_queue.pop(0)
+        return None
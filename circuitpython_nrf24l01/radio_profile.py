@@ -0,0 +1,250 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""radio_profile module containing the precompiled configuration class RadioProfile"""
+
+try:
+    from typing import Any, Union, Sequence, Dict, List, Tuple
+except ImportError:
+    pass
+from micropython import const
+
+_VERSION = const(1)  # the serialized layout's version
+_SIZE = const(36)  # the serialized length (in bytes)
+# offsets into the serialized buffer
+_CRC = const(1)  # CRC bits of the CONFIGURE register
+_AA = const(2)
+_OPEN = const(3)
+_AW = const(4)
+_RETRY = const(5)
+_CH = const(6)
+_RF = const(7)
+_DYN = const(8)
+_FEAT = const(9)
+_PL = const(10)  # 6 static payload lengths
+_P0 = const(16)  # 5 bytes each for pipes 0 & 1, then 1 byte each for pipes 2-5
+_TX = const(30)  # 5 bytes
+_FLAGS = const(35)  # bit 0: pipe 0 is an RX pipe (not just for ACK packets)
+# the single-byte registers (& their offsets) in the order they are written
+_BYTE_REGS = (
+    (3, _AW),
+    (6, _RF),
+    (2, _OPEN),
+    (0x1C, _DYN),
+    (1, _AA),
+    (0x1D, _FEAT),
+    (4, _RETRY),
+    (5, _CH),
+)  # type: Tuple[Tuple[int, int], ...]
+# the reset values of the address registers
+_DEFAULT_ADDRS = (b"\xE7" * 5, b"\xC2" * 5, 0xC3, 0xC4, 0xC5, 0xC6)
+# the settings (& their default values) accepted by RadioProfile; the defaults are
+# the configuration of a newly instantiated RF24 object
+_DEFAULTS = {
+    "channel": 76,
+    "data_rate": 1,
+    "pa_level": 0,
+    "lna": True,
+    "crc": 2,
+    "auto_ack": True,
+    "dynamic_payloads": True,
+    "payload_length": 32,
+    "ard": 1500,
+    "arc": 15,
+    "address_length": 5,
+    "ack": False,
+    "allow_ask_no_ack": True,
+    "tx_address": None,
+    "rx_pipes": None,
+}  # type: Dict[str, Any]
+
+
+def _pipe_bits(value: Union[int, bool, Sequence[bool]], name: str) -> int:
+    """Convert a per-pipe setting (like `RF24.auto_ack`) into a 6-bit mask."""
+    if isinstance(value, bool):
+        return 0x3F if value else 0
+    if isinstance(value, int):
+        return 0x3F & value
+    if isinstance(value, (list, tuple)):
+        mask = 0
+        for i, val in enumerate(value[:6]):
+            mask |= bool(val) << i
+        return mask
+    raise ValueError("{}: {} is not a valid input".format(name, value))
+
+
+def _compile_rf(buf: bytearray, config: Dict[str, Any]):
+    """Validate the RF settings into their registers' offsets of ``buf``."""
+    if not 0 <= int(config["channel"]) <= 125:
+        raise ValueError("channel can only be set in range [0, 125]")
+    if config["data_rate"] not in (1, 2, 250):
+        raise ValueError("data_rate must be 1 (Mbps), 2 (Mbps), or 250 (kbps)")
+    if config["pa_level"] not in (-18, -12, -6, 0):
+        raise ValueError("pa_level must be -18, -12, -6, or 0 (in dBm)")
+    if not 3 <= config["address_length"] <= 5:
+        raise ValueError("address_length can only be set in range [3, 5]")
+    crc = min(2, abs(int(config["crc"])))
+    buf[_CRC] = (crc + 1) << 2 if crc else 0
+    buf[_AW] = config["address_length"] - 2
+    delay = int((max(250, min(config["ard"], 4000)) - 250) / 250)
+    buf[_RETRY] = delay << 4 | max(0, min(int(config["arc"]), 15))
+    buf[_CH] = int(config["channel"])
+    rate = {1: 0, 2: 8, 250: 0x20}[config["data_rate"]]
+    buf[_RF] = rate | (3 - int(config["pa_level"] / -6)) * 2 | bool(config["lna"])
+
+
+def _compile_features(buf: bytearray, config: Dict[str, Any]):
+    """Validate the payload & ACK settings into their registers' offsets of ``buf``."""
+    payload_length = config["payload_length"]
+    if isinstance(payload_length, int):
+        payload_length = [payload_length] * 6
+    elif not isinstance(payload_length, (list, tuple)) or len(payload_length) != 6:
+        raise ValueError(
+            "payload_length {} is not a valid input".format(payload_length)
+        )
+    for i, length in enumerate(payload_length):
+        buf[_PL + i] = max(1, min(32, int(length)))
+    buf[_AA] = _pipe_bits(config["auto_ack"], "auto_ack")
+    buf[_DYN] = _pipe_bits(config["dynamic_payloads"], "dynamic_payloads")
+    ack = bool(config["ack"])
+    if ack:  # custom ACK payloads need auto_ack & dynamic_payloads on pipe 0
+        buf[_AA] |= 1
+        buf[_DYN] |= 1
+    buf[_FEAT] = bool(buf[_DYN]) << 2 | ack << 1 | bool(config["allow_ask_no_ack"])
+
+
+def _compile_addresses(buf: bytearray, config: Dict[str, Any]):
+    """Validate the addresses & open pipes into their registers' offsets of ``buf``
+    (after `_compile_rf()` & `_compile_features()`)."""
+    addr_len, rx_pipes = (buf[_AW] + 2, config["rx_pipes"] or {})
+    pipes = list(_DEFAULT_ADDRS)  # type: List[Any]
+    for pipe, address in rx_pipes.items():
+        if not 0 <= pipe <= 5:
+            raise IndexError("pipe number must be in range [0, 5]")
+        if len(address) < (addr_len if pipe < 2 else 1):
+            raise ValueError("address for pipe {} is too short".format(pipe))
+        pipes[pipe] = address if pipe < 2 else address[0]
+        buf[_OPEN] |= 1 << pipe
+    tx_addr = config["tx_address"]
+    if tx_addr is not None and len(tx_addr) < addr_len:
+        raise ValueError("tx_address is too short")
+    if 0 in rx_pipes:
+        buf[_FLAGS] = 1
+    elif tx_addr is not None and buf[_AA] & 1:
+        pipes[0] = tx_addr  # pipe 0 receives ACK packets (like open_tx_pipe())
+        buf[_OPEN] |= 1
+    buf[_P0 : _P0 + addr_len] = pipes[0][:addr_len]
+    buf[_P0 + 5 : _P0 + 5 + addr_len] = pipes[1][:addr_len]
+    buf[_P0 + 10 : _P0 + 14] = bytes(pipes[2:])
+    tx_addr = b"\xE7" * 5 if tx_addr is None else tx_addr
+    buf[_TX : _TX + addr_len] = tx_addr[:addr_len]
+
+
+class RadioProfile:
+    """A validated radio configuration compiled into a register image."""
+
+    def __init__(self, **settings):
+        unknown = [key for key in settings if key not in _DEFAULTS]
+        if unknown:
+            raise TypeError("unknown RadioProfile setting(s): {}".format(unknown))
+        config = dict(_DEFAULTS)
+        config.update(settings)
+        buf = bytearray(_SIZE)
+        buf[0] = _VERSION
+        _compile_rf(buf, config)
+        _compile_features(buf, config)
+        _compile_addresses(buf, config)
+        self._buf = bytes(buf)
+        self._compile()
+
+    def _compile(self):
+        """Create the register writes (and shadow values) used by
+        :meth:`~circuitpython_nrf24l01.rf24.RF24.apply_profile()`."""
+        buf, addr_len = (self._buf, self._buf[_AW] + 2)
+        self._addresses = (
+            buf[_P0 : _P0 + addr_len],
+            buf[_P0 + 5 : _P0 + 5 + addr_len],
+            buf[_TX : _TX + addr_len],
+        )
+        regs = [(reg, buf[offset : offset + 1]) for reg, offset in _BYTE_REGS]
+        for i in range(6):
+            if i < 2:
+                regs.append((0x0A + i, self._addresses[i]))
+            else:
+                regs.append((0x0A + i, buf[_P0 + 8 + i : _P0 + 9 + i]))
+            regs.append((0x11 + i, buf[_PL + i : _PL + i + 1]))
+        regs.append((0x10, self._addresses[2]))
+        self._regs = tuple(regs)
+
+    @property
+    def registers(self) -> Tuple[Tuple[int, bytes], ...]:
+        """The ``(register, value)`` pairs in the order they are written."""
+        return self._regs
+
+    @property
+    def pipes(self) -> List[Union[bytearray, int]]:
+        """A new `list` of the RX pipes' addresses (like `RF24.address()`)."""
+        return [bytearray(self._addresses[0]), bytearray(self._addresses[1])] + list(
+            self._buf[_P0 + 10 : _P0 + 14]
+        )
+
+    @property
+    def tx_address(self) -> bytes:
+        """The address used for transmissions."""
+        return self._addresses[2]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the profile (to be restored with `from_bytes()`)."""
+        return self._buf
+
+    @classmethod
+    def from_bytes(cls, buf: Union[bytes, bytearray]) -> "RadioProfile":
+        """Restore a profile serialized by `to_bytes()`."""
+        if len(buf) != _SIZE or buf[0] != _VERSION:
+            raise ValueError("buffer is not a serialized RadioProfile")
+        if (
+            buf[_CH] > 125
+            or not 1 <= buf[_AW] <= 3
+            or buf[_RF] & 0x28 == 0x28
+            or buf[_CRC] & 0xF3
+            or not all(1 <= length <= 32 for length in buf[_PL : _PL + 6])
+        ):
+            raise ValueError("buffer holds invalid register values")
+        profile = cls.__new__(cls)
+        profile._buf = bytes(buf)
+        profile._compile()
+        return profile
+
+    @property
+    def channel(self) -> int:
+        """The profile's RF channel."""
+        return self._buf[_CH]
+
+    @property
+    def data_rate(self) -> int:
+        """The profile's data rate (1, 2, or 250)."""
+        rf_setup = self._buf[_RF] & 0x28
+        return (2 if rf_setup == 8 else 250) if rf_setup else 1
+
+    @property
+    def pa_level(self) -> int:
+        """The profile's power amplifier level (in dBm)."""
+        return (3 - ((self._buf[_RF] & 6) >> 1)) * -6
@@ -0,0 +1,349 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Damien P. George
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""registers module containing the register access layer of the RF24 class"""
+import time
+
+try:
+    from typing import Union, Optional, List
+except ImportError:
+    pass
+try:
+    from weakref import WeakKeyDictionary
+except ImportError:  # CircuitPython & MicroPython have no weakref module
+    WeakKeyDictionary = dict  # type: ignore[misc,assignment]
+from micropython import const
+from digitalio import DigitalInOut  # type: ignore[import]
+import busio  # type: ignore[import]
+from .wrapper import SPIDevCtx, SPIDevice
+
+CONFIGURE = const(0x00)  # IRQ masking, CRC scheme, PWR control, & RX/TX roles
+AUTO_ACK = const(0x01)  # auto-ACK status for all pipes
+OPEN_PIPES = const(0x02)  # open/close RX status for all pipes
+SETUP_RETR = const(0x04)  # auto-retry count & delay values
+RF_PA_RATE = const(0x06)  # RF Power Amplifier & Data Rate values
+RX_ADDR_P0 = const(0x0A)  # RX pipe addresses; pipes 0-5 = 0x0A-0x0F
+TX_ADDRESS = const(0x10)  # Address used for TX transmissions
+RX_PL_LENG = const(0x11)  # RX payload widths; pipes 0-5 = 0x11-0x16
+DYN_PL_LEN = const(0x1C)  # dynamic payloads status for all pipes
+TX_FEATURE = const(0x1D)  # dynamic TX-payloads, TX-ACK payloads, TX-NO_ACK
+
+# policies about how the shadow copies of the registers are kept coherent
+SHADOW_READ_THROUGH = const(0)  #: Getters always read the radio's registers.
+SHADOW_TRUST = const(1)  #: Getters only use the shadow copies of the registers.
+SHADOW_VERIFY = const(2)  #: Like `SHADOW_TRUST` but register writes are read back.
+SHADOW_RESYNC = const(3)  #: Like `SHADOW_TRUST` but shadows are periodically re-read.
+
+# the last value written to each configuration register of each physical radio;
+# shared by all RF24 objects that drive the same radio (same SPI bus & CSN pin)
+_chip_images = WeakKeyDictionary()  # type: WeakKeyDictionary
+_pinned_images = {}  # type: dict  # for buses that can't be weakly referenced
+_IMAGE_REGS = (0, 1, 2, 3, 4, 5, 6) + tuple(range(0x0A, 0x17)) + (0x1C, 0x1D)
+
+
+def _chip_image(spi, csn) -> dict:
+    """Get the register image of the radio at a SPI bus & CSN pin. Images are keyed
+    by the objects themselves (not `id()`), so a new bus never gets a stale image."""
+    try:
+        images = _chip_images.setdefault(spi, {})
+    except TypeError:  # like spidev.SpiDev objects
+        images = _pinned_images.setdefault(spi, {})
+    return images.setdefault(csn, {})
+
+
+class _RegisterBatch:
+    """A reusable context manager that defers an `RF24` object's register writes
+    until the outermost ``with`` block exits."""
+
+    def __init__(self, radio: "RegisterFile"):
+        self._radio = radio
+        self._depth = 0  # allows nested with blocks
+
+    def __enter__(self):
+        if self._radio._batch is None:
+            self._radio._batch = []
+        self._depth += 1
+        return self._radio
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if not self._depth:
+            self._radio._flush_batch()
+            self._radio._batch = None
+        return False
+
+
+class RegisterFile:
+    """The SPI register access (and shadow copies of the configuration registers)
+    that the `RF24` class is built on."""
+
+    def __init__(self, spi: busio.SPI, csn: DigitalInOut, spi_frequency: int):
+        self._in = bytearray(97)  # MISO buffer for full RX FIFO reads + STATUS byte
+        self._out = bytearray(97)  # MOSI buffer length must equal MISO buffer length
+        # queue of register writes deferred by batch(); None when not batching
+        self._batch: Optional[List[bytes]] = None
+        self._batcher = _RegisterBatch(self)
+        self._shadow_policy = SHADOW_READ_THROUGH
+        #: The interval (in milliseconds) between refreshes using `SHADOW_RESYNC`.
+        self.resync_interval: int = 1000
+        self._resync_at = 0
+        self._image = _chip_image(spi, csn)
+        self._image.clear()  # unknown until all registers are written
+        # setup SPI
+        if isinstance(spi, SPIDevCtx):
+            self._spi = spi  # already wrapped (csn was given to the wrapper)
+        elif type(spi).__name__.endswith("SpiDev"):
+            self._spi = SPIDevCtx(spi, csn, spi_frequency=spi_frequency)
+        else:
+            self._spi = SPIDevice(spi, chip_select=csn, baudrate=spi_frequency)
+        # init shadow copy of RX addresses for all pipes for context manager
+        self._pipes = [bytearray(5)] * 2 + [0] * 4
+        # pre-configure the CONFIGURE register:
+        #   0x0E = all IRQs enabled, CRC is 2 bytes, and power up in TX mode
+        self._config = 0x0E
+        self._open_pipes = 0  # close all RX pipes
+        # pre-configure features for TX operations:
+        #   5 = enable dynamic_payloads, disable custom ack payloads, &
+        #       allow ask_no_ack command
+        self._features = 5
+        # init shadow copy of last RX_ADDR_P0 written to pipe 0 needed as
+        # open_tx_pipe() appropriates pipe 0 for ACK packet
+        self._pipe0_read_addr: Optional[Union[bytes, bytearray]] = None
+        # shadow copy of the TX_ADDRESS
+        self._tx_address = bytearray(5)
+        # pre-configure the SETUP_RETR register
+        self._retry_setup = 0x5F  # ard = 1500; arc = 15
+        # pre-configure the RF_SETUP register
+        self._rf_setup = 0x07  # 1 Mbps data_rate, and 0 dbm pa_level
+        # pre-configure dynamic_payloads & auto_ack
+        self._dyn_pl, self._aa = (0x3F,) * 2  # 0x3F = enable feature on all pipes
+        self._channel = 76  # 2.476 GHz
+        self._addr_len = 5  # 5-byte long addresses
+        self._pl_len = [32] * 6  # 32-byte static payloads for all pipes
+
+    def _reg_read(self, reg: int) -> int:
+        if self._batch:
+            self._flush_batch()
+        self._out[0] = reg
+        with self._spi as spi:
+            # time.sleep(0.000005)
+            spi.write_readinto(self._out, self._in, out_end=2, in_end=2)
+        # print("SPI read 1 byte from", ("%02X" % reg), ("%02X" % self._in[1]))
+        return self._in[1]
+
+    def _reg_read_bytes(self, reg: int, buf_len: int = 5) -> bytearray:
+        if self._batch:
+            self._flush_batch()
+        self._out[0] = reg
+        buf_len += 1
+        with self._spi as spi:
+            # time.sleep(0.000005)
+            spi.write_readinto(self._out, self._in, out_end=buf_len, in_end=buf_len)
+        # print("SPI read {} bytes from {} {}".format(
+        #     buf_len - 1, ("%02X" % reg), address_repr(self._in[1 : buf_len], 0)
+        # ))
+        return self._in[1:buf_len]
+
+    def _reg_write_bytes(self, reg: int, out_buf: Union[bytes, bytearray, memoryview]):
+        if reg in _IMAGE_REGS:
+            self._image[reg] = bytes(out_buf)
+        if self._batch is not None:
+            self._batch.append(bytes([0x20 | reg]) + bytes(out_buf))
+            return
+        self._out[0] = 0x20 | reg
+        buf_len = len(out_buf) + 1
+        self._out[1:buf_len] = out_buf
+        with self._spi as spi:
+            # time.sleep(0.000005)
+            spi.write_readinto(self._out, self._in, out_end=buf_len, in_end=buf_len)
+        # print("SPI write {} bytes to {} {}".format(
+        #     buf_len - 1, ("%02X" % reg), address_repr(self._out[1 : buf_len], 0)
+        # ))
+        if self._shadow_policy == SHADOW_VERIFY and reg < 0x20:
+            self._verify(reg, out_buf)
+
+    def _reg_write(self, reg: int, value: int = None):
+        if value is not None and reg in _IMAGE_REGS:
+            self._image[reg] = bytes([value])
+        elif reg == 0x50:  # toggles the TX_FEATURE register on non-plus variants
+            self._image.pop(TX_FEATURE, None)
+        if self._batch is not None:
+            if reg != 0xFF:  # a NOP is only used to get the STATUS byte
+                if value is None:
+                    self._batch.append(bytes([reg]))
+                else:
+                    self._batch.append(
+                        bytes([(0x20 if reg != 0x50 else 0) | reg, value])
+                    )
+                return
+            self._flush_batch()
+        self._out[0] = reg
+        buf_len = 1
+        if value is not None:
+            self._out[0] = (0x20 if reg != 0x50 else 0) | reg
+            self._out[1] = value
+            buf_len += 1
+        with self._spi as spi:
+            # time.sleep(0.000005)
+            spi.write_readinto(self._out, self._in, out_end=buf_len, in_end=buf_len)
+        # if reg != 0xFF:
+        #     print(
+        #         "SPI write", "command" if value is None else "1 byte to",
+        #         ("%02X" % reg), "" if value is None else ("%02X" % value)
+        #     )
+        if self._shadow_policy == SHADOW_VERIFY and value is not None and reg < 0x20:
+            self._verify(reg, bytes([value]))
+
+    def _reg_sync(self, reg: int, value: Union[int, bytes, bytearray]):
+        """Write a register only if the radio's last known value is different."""
+        if isinstance(value, int):
+            if self._image.get(reg) != bytes([value]):
+                self._reg_write(reg, value)
+        elif self._image.get(reg) != bytes(value):
+            self._reg_write_bytes(reg, value)
+
+    def _activate_features(self) -> bool:
+        """Make sure the TX_FEATURE & DYN_PL_LEN registers are enabled; returns
+        `True` if the radio is a plus variant (which doesn't need activating)."""
+        features = self._reg_read(TX_FEATURE)
+        self._reg_write(0x50, 0x73)  # derelict command toggles TX_FEATURE register
+        after_toggle = self._reg_read(TX_FEATURE)
+        if features == after_toggle:
+            return True
+        if not after_toggle:  # if features are disabled
+            self._reg_write(0x50, 0x73)  # ensure they're enabled
+        return False
+
+    def _sync_registers(self):
+        """Write the shadow copies of all configuration registers that differ from
+        the radio's last known values (in 1 bus session)."""
+        with self._batcher:
+            self._reg_sync(CONFIGURE, self._config)
+            self._reg_sync(RF_PA_RATE, self._rf_setup)
+            self._reg_sync(OPEN_PIPES, self._open_pipes)
+            self._reg_sync(DYN_PL_LEN, self._dyn_pl)
+            self._reg_sync(AUTO_ACK, self._aa)
+            self._reg_sync(TX_FEATURE, self._features)
+            self._reg_sync(SETUP_RETR, self._retry_setup)
+            for i, addr in enumerate(self._pipes):
+                self._reg_sync(RX_ADDR_P0 + i, addr)
+                self._pl_len[i] = max(1, min(32, self._pl_len[i]))
+                self._reg_sync(RX_PL_LENG + i, self._pl_len[i])
+            self._reg_sync(TX_ADDRESS, self._tx_address)
+            self._reg_sync(0x05, self._channel)
+            self._reg_sync(0x03, self._addr_len - 2)
+
+    def batch(self) -> _RegisterBatch:
+        """Defer register writes and send them all in 1 bus session."""
+        return self._batcher
+
+    def _cycle_csn(self):
+        """De-assert & re-assert the CSN pin between commands of a burst."""
+        if hasattr(self._spi, "cycle_cs"):  # SPIDevCtx (or a profiled bus)
+            self._spi.cycle_cs()
+        else:
+            self._spi.chip_select.value = True
+            self._spi.chip_select.value = False
+
+    def _flush_batch(self):
+        """Write all deferred commands while holding the SPI bus only once."""
+        if not self._batch:
+            return
+        with self._spi as spi:
+            for i, cmd in enumerate(self._batch):
+                if i:
+                    self._cycle_csn()
+                buf_len = len(cmd)
+                spi.write_readinto(cmd, self._in, out_end=buf_len, in_end=buf_len)
+        written, self._batch = (self._batch, [])
+        if self._shadow_policy == SHADOW_VERIFY:
+            for cmd in written:
+                if cmd[0] & 0xE0 == 0x20 and len(cmd) > 1:
+                    self._verify(cmd[0] & 0x1F, cmd[1:])
+
+    def _verify(self, reg: int, value: Union[bytes, bytearray, memoryview]):
+        """Read back a register that was just written (for `SHADOW_VERIFY`)."""
+        if reg in (7, 8, 9, 0x17):  # STATUS, OBSERVE_TX, RPD, & FIFO_STATUS
+            return
+        if len(value) > 1:
+            result = bytes(self._reg_read_bytes(reg, len(value)))
+        else:
+            result = bytes([self._reg_read(reg)])
+        if result != value:
+            raise RuntimeError(
+                "register {} holds {} instead of {}".format(
+                    hex(reg), list(result), list(value)
+                )
+            )
+
+    def _stale(self) -> bool:
+        """Should a register be read instead of using its shadow copy?"""
+        if self._shadow_policy == SHADOW_READ_THROUGH:
+            return True
+        if (
+            self._shadow_policy == SHADOW_RESYNC
+            and time.monotonic_ns() >= self._resync_at
+        ):
+            self.resync()
+        return False
+
+    def _rmw_stale(self) -> bool:
+        """Should a read-modify-write setter read a register? (never in a `batch()`)"""
+        return self._batch is None and self._stale()
+
+    @property
+    def shadow_policy(self) -> int:
+        """The policy that keeps the shadow copies of the registers coherent."""
+        return self._shadow_policy
+
+    @shadow_policy.setter
+    def shadow_policy(self, policy: int):
+        if policy not in (
+            SHADOW_READ_THROUGH,
+            SHADOW_TRUST,
+            SHADOW_VERIFY,
+            SHADOW_RESYNC,
+        ):
+            raise ValueError("shadow_policy: {} is not a valid policy".format(policy))
+        self._shadow_policy = policy
+        self._resync_at = 0
+
+    def resync(self):
+        """Refresh the shadow copies of all configuration registers."""
+        self._config = self._reg_read(CONFIGURE)
+        self._aa = self._reg_read(AUTO_ACK)
+        self._open_pipes = self._reg_read(OPEN_PIPES)
+        self._addr_len = self._reg_read(0x03) + 2
+        self._retry_setup = self._reg_read(SETUP_RETR)
+        self._channel = self._reg_read(5)
+        self._rf_setup = self._reg_read(RF_PA_RATE)
+        for i in range(6):
+            if i < 2:
+                self._pipes[i] = self._reg_read_bytes(RX_ADDR_P0 + i)
+            else:
+                self._pipes[i] = self._reg_read(RX_ADDR_P0 + i)
+            self._pl_len[i] = self._reg_read(RX_PL_LENG + i)
+        self._tx_address = self._reg_read_bytes(TX_ADDRESS)
+        self._dyn_pl = self._reg_read(DYN_PL_LEN)
+        self._features = self._reg_read(TX_FEATURE)
+        self._image.clear()  # the next context will rewrite all registers
+        self._resync_at = time.monotonic_ns() + self.resync_interval * 1000000
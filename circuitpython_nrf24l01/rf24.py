@@ -24,36 +24,43 @@
 import time
 
 try:
-    from typing import Union, Sequence, Optional, List, Tuple
+    from typing import Union, Sequence, Optional, List, Tuple, Iterable
     from typing_extensions import Literal
+    from .radio_profile import RadioProfile
 except ImportError:
     pass
-from micropython import const
 from digitalio import DigitalInOut  # type: ignore[import]
 import busio  # type: ignore[import]
-from .wrapper import SPIDevCtx, SPIDevice
-
-CONFIGURE = const(0x00)  # IRQ masking, CRC scheme, PWR control, & RX/TX roles
-AUTO_ACK = const(0x01)  # auto-ACK status for all pipes
-OPEN_PIPES = const(0x02)  # open/close RX status for all pipes
-SETUP_RETR = const(0x04)  # auto-retry count & delay values
-RF_PA_RATE = const(0x06)  # RF Power Amplifier & Data Rate values
-RX_ADDR_P0 = const(0x0A)  # RX pipe addresses; pipes 0-5 = 0x0A-0x0F
-TX_ADDRESS = const(0x10)  # Address used for TX transmissions
-RX_PL_LENG = const(0x11)  # RX payload widths; pipes 0-5 = 0x11-0x16
-DYN_PL_LEN = const(0x1C)  # dynamic payloads status for all pipes
-TX_FEATURE = const(0x1D)  # dynamic TX-payloads, TX-ACK payloads, TX-NO_ACK
+from .registers import (  # pylint: disable=unused-import
+    RegisterFile,
+    CONFIGURE,
+    AUTO_ACK,
+    OPEN_PIPES,
+    SETUP_RETR,
+    RF_PA_RATE,
+    RX_ADDR_P0,
+    TX_ADDRESS,
+    RX_PL_LENG,
+    DYN_PL_LEN,
+    TX_FEATURE,
+    SHADOW_READ_THROUGH,
+    SHADOW_TRUST,
+    SHADOW_VERIFY,
+    SHADOW_RESYNC,
+)
+from .burst import RxBurst, StreamResult, _drain, _TxStream
+from .airtime import _tx_timing
 
 
 def address_repr(
-    buf: Union[bytes, bytearray], reverse: bool = True, delimit: str = ""
+    buf: Union[bytes, bytearray, memoryview], reverse: bool = True, delimit: str = ""
 ) -> str:
     """Convert a buffer into a hexlified string."""
     order = range(len(buf) - 1, -1, -1) if reverse else range(len(buf))
     return delimit.join(["%02X" % buf[byte] for byte in order])
 
 
-class RF24:
+class RF24(RegisterFile):
     """A driver class for the nRF24L01(+) transceiver radios."""
 
     def __init__(
@@ -63,20 +70,21 @@ class RF24:
         ce_pin: DigitalInOut,
         spi_frequency=10000000,
     ):
-        self._in = bytearray(97)  # MISO buffer for full RX FIFO reads + STATUS byte
-        self._out = bytearray(97)  # MOSI buffer length must equal MISO buffer length
         self._ce_pin = ce_pin
         self._ce_pin.switch_to_output(value=False)
-        # init shadow copy of RX addresses for all pipes for context manager
-        self._pipes = [bytearray(5)] * 2 + [0] * 4
-        # pre-configure the CONFIGURE register:
-        #   0x0E = all IRQs enabled, CRC is 2 bytes, and power up in TX mode
-        self._config = 0x0E
-        # setup SPI
-        if type(spi).__name__.endswith("SpiDev"):
-            self._spi = SPIDevCtx(spi, csn, spi_frequency=spi_frequency)
-        else:
-            self._spi = SPIDevice(spi, chip_select=csn, baudrate=spi_frequency)
+        super().__init__(spi, csn, spi_frequency)
+        # STATUS byte + 1 payload; filled in place by read_into() & read_view()
+        self._rx_pl = bytearray(33)
+        self._rx_view = memoryview(self._rx_pl)
+        self._burst = RxBurst()  # reused by drain()
+        #: Sleep through the expected on-air time in `send()` & `resend()`.
+        self.airtime_wait: bool = True
+        #: The number of STATUS byte polls made by the last `send()` or `resend()`.
+        self.tx_polls: int = 0
+        #: The estimated number of STATUS byte polls avoided by `airtime_wait`.
+        self.tx_polls_saved: int = 0
+        self._poll_ns = 0  # smoothed duration of 1 STATUS byte poll
+        self._tx_pl_len, self._tx_no_ack = (32, False)  # describes the last write()
         self._reg_write(CONFIGURE, self._config)
         if self._reg_read(CONFIGURE) != self._config:
             raise RuntimeError("radio hardware not responding")
@@ -87,32 +95,8 @@ class RF24:
                 self._pipes[i] = self._reg_read(RX_ADDR_P0 + i)
         # test is nRF24L01 is a plus variant using a command specific to
         # non-plus variants
-        self._open_pipes, self._is_plus_variant = (0, False)  # close all RX pipes
-        self._features = self._reg_read(TX_FEATURE)
-        self._reg_write(0x50, 0x73)  # derelict command toggles TX_FEATURE register
-        after_toggle = self._reg_read(TX_FEATURE)
-        if self._features == after_toggle:
-            self._is_plus_variant = True
-        elif not after_toggle:  # if features are disabled
-            self._reg_write(0x50, 0x73)  # ensure they're enabled
-        # pre-configure features for TX operations:
-        #   5 = enable dynamic_payloads, disable custom ack payloads, &
-        #       allow ask_no_ack command
-        self._features = 5
-        # init shadow copy of last RX_ADDR_P0 written to pipe 0 needed as
-        # open_tx_pipe() appropriates pipe 0 for ACK packet
-        self._pipe0_read_addr: Optional[Union[bytes, bytearray]] = None
-        # shadow copy of the TX_ADDRESS
+        self._is_plus_variant = self._activate_features()
         self._tx_address = self._reg_read_bytes(TX_ADDRESS)
-        # pre-configure the SETUP_RETR register
-        self._retry_setup = 0x5F  # ard = 1500; arc = 15
-        # pre-configure the RF_SETUP register
-        self._rf_setup = 0x07  # 1 Mbps data_rate, and 0 dbm pa_level
-        # pre-configure dynamic_payloads & auto_ack
-        self._dyn_pl, self._aa = (0x3F,) * 2  # 0x3F = enable feature on all pipes
-        self._channel = 76  # 2.476 GHz
-        self._addr_len = 5  # 5-byte long addresses
-        self._pl_len = [32] * 6  # 32-byte static payloads for all pipes
 
         with self:  # dumps internal attributes to all registers
             self.flush_rx()
@@ -121,24 +105,11 @@ class RF24:
 
     def __enter__(self):
         self._ce_pin.value = False
+        powered = self._image.get(CONFIGURE, b"\0")[0] & 2
         self._config |= 2
-        self._reg_write(CONFIGURE, self._config)
-        # time.sleep(0.00015)  # let the rest of this function be the delay
-        self._reg_write(RF_PA_RATE, self._rf_setup)
-        self._reg_write(OPEN_PIPES, self._open_pipes)
-        self._reg_write(DYN_PL_LEN, self._dyn_pl)
-        self._reg_write(AUTO_ACK, self._aa)
-        self._reg_write(TX_FEATURE, self._features)
-        self._reg_write(SETUP_RETR, self._retry_setup)
-        for i, addr in enumerate(self._pipes):
-            if i < 2:
-                self._reg_write_bytes(RX_ADDR_P0 + i, addr)
-            else:
-                self._reg_write(RX_ADDR_P0 + i, addr)
-            self.set_payload_length(self._pl_len[i], i)
-        self._reg_write_bytes(TX_ADDRESS, self._tx_address)
-        self._reg_write(0x05, self._channel)
-        self._reg_write(0x03, self._addr_len - 2)
+        self._sync_registers()
+        if not powered:  # the burst is too quick to cover the power up delay
+            time.sleep(0.00015)
         return self
 
     def __exit__(self, *exc):
@@ -157,56 +128,30 @@ class RF24:
     def ce_pin(self, val: bool):
         self._ce_pin.value = val
 
-    def _reg_read(self, reg: int) -> int:
-        self._out[0] = reg
-        with self._spi as spi:
-            # time.sleep(0.000005)
-            spi.write_readinto(self._out, self._in, out_end=2, in_end=2)
-        # print("SPI read 1 byte from", ("%02X" % reg), ("%02X" % self._in[1]))
-        return self._in[1]
-
-    def _reg_read_bytes(self, reg: int, buf_len: int = 5) -> bytearray:
-        self._out[0] = reg
-        buf_len += 1
-        with self._spi as spi:
-            # time.sleep(0.000005)
-            spi.write_readinto(self._out, self._in, out_end=buf_len, in_end=buf_len)
-        # print("SPI read {} bytes from {} {}".format(
-        #     buf_len - 1, ("%02X" % reg), address_repr(self._in[1 : buf_len], 0)
-        # ))
-        return self._in[1:buf_len]
-
-    def _reg_write_bytes(self, reg: int, out_buf: Union[bytes, bytearray]):
-        self._out[0] = 0x20 | reg
-        buf_len = len(out_buf) + 1
-        self._out[1:buf_len] = out_buf
-        with self._spi as spi:
-            # time.sleep(0.000005)
-            spi.write_readinto(self._out, self._in, out_end=buf_len, in_end=buf_len)
-        # print("SPI write {} bytes to {} {}".format(
-        #     buf_len - 1, ("%02X" % reg), address_repr(self._out[1 : buf_len], 0)
-        # ))
-
-    def _reg_write(self, reg: int, value: int = None):
-        self._out[0] = reg
-        buf_len = 1
-        if value is not None:
-            self._out[0] = (0x20 if reg != 0x50 else 0) | reg
-            self._out[1] = value
-            buf_len += 1
-        with self._spi as spi:
-            # time.sleep(0.000005)
-            spi.write_readinto(self._out, self._in, out_end=buf_len, in_end=buf_len)
-        # if reg != 0xFF:
-        #     print(
-        #         "SPI write", "command" if value is None else "1 byte to",
-        #         ("%02X" % reg), "" if value is None else ("%02X" % value)
-        #     )
+    def apply_profile(self, profile: "RadioProfile"):
+        """Load a precompiled `RadioProfile` in 1 burst of changed registers."""
+        buf = profile.to_bytes()
+        self._config = self._config & 0x73 | buf[1]
+        self._aa, self._open_pipes, self._addr_len = (buf[2], buf[3], buf[4] + 2)
+        self._retry_setup, self._channel, self._rf_setup = (buf[5], buf[6], buf[7])
+        self._dyn_pl, self._features = (buf[8], buf[9])
+        self._pl_len[:] = buf[10:16]
+        self._pipes = profile.pipes
+        self._tx_address = bytearray(profile.tx_address)
+        self._pipe0_read_addr = bytes(self._pipes[0]) if buf[35] & 1 else None
+        if not self._is_plus_variant:
+            self._activate_features()
+        with self._batcher:
+            self._reg_sync(CONFIGURE, self._config)
+            for reg, value in profile.registers:
+                if self._image.get(reg) != value:
+                    self._reg_write_bytes(reg, value)
 
     @property
     def address_length(self) -> int:
         """This `int` is the length (in bytes) used of RX/TX addresses."""
-        self._addr_len = self._reg_read(0x03) + 2
+        if self._stale():
+            self._addr_len = self._reg_read(0x03) + 2
         return self._addr_len
 
     @address_length.setter
@@ -219,16 +164,18 @@ class RF24:
         if self._pipe0_read_addr != address and self._aa & 1:
             for i, val in enumerate(address):
                 self._pipes[0][i] = val  # type: ignore[assignment, index]
-            self._reg_write_bytes(RX_ADDR_P0, address)
+            self._reg_sync(RX_ADDR_P0, address)  # skipped if already loaded
         for i, val in enumerate(address):
             self._tx_address[i] = val
-        self._reg_write_bytes(TX_ADDRESS, address)
+        self._reg_sync(TX_ADDRESS, address)
 
     def close_rx_pipe(self, pipe_number: int) -> None:
         """Close a specific data pipe from RX transmissions."""
         if pipe_number < 0 or pipe_number > 5:
             raise IndexError("pipe number must be in range [0, 5]")
-        self._open_pipes = self._reg_read(OPEN_PIPES) & ~(1 << pipe_number)
+        if self._rmw_stale():
+            self._open_pipes = self._reg_read(OPEN_PIPES)
+        self._open_pipes &= ~(1 << pipe_number)
         if not pipe_number:
             self._pipe0_read_addr = None
         self._reg_write(OPEN_PIPES, self._open_pipes)
@@ -248,7 +195,9 @@ class RF24:
         else:
             self._pipes[pipe_number] = address[0]
             self._reg_write(RX_ADDR_P0 + pipe_number, address[0])
-        self._open_pipes = self._reg_read(OPEN_PIPES) | (1 << pipe_number)
+        if self._rmw_stale():
+            self._open_pipes = self._reg_read(OPEN_PIPES)
+        self._open_pipes |= 1 << pipe_number
         self._reg_write(OPEN_PIPES, self._open_pipes)
 
     @property
@@ -298,7 +247,7 @@ class RF24:
             return self._pl_len[(self._in[0] >> 1) & 7]
         return 0
 
-    def read(self, length: int = None) -> Optional[bytearray]:
+    def read(self, length: Optional[int] = None) -> Optional[bytearray]:
         """This function is used to retrieve data from the RX FIFO."""
         return_size = length if length is not None else self.any()
         if not return_size:
@@ -307,39 +256,148 @@ class RF24:
         self.clear_status_flags(True, False, False)
         return result
 
+    def _read_payload(self, length: int):
+        if not 0 < length <= 32:
+            raise ValueError("payload length must be in range [1, 32]")
+        if self._batch:
+            self._flush_batch()
+        self._out[0] = 0x61
+        length += 1
+        with self._spi as spi:
+            spi.write_readinto(self._out, self._rx_pl, out_end=length, in_end=length)
+        self._in[0] = self._rx_pl[0]
+        self.clear_status_flags(True, False, False)
+
+    def read_into(
+        self, buf: Union[bytearray, memoryview], offset: int = 0, length: int = None
+    ) -> int:
+        """Copy the next available payload from the RX FIFO into a given buffer."""
+        return_size = length if length is not None else self.any()
+        if not return_size:
+            return 0
+        if offset + return_size > len(buf):
+            raise ValueError("buf is too small to hold the payload")
+        self._read_payload(return_size)
+        buf[offset : offset + return_size] = self._rx_view[1 : return_size + 1]
+        return return_size
+
+    def read_view(self, length: int = None) -> Optional[memoryview]:
+        """Get the next available payload from the RX FIFO as a `memoryview`."""
+        return_size = length if length is not None else self.any()
+        if not return_size:
+            return None
+        self._read_payload(return_size)
+        return self._rx_view[1 : return_size + 1]
+
+    def drain(self) -> RxBurst:
+        """Read every payload in the RX FIFO while holding the SPI bus only once."""
+        return _drain(self, self._burst)
+
+    def read_all(self) -> List[Tuple[int, bytearray]]:
+        """Get every payload in the RX FIFO as a `list` of ``(pipe, payload)`` pairs."""
+        burst = self.drain()
+        return [
+            (burst.pipes[i], burst.payloads[i][: burst.lengths[i]])
+            for i in range(burst.count)
+        ]
+
     def send(
         self,
-        buf: Union[bytes, bytearray, Sequence[Union[bytes, bytearray]]],
+        buf: Union[
+            bytes, bytearray, memoryview, Sequence[Union[bytes, bytearray, memoryview]]
+        ],
         ask_no_ack: bool = False,
         force_retry: int = 0,
         send_only: bool = False,
-    ) -> Union[bool, bytearray, List[Union[bool, bytearray]]]:
+        deadline_ns: Optional[int] = None,
+        keep_fifo: bool = False,
+    ) -> Union[None, bool, bytearray, List[Union[None, bool, bytearray]]]:
         """This blocking function is used to transmit payload(s)."""
         self._ce_pin.value = False
         if isinstance(buf, (list, tuple)):
             result = []
             for byte in buf:
-                result.append(self.send(byte, ask_no_ack, force_retry, send_only))
+                result.append(
+                    self.send(
+                        byte, ask_no_ack, force_retry, send_only, deadline_ns, keep_fifo
+                    )
+                )
             return result  # type: ignore[return-value]
+        if deadline_ns is not None and time.monotonic_ns() >= deadline_ns:
+            return None
         if self._in[0] & 0x10 or self._in[0] & 1:
             self.flush_tx()
         if not send_only and self._in[0] >> 1 & 7 < 6:
             self.flush_rx()
-        up_cnt = 0
-        assert isinstance(buf, (bytes, bytearray))
+        assert isinstance(buf, (bytes, bytearray, memoryview))
         self.write(buf, ask_no_ack)
-        while not self._in[0] & 0x30:
-            up_cnt += self.update()
+        if not self._wait_for_tx(deadline_ns):
+            self._tx_timeout(keep_fifo)
+            return None
         result = bool(self._in[0] & 0x20)  # type: ignore[assignment]
-        # print("send did {} updates. flags: {}".format(up_cnt, self._in[0] >> 4))
+        # print("send did {} updates. flags: {}".format(self.tx_polls, self._in[0] >> 4))
         while force_retry and not result:
-            result = self.resend(send_only)
+            result = self.resend(send_only, deadline_ns, keep_fifo)
+            if result is None:
+                return None
             force_retry -= 1
         if self._in[0] & 0x60 == 0x60 and not send_only:
             result = self.read()  # type: ignore[assignment]
         # self._ce_pin.value = False
         return result  # type: ignore[return-value]
 
+    def _tx_timeout(self, keep_fifo: bool) -> None:
+        """Abort a transmission that missed its deadline."""
+        self._ce_pin.value = False
+        if not keep_fifo:
+            self.flush_tx()
+
+    def stream(
+        self,
+        buf: Iterable[Union[bytes, bytearray]],
+        ask_no_ack: bool = False,
+        max_retries: int = 0,
+    ) -> StreamResult:
+        """Transmit a sequence of payloads while keeping the TX FIFO full."""
+        payloads = [self._fit_payload(pl) for pl in buf]
+        cmd = 0xA0 | (bool(ask_no_ack) << 4)
+        return _TxStream(self, payloads, cmd, max_retries).run()
+
+    def _wait_for_tx(self, deadline_ns: Optional[int] = None) -> bool:
+        """Wait for the TX_DS or MAX_RT flag while sleeping through most of the
+        expected on-air time; returns `False` if the deadline passed first."""
+        self.tx_polls, slept = (0, 0)
+        if not self.airtime_wait:
+            self.tx_polls_saved = 0
+            while not self._in[0] & 0x30:
+                if deadline_ns is not None and time.monotonic_ns() >= deadline_ns:
+                    return False
+                self.tx_polls += self.update()
+            return True
+        end, retry_ns = _tx_timing(self)
+        end += time.monotonic_ns()
+        margin = retry_ns // 10  # poll only near the end of each attempt
+        while True:
+            wake = end - margin
+            if deadline_ns is not None and wake > deadline_ns:
+                wake = deadline_ns
+            remaining = wake - time.monotonic_ns()
+            if remaining > 0:
+                time.sleep(remaining / 1000000000)
+                slept += remaining
+            poll_start = time.monotonic_ns()
+            self.tx_polls += self.update()
+            now = time.monotonic_ns()
+            poll_ns = max(1, now - poll_start)
+            self._poll_ns = (self._poll_ns + poll_ns) // 2 if self._poll_ns else poll_ns
+            self.tx_polls_saved = slept // self._poll_ns
+            if self._in[0] & 0x30:
+                return True
+            if deadline_ns is not None and now >= deadline_ns:
+                return False
+            if now >= end + margin:  # wait for the next automatic re-transmission
+                end += retry_ns
+
     @property
     def tx_full(self) -> bool:
         """An `bool` to represent if the TX FIFO is full. (read-only)"""
@@ -385,7 +443,9 @@ class RF24:
         self, data_recv: bool = True, data_sent: bool = True, data_fail: bool = True
     ):
         """Sets the configuration of the nRF24L01's IRQ pin. (write-only)"""
-        self._config = (self._reg_read(CONFIGURE) & 0x0F) | (not data_recv) << 6
+        if self._rmw_stale():
+            self._config = self._reg_read(CONFIGURE)
+        self._config = (self._config & 0x0F) | (not data_recv) << 6
         self._config |= (not data_fail) << 4 | (not data_sent) << 5
         self._reg_write(CONFIGURE, self._config)
 
@@ -393,14 +453,7 @@ class RF24:
         """This debugging function outputs all details about the nRF24L01."""
         observer = self._reg_read(8)
         _fifo = self._reg_read(0x17)
-        self._config = self._reg_read(CONFIGURE)
-        self._rf_setup = self._reg_read(RF_PA_RATE)
-        self._retry_setup = self._reg_read(SETUP_RETR)
-        self._channel = self.channel
-        self._addr_len = self._reg_read(0x03) + 2
-        self._features = self._reg_read(TX_FEATURE)
-        self._aa = self._reg_read(AUTO_ACK)
-        self._dyn_pl = self._reg_read(DYN_PL_LEN)
+        self.resync()
         _crc = (
             (2 if self._config & 4 else 1)
             if self._aa
@@ -524,18 +577,21 @@ class RF24:
     def dynamic_payloads(self) -> int:
         """This `int` attribute is the dynamic payload length feature for
         any/all pipes."""
-        self._dyn_pl = self._reg_read(DYN_PL_LEN)
+        if self._stale():
+            self._dyn_pl = self._reg_read(DYN_PL_LEN)
         return self._dyn_pl
 
     @dynamic_payloads.setter
     def dynamic_payloads(self, enable: Union[int, bool, Sequence[bool]]):
-        self._features = self._reg_read(TX_FEATURE)
+        if self._rmw_stale():
+            self._features = self._reg_read(TX_FEATURE)
         if isinstance(enable, bool):
             self._dyn_pl = 0x3F if enable else 0
         elif isinstance(enable, int):
             self._dyn_pl = 0x3F & enable
         elif isinstance(enable, (list, tuple)):
-            self._dyn_pl = self._reg_read(DYN_PL_LEN)
+            if self._rmw_stale():
+                self._dyn_pl = self._reg_read(DYN_PL_LEN)
             for i, val in enumerate(enable):
                 if i < 6 and val >= 0:  # skip pipe if val is negative
                     self._dyn_pl = (self._dyn_pl & ~(1 << i)) | (bool(val) << i)
@@ -550,7 +606,9 @@ class RF24:
         if pipe_number is None:
             self.dynamic_payloads = bool(enable)
         elif 0 <= pipe_number <= 5:
-            self._dyn_pl = self._reg_read(DYN_PL_LEN) & ~(1 << pipe_number)
+            if self._rmw_stale():
+                self._dyn_pl = self._reg_read(DYN_PL_LEN)
+            self._dyn_pl &= ~(1 << pipe_number)
             self.dynamic_payloads = self._dyn_pl | (bool(enable) << pipe_number)
         else:
             raise IndexError("pipe_number must be in range [0, 5]")
@@ -583,19 +641,21 @@ class RF24:
             self.payload_length = length
         else:
             self._pl_len[pipe_number] = max(1, min(32, length))
-            self._reg_write(RX_PL_LENG + pipe_number, length)
+            self._reg_write(RX_PL_LENG + pipe_number, self._pl_len[pipe_number])
 
     def get_payload_length(self, pipe_number: int = 0) -> int:
         """Returns an `int` describing the specified data pipe's static
         payload length."""
-        self._pl_len[pipe_number] = self._reg_read(RX_PL_LENG + pipe_number)
+        if self._stale():
+            self._pl_len[pipe_number] = self._reg_read(RX_PL_LENG + pipe_number)
         return self._pl_len[pipe_number]
 
     @property
     def arc(self) -> int:
         """This `int` attribute specifies the number of attempts to
         re-transmit TX payload when ACK packet is not received."""
-        self._retry_setup = self._reg_read(SETUP_RETR)
+        if self._stale():
+            self._retry_setup = self._reg_read(SETUP_RETR)
         return self._retry_setup & 0x0F
 
     @arc.setter
@@ -608,7 +668,8 @@ class RF24:
     def ard(self) -> int:
         """This `int` attribute specifies the delay (in microseconds) between attempts
         to automatically re-transmit the TX payload when no ACK packet is received."""
-        self._retry_setup = self._reg_read(SETUP_RETR)
+        if self._stale():
+            self._retry_setup = self._reg_read(SETUP_RETR)
         return ((self._retry_setup & 0xF0) >> 4) * 250 + 250
 
     @ard.setter
@@ -636,7 +697,8 @@ class RF24:
     def auto_ack(self) -> int:
         """This `int` attribute is the automatic acknowledgment feature for
         any/all pipes."""
-        self._aa = self._reg_read(AUTO_ACK)
+        if self._stale():
+            self._aa = self._reg_read(AUTO_ACK)
         return self._aa
 
     @auto_ack.setter
@@ -646,7 +708,8 @@ class RF24:
         elif isinstance(enable, int):
             self._aa = 0x3F & enable
         elif isinstance(enable, (list, tuple)):
-            self._aa = self._reg_read(AUTO_ACK)
+            if self._rmw_stale():
+                self._aa = self._reg_read(AUTO_ACK)
             for i, val in enumerate(enable):
                 if i < 6 and val >= 0:  # skip pipe if val is negative
                     self._aa = (self._aa & ~(1 << i)) | (bool(val) << i)
@@ -659,7 +722,9 @@ class RF24:
         if pipe_number is None:
             self.auto_ack = bool(enable)
         elif 0 <= pipe_number <= 5:
-            self._aa = self._reg_read(AUTO_ACK) & ~(1 << pipe_number)
+            if self._rmw_stale():
+                self._aa = self._reg_read(AUTO_ACK)
+            self._aa &= ~(1 << pipe_number)
             self.auto_ack = self._aa | (bool(enable) << pipe_number)
         else:
             raise IndexError("pipe_number must be in range [0, 5]")
@@ -667,16 +732,18 @@ class RF24:
     def get_auto_ack(self, pipe_number: int) -> bool:
         """Returns a `bool` describing the `auto_ack` feature about a data pipe."""
         if 0 <= pipe_number <= 5:
-            self._aa = self._reg_read(AUTO_ACK)
+            if self._stale():
+                self._aa = self._reg_read(AUTO_ACK)
             return bool(self._aa & (1 << pipe_number))
         raise IndexError("pipe_number must be in range [0, 5]")
 
     @property
     def ack(self) -> bool:
         """Represents use of custom payloads as part of the ACK packet."""
-        self._aa = self._reg_read(AUTO_ACK)
-        self._dyn_pl = self._reg_read(DYN_PL_LEN)
-        self._features = self._reg_read(TX_FEATURE)
+        if self._stale():
+            self._aa = self._reg_read(AUTO_ACK)
+            self._dyn_pl = self._reg_read(DYN_PL_LEN)
+            self._features = self._reg_read(TX_FEATURE)
         return bool((self._features & 6) == 6 and ((self._aa & self._dyn_pl) & 1))
 
     @ack.setter
@@ -705,18 +772,22 @@ class RF24:
     @property
     def allow_ask_no_ack(self) -> bool:
         """Allow or disable ``ask_no_ack`` parameter to `send()` & `write()`."""
-        self._features = self._reg_read(TX_FEATURE)
+        if self._stale():
+            self._features = self._reg_read(TX_FEATURE)
         return bool(self._features & 1)
 
     @allow_ask_no_ack.setter
     def allow_ask_no_ack(self, enable: bool):
-        self._features = self._reg_read(TX_FEATURE) & 6 | bool(enable)
+        if self._rmw_stale():
+            self._features = self._reg_read(TX_FEATURE)
+        self._features = self._features & 6 | bool(enable)
         self._reg_write(TX_FEATURE, self._features)
 
     @property
     def data_rate(self) -> int:
         """This `int` attribute specifies the RF data rate."""
-        self._rf_setup = self._reg_read(RF_PA_RATE)
+        if self._stale():
+            self._rf_setup = self._reg_read(RF_PA_RATE)
         rf_setup = self._rf_setup & 0x28
         return (2 if rf_setup == 8 else 250) if rf_setup else 1
 
@@ -725,13 +796,17 @@ class RF24:
         if not speed in (1, 2, 250):
             raise ValueError("data_rate must be 1 (Mbps), 2 (Mbps), or 250 (kbps)")
         speed = 0 if speed == 1 else (0x20 if speed != 2 else 8)
-        self._rf_setup = self._reg_read(RF_PA_RATE) & 0xD7 | speed
+        if self._rmw_stale():
+            self._rf_setup = self._reg_read(RF_PA_RATE)
+        self._rf_setup = self._rf_setup & 0xD7 | speed
         self._reg_write(RF_PA_RATE, self._rf_setup)
 
     @property
     def channel(self) -> int:
         """This `int` attribute specifies the nRF24L01's frequency."""
-        return self._reg_read(5)
+        if self._stale():
+            self._channel = self._reg_read(5)
+        return self._channel
 
     @channel.setter
     def channel(self, channel: int):
@@ -743,8 +818,9 @@ class RF24:
     @property
     def crc(self) -> int:
         """This `int` attribute specifies the CRC checksum length in bytes."""
-        self._config = self._reg_read(CONFIGURE)
-        self._aa = self._reg_read(AUTO_ACK)
+        if self._stale():
+            self._config = self._reg_read(CONFIGURE)
+            self._aa = self._reg_read(AUTO_ACK)
         if self._aa:
             return 2 if self._config & 4 else 1
         return max(0, ((self._config & 0x0C) >> 2) - 1)
@@ -759,19 +835,23 @@ class RF24:
     @property
     def power(self) -> bool:
         """This `bool` attribute controls the power state of the nRF24L01."""
-        self._config = self._reg_read(CONFIGURE)
+        if self._stale():
+            self._config = self._reg_read(CONFIGURE)
         return bool(self._config & 2)
 
     @power.setter
     def power(self, is_on: bool):
-        self._config = self._reg_read(CONFIGURE) & 0x7D | bool(is_on) << 1
+        if self._rmw_stale():
+            self._config = self._reg_read(CONFIGURE)
+        self._config = self._config & 0x7D | bool(is_on) << 1
         self._reg_write(CONFIGURE, self._config)
         time.sleep(0.00015)
 
     @property
     def pa_level(self) -> int:
         """This `int` is the power amplifier level (in dBm)."""
-        self._rf_setup = self._reg_read(RF_PA_RATE)
+        if self._stale():
+            self._rf_setup = self._reg_read(RF_PA_RATE)
         return (3 - ((self._rf_setup & 6) >> 1)) * -6
 
     @pa_level.setter
@@ -788,53 +868,69 @@ class RF24:
     @property
     def is_lna_enabled(self) -> bool:
         """A read-only `bool` attribute about the LNA gain feature."""
-        self._rf_setup = self._reg_read(RF_PA_RATE)
+        if self._stale():
+            self._rf_setup = self._reg_read(RF_PA_RATE)
         return bool(self._rf_setup & 1)
 
-    def resend(self, send_only: bool = False):
+    def resend(
+        self,
+        send_only: bool = False,
+        deadline_ns: Optional[int] = None,
+        keep_fifo: bool = False,
+    ):
         """Manually re-send the first-out payload from TX FIFO buffers."""
         if self.fifo(True, True):
             return False
+        if deadline_ns is not None and time.monotonic_ns() >= deadline_ns:
+            return None
         self._ce_pin.value = False
         if not send_only and (self._in[0] >> 1) < 6:
             self.flush_rx()
         self.clear_status_flags()
         # self._reg_write(0xE3)
-        up_cnt = 0
         self._ce_pin.value = True
-        while not self._in[0] & 0x30:
-            up_cnt += self.update()
+        if not self._wait_for_tx(deadline_ns):
+            self._tx_timeout(keep_fifo)
+            return None
         # self._ce_pin.value = False
         result = bool(self._in[0] & 0x20)
-        # print("resend did {} updates. flags: {}".format(up_cnt, self._in[0] >> 4))
+        # print("resend did {} updates. flags: {}".format(self.tx_polls, self._in[0] >> 4))
         if result and self._in[0] & 0x40 and not send_only:
             return self.read()
         return result
 
     def write(
         self,
-        buf: Union[bytes, bytearray],
+        buf: Union[bytes, bytearray, memoryview],
         ask_no_ack: bool = False,
         write_only: bool = False,
     ) -> bool:
         """This non-blocking and helper function to `send()` can only handle
         one payload at a time."""
+        buf = self._fit_payload(buf)
+        self._tx_pl_len, self._tx_no_ack = (len(buf), bool(ask_no_ack))
+        self.clear_status_flags()
+        if self._in[0] & 1:
+            return False
+        self._reg_write_bytes(0xA0 | (bool(ask_no_ack) << 4), buf)
+        if not write_only:
+            self._ce_pin.value = True
+        return True
+
+    def _fit_payload(
+        self, buf: Union[bytes, bytearray, memoryview]
+    ) -> Union[bytes, bytearray, memoryview]:
+        """Pad or truncate a payload to fit the static payload length of pipe 0."""
         if not self._dyn_pl & 1:
             buf_len = len(buf)
             pl_len = self._pl_len[0]
             if buf_len < pl_len:
-                buf += b"\0" * (pl_len - buf_len)
+                buf = bytes(buf) + b"\0" * (pl_len - buf_len)
             elif buf_len > pl_len:
                 buf = buf[:pl_len]
         elif not buf or len(buf) > 32:
             raise ValueError("buffer must have a length in range [1, 32]")
-        self.clear_status_flags()
-        if self._in[0] & 1:
-            return False
-        self._reg_write_bytes(0xA0 | (bool(ask_no_ack) << 4), buf)
-        if not write_only:
-            self._ce_pin.value = True
-        return True
+        return buf
 
     def flush_rx(self):
         """Flush all 3 levels of the RX FIFO."""
@@ -875,11 +971,13 @@ class RF24:
         self._rf_setup |= 0x90
         self._reg_write(RF_PA_RATE, self._rf_setup)
         if not self.is_plus_variant:
-            self._reg_write(AUTO_ACK, 0)
-            self._reg_write(SETUP_RETR, 0)
-            self._reg_write_bytes(TX_ADDRESS, b"\xFF" * 5)
+            self._aa, self._retry_setup, self._config = (0, 0, 0x73)
+            self._reg_write(AUTO_ACK, self._aa)
+            self._reg_write(SETUP_RETR, self._retry_setup)
+            self._tx_address[:] = b"\xFF" * 5
+            self._reg_write_bytes(TX_ADDRESS, self._tx_address)
             self._reg_write_bytes(0xA0, b"\xFF" * 32)
-            self._reg_write(CONFIGURE, 0x73)
+            self._reg_write(CONFIGURE, self._config)
             self._ce_pin.value = True
             time.sleep(0.001)
             self._ce_pin.value = False
@@ -0,0 +1,147 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""rf24_async module containing the asyncio wrapper class AsyncRF24"""
+import time
+
+try:
+    from typing import Union, Sequence, Optional, List, Callable
+except ImportError:
+    pass
+try:
+    import asyncio
+except ImportError:  # older MicroPython firmware
+    import uasyncio as asyncio  # type: ignore[import,no-redef]
+from digitalio import DigitalInOut  # type: ignore[import]
+from .rf24 import RF24
+
+
+class AsyncRF24:
+    """An asyncio wrapper that awaits the radio's IRQ flags instead of busy-waiting."""
+
+    def __init__(self, radio: RF24, irq_pin: Optional[DigitalInOut] = None):
+        #: The wrapped `RF24` object.
+        self.radio = radio
+        self._irq_pin = irq_pin
+        if irq_pin is not None:
+            irq_pin.switch_to_input()
+        #: The shortest delay (in seconds) between polling the radio's STATUS byte.
+        self.poll_min: float = 0.0001
+        #: The longest delay (in seconds) between polling the radio's STATUS byte.
+        self.poll_max: float = 0.005
+
+    def __getattr__(self, name: str):
+        return getattr(self.radio, name)
+
+    async def _until(
+        self, condition: Callable[[], bool], timeout: Optional[float] = None
+    ) -> bool:
+        """Yield to the event loop until ``condition()`` is true or time runs out."""
+        if condition():
+            return True
+        delay = self.poll_min
+        end = None if timeout is None else time.monotonic_ns() + int(timeout * 1e9)
+        while end is None or time.monotonic_ns() < end:
+            await asyncio.sleep(delay)
+            if self._irq_pin is None:
+                delay = min(delay * 2, self.poll_max)  # back off the SPI bus
+            elif self._irq_pin.value:
+                continue  # IRQ pin is active LOW
+            if condition():
+                return True
+        return False
+
+    def _tx_done(self) -> bool:
+        return self.radio.update() and (self.radio.irq_ds or self.radio.irq_df)
+
+    async def _wait_for_tx(self):
+        """Await the end of a transmission; a cancelled transmission is aborted."""
+        try:
+            await self._until(self._tx_done)
+        except asyncio.CancelledError:
+            self.radio.ce_pin = False
+            self.radio.flush_tx()
+            raise
+
+    def _irq_asserted(self) -> bool:
+        radio = self.radio
+        return radio.update() and (radio.irq_dr or radio.irq_ds or radio.irq_df)
+
+    async def wait_for_irq(self, timeout: Optional[float] = None) -> bool:
+        """Wait for any of the radio's IRQ flags to be asserted."""
+        return await self._until(self._irq_asserted, timeout)
+
+    async def receive(
+        self, timeout: Optional[float] = None, length: Optional[int] = None
+    ) -> Optional[bytearray]:
+        """Wait for the next payload in the RX FIFO and return it."""
+        if await self._until(self.radio.available, timeout):
+            return self.radio.read(length)
+        return None
+
+    async def send(
+        self,
+        buf: Union[
+            bytes, bytearray, memoryview, Sequence[Union[bytes, bytearray, memoryview]]
+        ],
+        ask_no_ack: bool = False,
+        force_retry: int = 0,
+        send_only: bool = False,
+    ) -> Union[bool, bytearray, List[Union[bool, bytearray]]]:
+        """Transmit payload(s) while yielding to the event loop."""
+        radio = self.radio
+        radio.ce_pin = False
+        if isinstance(buf, (list, tuple)):
+            result = []
+            for byte in buf:
+                result.append(await self.send(byte, ask_no_ack, force_retry, send_only))
+            return result  # type: ignore[return-value]
+        if radio.irq_df or radio.tx_full:
+            radio.flush_tx()
+        if not send_only and radio.pipe is not None:
+            radio.flush_rx()
+        assert isinstance(buf, (bytes, bytearray, memoryview))
+        radio.write(buf, ask_no_ack)
+        await self._wait_for_tx()
+        result = radio.irq_ds  # type: ignore[assignment]
+        while force_retry and not result:
+            result = await self.resend(send_only)  # type: ignore[assignment]
+            force_retry -= 1
+        if radio.irq_dr and radio.irq_ds and not send_only:
+            result = radio.read()  # type: ignore[assignment]
+        return result  # type: ignore[return-value]
+
+    async def resend(self, send_only: bool = False) -> Union[bool, bytearray]:
+        """Re-send the first-out payload from the TX FIFO while yielding to the
+        event loop."""
+        radio = self.radio
+        if radio.fifo(True, True):
+            return False
+        radio.ce_pin = False
+        if not send_only and radio.pipe is not None:
+            radio.flush_rx()
+        radio.clear_status_flags()
+        radio.ce_pin = True
+        await self._wait_for_tx()
+        result = radio.irq_ds
+        if result and radio.irq_dr and not send_only:
+            return radio.read()  # type: ignore[return-value]
+        return result
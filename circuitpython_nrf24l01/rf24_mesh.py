@@ -157,9 +157,7 @@ class RF24MeshNoMaster(NetworkMixin):
                 self.block_less_callback()  # pylint: disable=not-callable
             if time.monotonic_ns() > timeout:
                 return -1
-        if lookup_type == MESH_ADDR_LOOKUP:
-            return struct.unpack("<H", self.frame_buf.message[:2])[0]
-        return self.frame_buf.message[0]
+        return struct.unpack("<h", self.frame_buf.message[:2])[0]
 
     def check_connection(self) -> bool:
         """Check for network connectivity (not for use on master node)."""
@@ -321,12 +319,12 @@ class RF24Mesh(RF24MeshNoMaster):
                 ret_val = 0  # will be -2 for requesting un-assigned nodes
                 if msg_t == MESH_ADDR_LOOKUP:
                     ret_val = self.lookup_address(self.frame_buf.message[0])
-                    self.frame_buf.message = struct.pack("<H", ret_val)
                 else:
                     ret_val = self.lookup_node_id(
                         struct.unpack("<H", self.frame_buf.message[:2])[0]
                     )
-                    self.frame_buf.message = bytes([ret_val])
+                # a signed 2-byte reply (like RF24Mesh) keeps -2 distinct from an ID
+                self.frame_buf.message = struct.pack("<h", ret_val)
                 self._write(self.frame_buf.header.to_node, TX_NORMAL)
             elif msg_t == MESH_ADDR_RELEASE:
                 for n_id, addr in self.dhcp_dict.items():
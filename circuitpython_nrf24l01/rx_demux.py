@@ -0,0 +1,170 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""rx_demux module containing the per-pipe RX demultiplexer class RxDemux"""
+
+try:
+    from typing import Union, Sequence, Optional, Callable
+except ImportError:
+    pass
+from micropython import const
+from .rf24 import RF24
+
+# policies about what a full PipeRing does with a new payload
+DROP_NEWEST = const(0)  #: Discard the new payload.
+DROP_OLDEST = const(1)  #: Overwrite the oldest payload.
+
+
+class PipeRing:
+    """A fixed-size ring buffer of the payloads received on 1 pipe."""
+
+    def __init__(self, capacity: int, overflow: int = DROP_NEWEST):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if overflow not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError("overflow: {} is not a valid policy".format(overflow))
+        #: The policy used when a payload is received while the ring is full.
+        self.overflow = overflow
+        #: The number of payloads discarded (or overwritten) because the ring was full.
+        self.dropped: int = 0
+        self._bufs = [bytearray(32) for _ in range(capacity)]
+        self._lengths = bytearray(capacity)
+        self._head = 0  # index of the oldest payload
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of payloads held by the ring."""
+        return len(self._bufs)
+
+    def push(self, payload: Union[bytes, bytearray, memoryview]) -> bool:
+        """Copy a payload into the ring; returns `False` if it was dropped."""
+        if len(payload) > 32:
+            raise ValueError("payload must have a byte length in range [0, 32]")
+        capacity = len(self._bufs)
+        if self._count == capacity:
+            self.dropped += 1
+            if self.overflow == DROP_NEWEST:
+                return False
+            self._head = (self._head + 1) % capacity
+            self._count -= 1
+        index = (self._head + self._count) % capacity
+        self._bufs[index][: len(payload)] = payload
+        self._lengths[index] = len(payload)
+        self._count += 1
+        return True
+
+    def peek(self) -> Optional[memoryview]:
+        """Get a view of the oldest payload without removing it."""
+        if not self._count:
+            return None
+        return memoryview(self._bufs[self._head])[: self._lengths[self._head]]
+
+    def read(self) -> Optional[bytearray]:
+        """Remove and return (a copy of) the oldest payload."""
+        if not self._count:
+            return None
+        result = self._bufs[self._head][: self._lengths[self._head]]
+        self._pop()
+        return result
+
+    def read_into(self, buf: Union[bytearray, memoryview]) -> int:
+        """Remove the oldest payload and copy it into ``buf``; returns its length."""
+        if not self._count:
+            return 0
+        length = self._lengths[self._head]
+        if len(buf) < length:
+            raise ValueError("buf is too small for a {} byte payload".format(length))
+        buf[:length] = memoryview(self._bufs[self._head])[:length]
+        self._pop()
+        return length
+
+    def _pop(self):
+        self._head = (self._head + 1) % len(self._bufs)
+        self._count -= 1
+
+    def clear(self):
+        """Discard all payloads in the ring."""
+        self._head = self._count = 0
+
+
+class RxDemux:
+    """Route the payloads received by an `RF24` object into a `PipeRing` (or a
+    callback) for each pipe."""
+
+    def __init__(
+        self,
+        radio: RF24,
+        capacity: Union[int, Sequence[int]] = 4,
+        overflow: int = DROP_NEWEST,
+    ):
+        if isinstance(capacity, int):
+            capacity = [capacity] * 6
+        elif len(capacity) != 6:
+            raise ValueError("capacity must be an int or a sequence of 6 ints")
+        #: The managed `RF24` object.
+        self.radio = radio
+        #: The `PipeRing` of each pipe.
+        self.rings = [PipeRing(size, overflow) for size in capacity]
+        self._callbacks: list = [None] * 6
+
+    def set_callback(
+        self, pipe: int, callback: Optional[Callable[[int, memoryview], None]]
+    ):
+        """Call ``callback(pipe, payload)`` for payloads received on a ``pipe``
+        instead of buffering them."""
+        if not 0 <= pipe <= 5:
+            raise IndexError("pipe number must be in range [0, 5]")
+        self._callbacks[pipe] = callback
+
+    def update(self) -> int:
+        """Drain the RX FIFO and route the payloads; returns the number of
+        payloads collected."""
+        burst = self.radio.drain()
+        for i in range(burst.count):
+            pipe, payload = burst[i]
+            callback = self._callbacks[pipe]
+            if callback is None:
+                self.rings[pipe].push(payload)
+            else:
+                callback(pipe, payload)
+        return burst.count
+
+    def available(self, pipe: Optional[int] = None) -> int:
+        """The number of buffered payloads (for 1 or all pipes)."""
+        self.update()
+        if pipe is None:
+            return sum(len(ring) for ring in self.rings)
+        return len(self.rings[pipe])
+
+    def read(self, pipe: int) -> Optional[bytearray]:
+        """Remove and return the oldest payload buffered for a ``pipe``."""
+        if not self.rings[pipe]:
+            self.update()
+        return self.rings[pipe].read()
+
+    @property
+    def dropped(self) -> list:
+        """The number of payloads dropped by each pipe's `PipeRing`."""
+        return [ring.dropped for ring in self.rings]
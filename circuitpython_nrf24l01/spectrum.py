@@ -0,0 +1,192 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""spectrum module containing the channel scanning helpers and the rolling occupancy
+class SpectrumMonitor"""
+import array
+import time
+
+try:
+    from typing import Union, Iterable, Optional, Sequence, Tuple
+    from .rf24 import RF24
+except ImportError:
+    pass
+
+
+def least_occupied(
+    channels: Union[bytes, bytearray], occupancy: Sequence[float]
+) -> Optional[int]:
+    """Get the channel with the lowest occupancy (counting half of the occupancy
+    of its adjacent channels)."""
+    best, best_score = (None, 0.0)
+    count = len(channels)
+    for i in range(count):
+        score = occupancy[i]
+        for j in (i - 1, i + 1):
+            if 0 <= j < count and abs(channels[j] - channels[i]) == 1:
+                score += occupancy[j] / 2
+        if best is None or score < best_score:
+            best, best_score = (channels[i], score)
+    return best
+
+
+class ScanResult:
+    """The signal detections counted by `scan()`."""
+
+    def __init__(self, channels: Union[bytes, bytearray], sweeps: int):
+        #: The scanned channels.
+        self.channels = bytes(channels)
+        #: The number of times each channel was sampled.
+        self.sweeps = sweeps
+        #: The number of samples that detected a signal on each channel.
+        self.hits = array.array("L", [0] * len(channels))
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def ratios(self) -> array.array:
+        """The fraction of samples that detected a signal on each channel."""
+        sweeps = max(1, self.sweeps)
+        return array.array("f", [hits / sweeps for hits in self.hits])
+
+    def cleanest(self) -> Optional[int]:
+        """The channel with the fewest detected signals (and quietest neighbors)."""
+        return least_occupied(self.channels, self.hits)
+
+    def to_numpy(self):
+        """Get a NumPy array with a row of ``(channel, hits, ratio)`` per channel."""
+        # pylint: disable=import-outside-toplevel,import-error
+        import numpy  # type: ignore[import]
+
+        return numpy.array(
+            [self.channels, self.hits, self.ratios()], dtype=numpy.float32
+        ).T
+
+
+def _channels(channels: Optional[Iterable[int]]) -> bytes:
+    channels = bytes(range(126) if channels is None else channels)
+    if not channels or max(channels) > 125:
+        raise ValueError("channels must be in range [0, 125]")
+    return channels
+
+
+def _scan_begin(radio: "RF24") -> Tuple[int, bool, bool, bool]:
+    """Enter RX mode (with CE inactive) for RPD samples; returns the state
+    that `_scan_end()` restores."""
+    state = (radio.channel, radio.power, radio.listen, radio.ce_pin)
+    if not state[2]:
+        radio.listen = True
+    radio.ce_pin = False
+    return state
+
+
+def _sample_rpd(radio: "RF24", channel: int, delay: float) -> bool:
+    """Listen on a channel for ``delay`` seconds; returns the RPD flag."""
+    radio.channel = channel
+    radio.ce_pin = True
+    time.sleep(delay)
+    radio.ce_pin = False  # latches the RPD flag
+    return radio.rpd
+
+
+def _scan_end(radio: "RF24", state: Tuple[int, bool, bool, bool]):
+    radio.channel = state[0]
+    if not state[2]:
+        radio.listen = False
+        if not state[1]:
+            radio.power = False
+    radio.ce_pin = state[3]
+
+
+def scan(
+    radio: "RF24",
+    channels: Optional[Iterable[int]] = None,
+    dwell_us: int = 170,
+    sweeps: int = 1,
+) -> ScanResult:
+    """Count the signals detected (using the radio's ``rpd`` flag) on each channel."""
+    channels = _channels(channels)
+    result = ScanResult(channels, sweeps)
+    hits, delay = (result.hits, dwell_us / 1000000)
+    state = _scan_begin(radio)
+    try:
+        for _ in range(sweeps):
+            for i, channel in enumerate(channels):
+                hits[i] += _sample_rpd(radio, channel, delay)
+    finally:
+        _scan_end(radio, state)
+    return result
+
+
+class SpectrumMonitor:
+    """Keep rolling occupancy statistics of channels by sampling a few channels
+    per call to `update()`."""
+
+    def __init__(
+        self,
+        radio: "RF24",
+        channels: Optional[Iterable[int]] = None,
+        dwell_us: int = 170,
+        smoothing: float = 0.1,
+    ):
+        channels = _channels(channels)
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in range (0, 1]")
+        #: The managed `RF24` object.
+        self.radio = radio
+        #: The monitored channels.
+        self.channels = channels
+        #: The time (in microseconds) spent listening for each sample.
+        self.dwell_us = dwell_us
+        #: The weight of a new sample in the rolling `occupancy`.
+        self.smoothing = smoothing
+        #: The rolling fraction of samples that detected a signal on each channel.
+        self.occupancy = array.array("f", [0.0] * len(channels))
+        #: The number of completed sweeps through the `channels`.
+        self.sweeps: int = 0
+        self._next = 0  # index of the next channel to sample
+        self._state: Optional[
+            Tuple[int, bool, bool, bool]
+        ] = None  # set while monitoring
+
+    def update(self, samples: int = 1) -> None:
+        """Sample the next ``samples`` channels."""
+        radio, occupancy = (self.radio, self.occupancy)
+        if self._state is None:
+            self._state = _scan_begin(radio)
+        delay, weight = (self.dwell_us / 1000000, self.smoothing)
+        for _ in range(samples):
+            i = self._next
+            hit = _sample_rpd(radio, self.channels[i], delay)
+            occupancy[i] += (hit - occupancy[i]) * weight
+            self._next = (i + 1) % len(self.channels)
+            if not self._next:
+                self.sweeps += 1
+
+    def stop(self):
+        """Restore the radio's channel and role (until the next `update()`)."""
+        if self._state is not None:
+            _scan_end(self.radio, self._state)
+            self._state = None
+
+    def cleanest(self) -> Optional[int]:
+        """The channel with the lowest occupancy (and quietest neighbors)."""
+        return least_occupied(self.channels, self.occupancy)
@@ -20,6 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 """This module contains a wrapper class for `spidev.SpiDev` in CPython on Linux"""
+try:
+    import atexit
+except ImportError:  # pragma: no cover
+    atexit = None  # type: ignore[assignment]
 
 
 class SPIDevCtx:
@@ -34,14 +38,22 @@ class SPIDevCtx:
         multiplied by 10, and index ``1`` is the pin number.
     :param int spi_frequency: the SPI frequency to use for the SPI device.
         Defaults to 10MHz.
+    :param bool persistent: Keep the SPI device open between transactions. See
+        `persistent` for more detail. Defaults to `False`.
     """
 
-    def __init__(self, spi, csn, spi_frequency=10000000):
+    _owners = {}  # type: dict
+    """The persistent `SPIDevCtx` (if any) holding each ``SpiDev`` object open."""
+
+    def __init__(self, spi, csn, spi_frequency=10000000, persistent=False):
         self._spi = spi
         self._baudrate = spi_frequency
         self._no_cs = False
         self._bus, self._dev = (0, 0)
         self._csn = csn
+        self._exit_hooked = False
+        #: Keep the SPI device open between transactions (until `close()` is called).
+        self.persistent: bool = persistent
         if isinstance(csn, int):
             self._bus, self._dev = (int(csn / 10), csn % 10)
         else:
@@ -52,8 +64,17 @@ class SPIDevCtx:
             self._csn.switch_to_output()
 
     def __enter__(self):
-        self._spi.open(self._bus, self._dev)
-        self._spi.no_cs = self._no_cs
+        owner = SPIDevCtx._owners.get(id(self._spi))
+        if owner is not self:
+            if owner is not None:  # another device is holding the SpiDev open
+                owner.close()
+            self._spi.open(self._bus, self._dev)
+            self._spi.no_cs = self._no_cs
+            if self.persistent:
+                SPIDevCtx._owners[id(self._spi)] = self
+                if not self._exit_hooked and atexit is not None:
+                    atexit.register(self.close)
+                    self._exit_hooked = True
         if self._no_cs:
             self._csn.value = 0
         return self
@@ -61,9 +82,26 @@ class SPIDevCtx:
     def __exit__(self, *excs):
         if self._no_cs:
             self._csn.value = 1
-        self._spi.close()
+        if not self.persistent:
+            self.close()
         return False
 
+    def close(self):
+        """Close the SPI device. This is automatically called at exit of every
+        transaction unless `persistent` is enabled, in which case it is called
+        when the Python interpreter shuts down."""
+        if SPIDevCtx._owners.get(id(self._spi), self) is self:
+            SPIDevCtx._owners.pop(id(self._spi), None)
+            self._spi.close()
+
+    def cycle_cs(self):
+        """De-assert & re-assert the CSN pin in the middle of a bus session. This
+        does nothing if the CSN pin is controlled by the SPIDEV kernel because
+        ``spidev.SpiDev.xfer2()`` toggles it for every transaction."""
+        if self._no_cs:
+            self._csn.value = 1
+            self._csn.value = 0
+
     def write_readinto(self, out_buf, in_buf, in_end: int = None, out_end: int = None):
         """wraps ``spidev.SpiDev.xfer2()`` into MicroPython compatible
         ``spi.write_readinto()`` calls.
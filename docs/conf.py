@@ -5,6 +5,7 @@ import sys
 
 
 sys.path.insert(0, os.path.abspath(".."))
+sys.path.insert(0, os.path.abspath("../tests"))  # for the simulator module
 
 # -- General configuration ------------------------------------------------
 
@@ -10,6 +10,7 @@ from digitalio import DigitalInOut
 # if running this on a ATSAMD21 M0 based board
 # from circuitpython_nrf24l01.rf24_lite import RF24
 from circuitpython_nrf24l01.rf24 import RF24, address_repr
+from circuitpython_nrf24l01 import spectrum
 
 # invalid default values for scoping
 SPI_BUS, CSN_PIN, CE_PIN = (None, None, None)
@@ -67,31 +68,20 @@ def scan(timeout=30):
     print("\n" + "~" * 126)
 
     signals = [0] * 126  # store the signal count for each channel
-    curr_channel = 0
     start_timer = time.monotonic()  # start the timer
     while time.monotonic() - start_timer < timeout:
-        nrf.channel = curr_channel
-        if nrf.available():
-            nrf.flush_rx()  # flush the RX FIFO because it asserts the RPD flag
-        nrf.listen = 1  # start a RX session
-        time.sleep(0.00013)  # wait 130 microseconds
-        signals[curr_channel] += nrf.rpd  # if interference is present
-        nrf.listen = 0  # end the RX session
-        curr_channel = curr_channel + 1 if curr_channel < 125 else 0
+        result = spectrum.scan(nrf)  # sample every channel once
+        nrf.flush_rx()  # discard any noise received as payloads
+        for i, hits in enumerate(result.hits):
+            signals[i] += hits
 
         # output the signal counts per channel
-        sig_cnt = signals[curr_channel]
         print(
-            ("%X" % min(15, sig_cnt)) if sig_cnt else "-",
-            sep="",
-            end="" if curr_channel < 125 else "\r",
+            "".join([("%X" % min(15, sig)) if sig else "-" for sig in signals]),
+            end="\r",
         )
-    # finish printing results and end with a new line
-    while curr_channel < len(signals) - 1:
-        curr_channel += 1
-        sig_cnt = signals[curr_channel]
-        print(("%X" % min(15, sig_cnt)) if sig_cnt else "-", sep="", end="")
-    print("")
+    print("")  # finish printing results and end with a new line
+    print("cleanest channel:", spectrum.least_occupied(bytes(range(126)), signals))
 
 
 def noise(timeout=1, channel=None):
@@ -1,8 +1,9 @@
 """Monkeypatch for converting SPI transaction into logging functions that store
 registers in a dict."""
 import logging
-from typing import Union, Tuple
+from typing import Callable, Union, Tuple
 import pytest
+from simulator import Medium
 from circuitpython_nrf24l01.rf24 import (
     RF24,
     address_repr,
@@ -232,6 +233,10 @@ class ShimDigitalIO:
         """Dummy function"""
         self.value = value
 
+    def switch_to_input(self, pull=None):  # pylint: disable=unused-argument
+        """Dummy function"""
+        self.value = True
+
 
 @pytest.fixture
 def spi_obj():
@@ -291,3 +296,32 @@ def mesh_obj(
 
     monkeypatch.setattr(mesh._rf24, "send", pseudo_send)
     return mesh
+
+
+@pytest.fixture
+def medium():
+    """creates a simulated RF medium (used as pytest fixture)."""
+    with Medium(seed=1) as sim:
+        yield sim
+
+
+def make_link(medium: Medium, address: bytes = b"1Node") -> Tuple[RF24, RF24]:
+    """create a TX node and an RX node that listens to ``address`` on pipe 1."""
+    tx_node, rx_node = (medium.add_node(RF24), medium.add_node(RF24))
+    rx_node.open_rx_pipe(1, address)
+    rx_node.listen = True
+    tx_node.open_tx_pipe(address)
+    tx_node.listen = False
+    return tx_node, rx_node
+
+
+def serve(medium: Medium, update: Callable, *args, interval: float = 0.0002):
+    """spawn a loop that calls ``update(*args)`` every ``interval`` seconds (in
+    simulated time)."""
+
+    def loop():
+        while True:
+            update(*args)
+            medium.clock.sleep(interval)
+
+    medium.spawn(loop, name=getattr(update, "__name__", "serve"))
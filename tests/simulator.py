@@ -0,0 +1,731 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Brendan Doherty
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""simulator module containing a virtual RF medium for many radios (CPython only)"""
+import heapq
+import random
+import sys
+import threading
+import time
+
+try:
+    from typing import Callable, Dict, List, Optional, Tuple
+except ImportError:
+    pass
+from circuitpython_nrf24l01 import airtime
+
+SETTLING_NS = airtime.TX_SETTLING * 1000
+"""The time (in nanoseconds) a simulated radio takes to switch into TX or RX mode."""
+
+
+class SimulationStopped(Exception):
+    """Raised in a simulated node's thread when its `Medium` is closed."""
+
+
+class _Process:
+    """A thread running a simulated node's code (only 1 runs at any time)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.turn = threading.Event()  # set to let this process run
+        self.token = 0  # identifies the latest scheduled wake up
+        self.thread: Optional[threading.Thread] = None
+
+    def wait_turn(self):
+        """Block until another process hands over to this process."""
+        self.turn.wait()
+        self.turn.clear()
+
+
+class SimClock:
+    """A simulated clock that stands in for the :mod:`time` module."""
+
+    def __init__(self, medium: "Medium"):
+        self._medium = medium
+
+    def monotonic_ns(self) -> int:
+        """The simulated time (in nanoseconds)."""
+        self._medium.advance(self._medium.call_ns)
+        return self._medium.now_ns
+
+    def monotonic(self) -> float:
+        """The simulated time (in seconds)."""
+        return self.monotonic_ns() / 1000000000
+
+    def perf_counter_ns(self) -> int:
+        """Alias of `monotonic_ns()`."""
+        return self.monotonic_ns()
+
+    def sleep(self, seconds: float):
+        """Let the simulated time pass (while other nodes run)."""
+        self._medium.advance(max(0, int(seconds * 1000000000)), block=True)
+
+
+class SimPin:
+    """A simulated digital pin (used for a radio's CE & CSN pins)."""
+
+    def __init__(self, on_change: Optional[Callable[[bool], None]] = None):
+        self._value = False
+        self._on_change = on_change
+
+    @property
+    def value(self) -> bool:
+        """The pin's logic level."""
+        return self._value
+
+    @value.setter
+    def value(self, val: bool):
+        val = bool(val)
+        changed, self._value = (val != self._value, val)
+        if changed and self._on_change is not None:
+            self._on_change(val)
+
+    def switch_to_output(self, value: bool = False, **_):
+        """Set the pin as an output."""
+        self.value = value
+
+    def switch_to_input(self, **_):
+        """Set the pin as an input."""
+
+
+class SimIrqPin:
+    """A simulated (active LOW) IRQ pin of a `SimSpiDev`."""
+
+    def __init__(self, device: "SimSpiDev"):
+        self._device = device
+
+    @property
+    def value(self) -> bool:
+        """The pin's logic level."""
+        dev = self._device
+        return not dev.flags & ~dev.regs[0] & 0x70
+
+    def switch_to_input(self, **_):
+        """Set the pin as an input."""
+
+
+class Transmission:
+    """A packet on air in the simulated `Medium`."""
+
+    def __init__(self, sender, start: int, end: int, address: bytes, payload: bytes):
+        #: The `SimSpiDev` that transmitted this packet.
+        self.sender: SimSpiDev = sender
+        #: When (in nanoseconds) the packet started and ended.
+        self.start, self.end = (start, end)
+        #: The RX address that the packet was sent to.
+        self.address = address
+        #: The packet's payload.
+        self.payload = payload
+        self.channel = sender.regs[5]
+        self.data_rate = sender.data_rate
+        self.crc = sender.crc
+        self.dynamic = sender.dynamic(0)
+        self.no_ack = False
+        self.pid = 0
+
+
+class SimSpiDev:
+    """A simulated nRF24L01+ attached to a `Medium` with a ``SpiDev``-like API."""
+
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
+
+    def __init__(self, medium: "Medium", name: str = ""):
+        self.medium = medium
+        self.name = name
+        self.node = None  # the object that drives this radio
+        self.no_cs = True
+        self.regs = bytearray(0x1E)
+        self.regs[0], self.regs[1], self.regs[2], self.regs[3] = (8, 0x3F, 3, 3)
+        self.regs[4], self.regs[5], self.regs[6] = (3, 2, 0x0F)
+        self.addrs = [bytearray(b"\xE7" * 5), bytearray(b"\xC2" * 5)]
+        self.addrs += [bytearray([0xC3 + i]) for i in range(4)]
+        self.tx_addr = bytearray(b"\xE7" * 5)
+        self.flags = 0  # STATUS bits 4-6
+        self.rx_fifo: List[Tuple[int, bytes]] = []
+        self.tx_fifo: List[list] = []  # [payload, no_ack, ack pipe or None, pid]
+        self.reuse = False
+        self._pid = 0
+        self._last_rx: List[Optional[Tuple[int, bytes]]] = [None] * 6
+        self._busy = 0  # the generation of the ongoing transmission (0 if idle)
+        self._gen = 0
+        self._retries = 0
+        self.rx_since: Optional[int] = None  # when RX mode settled
+        self.ce = SimPin(self._ce_changed)
+        self.csn = SimPin()
+        self.irq = SimIrqPin(self)
+
+    def __repr__(self) -> str:
+        return "<SimSpiDev {}>".format(self.name)
+
+    # ---------------------- SpiDev API
+    def open(self, bus: int, device: int):
+        """Mock opening the SPI bus."""
+        return (bus, device)
+
+    def close(self):
+        """Mock closing the SPI bus."""
+
+    def xfer2(self, out_buf, baud_rate: int = 10000000) -> bytearray:
+        """Perform a SPI transaction."""
+        self.medium.advance(
+            self.medium.spi_overhead_ns
+            + len(out_buf) * 8 * 1000000000 // max(1, baud_rate)
+        )
+        cmd, data = (out_buf[0], bytes(out_buf[1:]))
+        result = bytearray([self.status]) + bytearray(len(data))
+        if cmd < 0x20:
+            value = self._read_reg(cmd)
+            result[1:] = (value + bytes(len(data)))[: len(data)]
+        elif cmd < 0x40:
+            self._write_reg(cmd & 0x1F, data)
+        elif cmd == 0x60:
+            result[1:2] = bytes([len(self.rx_fifo[0][1]) if self.rx_fifo else 0])
+        elif cmd == 0x61:
+            payload = self.rx_fifo.pop(0)[1] if self.rx_fifo else b""
+            result[1:] = (payload + bytes(len(data)))[: len(data)]
+        elif cmd in (0xA0, 0xB0) or 0xA8 <= cmd <= 0xAD:
+            if len(self.tx_fifo) < 3 and data:
+                self._pid = (self._pid + 1) & 3
+                ack_pipe = cmd & 7 if cmd & 8 else None
+                self.tx_fifo.append([data, cmd == 0xB0, ack_pipe, self._pid])
+                self.reuse = False
+                self._try_tx()
+        elif cmd == 0xE1:
+            self.tx_fifo.clear()
+            self.reuse = False
+        elif cmd == 0xE2:
+            self.rx_fifo.clear()
+        elif cmd == 0xE3:
+            self.reuse = True
+        return result
+
+    # ---------------------- register map
+    @property
+    def status(self) -> int:
+        """The STATUS byte."""
+        pipe = self.rx_fifo[0][0] if self.rx_fifo else 7
+        return self.flags | pipe << 1 | (len(self.tx_fifo) >= 3)
+
+    @property
+    def data_rate(self) -> int:
+        """The data rate (``1``, ``2``, or ``250``) used on air."""
+        if self.regs[6] & 0x20:
+            return 250
+        return 2 if self.regs[6] & 8 else 1
+
+    @property
+    def crc(self) -> int:
+        """The number of CRC bytes used on air."""
+        if not self.regs[0] & 8 and not self.regs[1]:
+            return 0  # auto-ack forces the CRC on
+        return 2 if self.regs[0] & 4 else 1
+
+    @property
+    def address_length(self) -> int:
+        """The length of addresses used on air."""
+        return self.regs[3] + 2
+
+    def dynamic(self, pipe: int) -> bool:
+        """Are dynamic payloads used on a pipe?"""
+        return bool(self.regs[0x1D] & 4 and self.regs[0x1C] & 1 << pipe)
+
+    def pipe_address(self, pipe: int) -> bytes:
+        """The address (trimmed to the address length) of an RX pipe."""
+        addr = self.addrs[pipe] + self.addrs[1][1:] if pipe > 1 else self.addrs[pipe]
+        return bytes(addr[: self.address_length])
+
+    @property
+    def listening(self) -> bool:
+        """Is the radio in RX mode?"""
+        return self.regs[0] & 3 == 3 and self.ce.value
+
+    def _read_reg(self, reg: int) -> bytes:
+        if 0x0A <= reg <= 0x10:
+            return bytes(self.tx_addr if reg == 0x10 else self.addrs[reg - 0x0A])
+        if reg == 7:
+            value = self.status
+        elif reg == 8:
+            value = self.regs[8] & 0xF0 | self._retries & 0xF
+        elif reg == 9:
+            value = self.medium.carrier(self)
+        elif reg == 0x17:
+            rx_len, tx_len = (len(self.rx_fifo), len(self.tx_fifo))
+            value = (
+                self.reuse << 6
+                | (tx_len >= 3) << 5
+                | (not tx_len) << 4
+                | (rx_len >= 3) << 1
+                | (not rx_len)
+            )
+        else:
+            value = self.regs[reg] if reg < len(self.regs) else 0
+        return bytes([value])
+
+    def _write_reg(self, reg: int, data: bytes):
+        if not data or reg in (8, 9, 0x17) or reg >= len(self.regs):
+            return
+        if reg == 7:
+            cleared = self.flags & data[0] & 0x70
+            self.flags &= ~cleared
+            if cleared & 0x10:
+                self._try_tx()
+        elif 0x0A <= reg <= 0x10:
+            addr = self.tx_addr if reg == 0x10 else self.addrs[reg - 0x0A]
+            addr[: len(data)] = data[: len(addr)]
+        else:
+            old, self.regs[reg] = (self.regs[reg], data[0])
+            if reg == 0 and (old ^ data[0]) & 3:
+                self._mode_changed()
+            elif reg == 5 and self.listening:
+                self.rx_since = self.medium.now_ns + SETTLING_NS
+
+    # ---------------------- state machine
+    def _ce_changed(self, value: bool):
+        if value:
+            self._mode_changed()
+
+    def _mode_changed(self):
+        if not self.regs[0] & 2:  # powered down: abort any transmission
+            self._gen += 1
+            self._busy, self.rx_since = (0, None)
+        elif self.regs[0] & 1:
+            self.rx_since = self.medium.now_ns + SETTLING_NS if self.ce.value else None
+        else:
+            self.rx_since = None
+            self._try_tx()
+
+    def _try_tx(self):
+        """Start transmitting the next payload in the TX FIFO (if possible)."""
+        if (
+            self._busy
+            or self.regs[0] & 3 != 2
+            or not self.ce.value
+            or self.flags & 0x10
+        ):
+            return
+        for entry in self.tx_fifo:
+            if entry[2] is None:
+                break
+        else:
+            return
+        self._gen += 1
+        self._busy, self._retries = (self._gen, 0)
+        self.medium.schedule(SETTLING_NS, self._transmit, self._gen, entry)
+
+    def _transmit(self, gen: int, entry: list):
+        if gen != self._busy:
+            return
+        now = self.medium.now_ns
+        length = len(entry[0])
+        air_ns = int(
+            airtime.packet_time(length, self.data_rate, self.crc, self.address_length)
+            * 1000
+        )
+        packet = Transmission(
+            self,
+            now,
+            now + air_ns,
+            bytes(self.tx_addr[: self.address_length]),
+            entry[0],
+        )
+        packet.no_ack = entry[1] and bool(self.regs[0x1D] & 1)
+        packet.pid = entry[3]
+        self.medium.put_on_air(packet)
+        delay_ns = air_ns + self.medium.latency_ns
+        self.medium.schedule(delay_ns, self._transmitted, gen, entry, packet)
+
+    def _transmitted(self, gen: int, entry: list, packet: Transmission):
+        if gen != self._busy:
+            return
+        medium = self.medium
+        acks = medium.deliver(packet)
+        if packet.no_ack or not self.regs[1] & 1:
+            self._tx_done(gen, entry, None)
+            return
+        ard_ns = ((self.regs[4] >> 4) + 1) * 250000
+        if not self.regs[2] & 1 or self.pipe_address(0) != packet.address:
+            acks = []  # pipe 0 must be open on the TX address to receive ACKs
+        if len(acks) == 1:  # more than 1 ACK packet would collide
+            ack_ns = medium.latency_ns + SETTLING_NS
+            ack_ns += int(
+                airtime.packet_time(
+                    len(acks[0] or b""), self.data_rate, self.crc, self.address_length
+                )
+                * 1000
+            )
+            if medium.latency_ns + ack_ns <= ard_ns:
+                medium.schedule(ack_ns, self._tx_done, gen, entry, acks[0])
+                return
+        if self._retries < self.regs[4] & 0xF:
+            self._retries += 1
+            medium.stats["retries"] += 1
+            medium.schedule(ard_ns, self._transmit, gen, entry)
+            return
+        self._busy = 0
+        self._set_flags(0x10)
+        self.regs[8] = min(15, (self.regs[8] >> 4) + 1) << 4
+        medium.stats["failed"] += 1
+
+    def _set_flags(self, flags: int):
+        self.flags |= flags
+        self.medium.interrupt(self)
+
+    def _tx_done(self, gen: int, entry: list, ack: Optional[bytes]):
+        if gen != self._busy:
+            return
+        self._busy = 0
+        self._set_flags(0x20)
+        if ack and len(self.rx_fifo) < 3:
+            self.rx_fifo.append((0, ack))
+            self._set_flags(0x40)
+        if not self.reuse and entry in self.tx_fifo:
+            self.tx_fifo.remove(entry)
+        self._try_tx()
+
+    def _tuned_to(self, packet: Transmission) -> bool:
+        """Was this radio listening with the RF settings of a ``packet`` when
+        it started?"""
+        return (
+            self.listening
+            and self.rx_since is not None
+            and self.rx_since <= packet.start
+            and self.regs[5] == packet.channel
+            and self.data_rate == packet.data_rate
+            and self.crc == packet.crc
+        )
+
+    def receive(self, packet: Transmission) -> Tuple[bool, Optional[bytes]]:
+        """Offer a ``packet`` that ended on air; returns whether it is
+        acknowledged and the ACK payload (if any)."""
+        if not self._tuned_to(packet):
+            return (False, None)
+        for pipe in range(6):
+            if self.regs[2] & 1 << pipe and self.pipe_address(pipe) == packet.address:
+                break
+        else:
+            return (False, None)
+        dynamic = self.dynamic(pipe)
+        if dynamic != packet.dynamic or (
+            not dynamic and len(packet.payload) != self.regs[0x11 + pipe]
+        ):
+            return (False, None)
+        if len(self.rx_fifo) >= 3:
+            self.medium.stats["overflows"] += 1
+            return (False, None)
+        auto_ack = bool(self.regs[1] & 1 << pipe) and not packet.no_ack
+        if not auto_ack or self._last_rx[pipe] != (packet.pid, packet.payload):
+            self.rx_fifo.append((pipe, packet.payload))
+            self._set_flags(0x40)
+            self.medium.stats["received"] += 1
+        if not auto_ack:
+            return (False, None)
+        self._last_rx[pipe] = (packet.pid, packet.payload)
+        ack = None
+        if self.regs[0x1D] & 2:
+            for entry in self.tx_fifo:
+                if entry[2] == pipe:
+                    ack = entry[0]
+                    self.tx_fifo.remove(entry)
+                    self._set_flags(0x20)
+                    break
+        return (True, ack)
+
+
+class Medium:
+    """A virtual 2.4 GHz medium that connects many simulated radios.
+
+    :param float loss: The probability (0 to 1) that a packet is lost.
+    :param float latency: The extra delay (in seconds) for a packet to arrive.
+    :param bool collisions: Lose packets that overlap on the same channel.
+    :param int seed: The seed for the pseudo-random packet loss.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        loss: float = 0.0,
+        latency: float = 0.0,
+        collisions: bool = True,
+        seed: Optional[int] = None,
+    ):
+        #: The probability (0 to 1) that a packet is lost.
+        self.loss = loss
+        #: A `dict` of packet loss probabilities for specific links keyed by
+        #: (sender, receiver) node objects.
+        self.link_loss: Dict[tuple, float] = {}
+        #: A `dict` of extra packet loss probabilities (like interference from Wi-Fi)
+        #: keyed by channel.
+        self.channel_loss: Dict[int, float] = {}
+        #: The extra delay (in nanoseconds) for a packet to arrive.
+        self.latency_ns = int(latency * 1000000000)
+        #: Lose packets that overlap on the same channel.
+        self.collisions = collisions
+        #: The simulated time (in nanoseconds) spent by 1 SPI transaction (plus
+        #: the time spent clocking its bytes).
+        self.spi_overhead_ns: int = 50000
+        #: The simulated time (in nanoseconds) spent by 1 call to ``monotonic()``.
+        self.call_ns: int = 1000
+        #: How far (in nanoseconds) a node's code may run ahead of other nodes
+        #: before yielding to them. Larger values simulate faster.
+        self.quantum_ns: int = 100000
+        #: Counters of the simulated traffic.
+        self.stats: Dict[str, int] = dict.fromkeys(
+            (
+                "transmissions",
+                "received",
+                "retries",
+                "failed",
+                "collisions",
+                "lost",
+                "overflows",
+            ),
+            0,
+        )
+        #: The `SimSpiDev` objects attached to this medium.
+        self.devices: List[SimSpiDev] = []
+        #: Exceptions raised by the functions given to `spawn()`.
+        self.errors: List[BaseException] = []
+        self.now_ns = 0
+        self.clock = SimClock(self)
+        self._random = random.Random(seed)
+        self._on_air: List[Transmission] = []
+        self._events: List[tuple] = []
+        self._seq = 0
+        self._main = _Process("main")
+        self._current = self._main
+        self._processes: List[_Process] = []
+        self._patched: List[tuple] = []
+        self._irq_waiters: Dict[SimSpiDev, _Process] = {}
+        self._closed = False
+
+    # ---------------------- simulated time
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def install(self):
+        """Replace the :mod:`time` module used by this library with `clock`."""
+        if self._patched:
+            return
+        for name, module in list(sys.modules.items()):
+            if (
+                name.startswith("circuitpython_nrf24l01")
+                and getattr(module, "time", None) is time
+            ):
+                module.time = self.clock  # type: ignore[attr-defined]
+                self._patched.append((module, time))
+
+    def uninstall(self):
+        """Restore the :mod:`time` module used by this library."""
+        for module, real in self._patched:
+            module.time = real
+        self._patched.clear()
+
+    def close(self):
+        """Stop all spawned nodes and restore the :mod:`time` module."""
+        self._closed = True
+        self._current = self._main
+        self._events = [e for e in self._events if not isinstance(e[2], _Process)]
+        heapq.heapify(self._events)
+        for proc in self._processes:
+            proc.turn.set()
+            if proc.thread is not None:
+                proc.thread.join(1)
+        self._processes.clear()
+        self.uninstall()
+
+    def schedule(self, delay_ns: int, callback: Callable, *args):
+        """Call ``callback(*args)`` after ``delay_ns`` of simulated time."""
+        self._seq += 1
+        heapq.heappush(
+            self._events, (self.now_ns + delay_ns, self._seq, callback, args)
+        )
+
+    def _wake(self, proc: _Process, when: int):
+        """Schedule when a process runs next (replacing its previous schedule)."""
+        self._seq += 1
+        proc.token += 1
+        heapq.heappush(self._events, (when, self._seq, proc, proc.token))
+
+    def _next_event(self) -> Optional[tuple]:
+        """Get the earliest event (skipping outdated wake ups of processes)."""
+        while self._events:
+            event = self._events[0]
+            if not isinstance(event[2], _Process) or event[3] == event[2].token:
+                return event
+            heapq.heappop(self._events)
+        return None
+
+    def advance(self, delta_ns: int, block: bool = False):
+        """Let ``delta_ns`` of simulated time pass for the running node. Other
+        nodes only run if ``block`` is `True` or the `quantum_ns` is exceeded."""
+        if self._closed and self._current is not self._main:
+            raise SimulationStopped()
+        target = self.now_ns + delta_ns
+        event = self._next_event()
+        while event is not None and event[0] <= target:
+            when, _, item, args = event
+            if isinstance(item, _Process):
+                if not block and target - when <= self.quantum_ns:
+                    break
+                self._wake(self._current, target)
+                self._switch()
+                return
+            heapq.heappop(self._events)
+            self.now_ns = max(self.now_ns, when)
+            item(*args)
+            event = self._next_event()
+        self.now_ns = max(self.now_ns, target)
+
+    def _switch(self, wait: bool = True):
+        """Run events until another node is due, then hand over to it."""
+        me = self._current
+        while self._next_event() is not None:
+            when, _, item, args = heapq.heappop(self._events)
+            self.now_ns = max(self.now_ns, when)
+            if not isinstance(item, _Process):
+                item(*args)
+                continue
+            if item is me:
+                return
+            self._current = item
+            item.turn.set()
+            break
+        if not wait:
+            return
+        me.wait_turn()
+        if self._closed and me is not self._main:
+            raise SimulationStopped()
+
+    def spawn(self, func: Callable, *args, name: str = "") -> None:
+        """Run ``func(*args)`` concurrently with the other nodes (in simulated time)."""
+        proc = _Process(name or getattr(func, "__name__", "node"))
+
+        def run():
+            proc.wait_turn()
+            try:
+                if not self._closed:
+                    func(*args)
+            except SimulationStopped:
+                return
+            except Exception as exc:  # pylint: disable=broad-except
+                self.errors.append(exc)
+            if not self._closed:
+                self._processes.remove(proc)
+                self._switch(wait=False)
+
+        proc.thread = threading.Thread(target=run, name=proc.name, daemon=True)
+        self._processes.append(proc)
+        proc.thread.start()
+        self._wake(proc, self.now_ns)
+
+    def wait_irq(self, node, seconds: float) -> bool:
+        """Let up to ``seconds`` of simulated time pass (while other nodes run) until
+        the IRQ pin of a node's radio is asserted; returns `True` if it is asserted.
+        Idle nodes that wait like this are much cheaper to simulate than nodes that
+        poll."""
+        device = self.device(node)
+        if device.irq.value:
+            self._irq_waiters[device] = self._current
+            self.advance(int(seconds * 1000000000), block=True)
+            self._irq_waiters.pop(device, None)
+        return not device.irq.value
+
+    def interrupt(self, device: SimSpiDev):
+        """Wake the node that waits for a radio's IRQ pin (see `wait_irq()`)."""
+        proc = self._irq_waiters.get(device)
+        if proc is not None and not device.irq.value:
+            del self._irq_waiters[device]
+            self._wake(proc, self.now_ns)
+
+    def run(self, seconds: float):
+        """Let the spawned nodes run for ``seconds`` of simulated time."""
+        self.advance(int(seconds * 1000000000), block=True)
+        if self.errors:
+            raise self.errors[0]
+
+    # ---------------------- radios
+    def add_node(self, cls, *args, **kwargs):
+        """Create a ``cls`` object (like `RF24`, `RF24Network` or `RF24Mesh`)
+        that uses a new simulated radio. Other arguments are passed on to ``cls``."""
+        device = SimSpiDev(self, str(len(self.devices)))
+        self.devices.append(device)
+        device.node = cls(device, device.csn, device.ce, *args, **kwargs)
+        return device.node
+
+    def device(self, node) -> SimSpiDev:
+        """Get the `SimSpiDev` used by a node created with `add_node()`."""
+        for device in self.devices:
+            if device.node is node:
+                return device
+        raise ValueError("node is not attached to this medium")
+
+    def put_on_air(self, packet: Transmission):
+        """Start a ``packet``'s transmission."""
+        self.stats["transmissions"] += 1
+        self._on_air = [p for p in self._on_air if p.end > self.now_ns - 10000000]
+        self._on_air.append(packet)
+
+    def carrier(self, device: SimSpiDev) -> bool:
+        """Was any packet on air in a radio's channel since it started listening?"""
+        since = device.rx_since
+        if not device.listening or since is None:
+            return False
+        return any(
+            p.channel == device.regs[5] and p.end > since and p.sender is not device
+            for p in self._on_air
+        )
+
+    def _lost(self, sender: SimSpiDev, receiver: SimSpiDev, channel: int) -> bool:
+        loss = self.link_loss.get((sender.node, receiver.node), self.loss)
+        if loss > 0 and self._random.random() < loss:
+            return True
+        interference = self.channel_loss.get(channel, 0)
+        return interference > 0 and self._random.random() < interference
+
+    def deliver(self, packet: Transmission) -> List[Optional[bytes]]:
+        """Offer a ``packet`` to all radios; returns the ACK payloads of all
+        radios that acknowledged it (`None` for an empty ACK)."""
+        if self.collisions and any(
+            p is not packet
+            and p.channel == packet.channel
+            and p.start < packet.end
+            and p.end > packet.start
+            for p in self._on_air
+        ):
+            self.stats["collisions"] += 1
+            return []
+        acks = []
+        for device in self.devices:
+            if device is packet.sender:
+                continue
+            if self._lost(packet.sender, device, packet.channel):
+                self.stats["lost"] += 1
+                continue
+            acked, ack = device.receive(packet)
+            if acked and not self._lost(device, packet.sender, packet.channel):
+                acks.append(ack)
+        return acks
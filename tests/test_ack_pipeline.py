@@ -0,0 +1,57 @@
+"""Tests related to the AckPayloadPipeline class (using the simulated RF medium)."""
+import pytest
+from simulator import Medium
+from conftest import make_link, serve
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.ack_pipeline import AckPayloadPipeline
+
+
+def test_pipeline(medium: Medium):
+    """test that queued ACK payloads piggyback on every received payload"""
+    rx_node = medium.add_node(RF24)
+    senders = [medium.add_node(RF24) for _ in range(2)]
+    for pipe, (sender, address) in enumerate(zip(senders, (b"1Node", b"2Node")), 1):
+        rx_node.open_rx_pipe(pipe, address)
+        sender.ack = True
+        sender.open_tx_pipe(address)
+        sender.listen = False
+    rx_node.listen = True
+    pipeline = AckPayloadPipeline(rx_node)
+    with pytest.raises(IndexError):
+        pipeline.queue(b"spam", 6)
+    with pytest.raises(ValueError):
+        pipeline.queue(b"", 1)
+    for i in range(6):
+        pipeline.queue(bytes([1, i]), 1)
+        pipeline.queue(bytes([2, i]), 2)
+    assert pipeline.pending() == 12 and pipeline.pending(1) == 6
+
+    serve(medium, pipeline.update)
+    acks = [[], []]
+    for i in range(6):
+        for sender, received in zip(senders, acks):
+            received.append(sender.send(bytes([i]) * 8))
+            medium.clock.sleep(0.001)  # let the pipeline restock the TX FIFO
+    assert acks == [[bytes([n, i]) for i in range(6)] for n in (1, 2)]
+    assert not pipeline.pending()
+    for pipe in (1, 2):
+        stats = pipeline.stats[pipe]
+        assert stats.delivered == 6
+        assert 0 < stats.mean_ns <= stats.max_ns
+    assert len(pipeline.rx_queue) == 12 and pipeline.read()[0] == 1
+
+
+def test_stale_rx_payload(medium: Medium):
+    """test that a payload received before an ACK payload was loaded doesn't
+    count as its delivery"""
+    sender, rx_node = make_link(medium)
+    sender.ack = True
+    pipeline = AckPayloadPipeline(rx_node)
+    assert sender.send(b"early") is True  # acknowledged without an ACK payload
+    pipeline.queue(b"reply", 1)
+    assert not pipeline.update()
+    assert pipeline.pending(1) == 1 and not pipeline.stats[1].delivered
+    assert pipeline.read() == (1, bytearray(b"early"))
+    assert sender.send(b"later") == b"reply"
+    assert pipeline.update() == 1
+    assert not pipeline.pending() and pipeline.stats[1].delivered == 1
@@ -0,0 +1,44 @@
+"""Tests related to the airtime module."""
+import pytest
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01 import airtime
+
+
+@pytest.mark.parametrize(
+    "data_rate,expected",
+    [(1, 329), (2, 164.5), (250, 1316), pytest.param(3, 0, marks=pytest.mark.xfail)],
+)
+def test_packet_time(data_rate: int, expected: float):
+    """test packet_time() for a full 32 byte payload"""
+    assert airtime.packet_time(32, data_rate) == expected
+
+
+def test_transmit_time():
+    """test transmit_time() with and without an ACK packet"""
+    no_ack = airtime.transmit_time(ack=False)
+    assert no_ack == airtime.TX_SETTLING + airtime.packet_time()
+    with_ack = airtime.transmit_time(ack=True)
+    assert with_ack == no_ack + airtime.TX_SETTLING + airtime.packet_time(0)
+    assert airtime.transmit_time(ack_length=32) > with_ack
+    assert airtime.retry_time(arc=15) > airtime.retry_time(arc=0) > with_ack
+    with pytest.raises(TypeError):
+        airtime.transmit_time(ack_payload=True)  # misspelled keyword
+
+
+def test_radio_config(rf24_obj: RF24):
+    """test radio_config() and batch() against a radio's configuration"""
+    config = airtime.radio_config(rf24_obj)
+    assert config["address_length"] == rf24_obj.address_length
+    assert config["ard"] == rf24_obj.ard and config["arc"] == rf24_obj.arc
+    slow = dict(config, data_rate=250)
+    results = airtime.batch([config, slow])
+    assert len(results) == 2
+    link = (config["payload_length"], config["data_rate"], config["crc"])
+    link += (config["address_length"],)
+    assert results[0][0] == airtime.transmit_time(*link, config["ack"])
+    assert results[0][1] == airtime.retry_time(*link, config["ard"], config["arc"])
+    assert results[0][2] > results[1][2]  # throughput
+    no_ack = airtime.batch([dict(config, ack=False)])[0]
+    assert no_ack[1] == no_ack[0] == airtime.transmit_time(*link, False)
+    with pytest.raises(TypeError):
+        airtime.batch([dict(config, ack_payload=True)])
@@ -174,6 +174,7 @@ def test_rx_payload(ble_obj: FakeBLE, inject_rx_payload: pytest.fixture):
     """test available() and read()"""
     buf_repr = inject_rx_payload
     assert ble_obj.available()
+    assert isinstance(ble_obj.rx_cache, bytearray)
     payload = ble_obj.read()
     assert payload.mac == ble_obj.mac
     assert payload.name == "test"
@@ -188,3 +189,13 @@ def test_rx_payload(ble_obj: FakeBLE, inject_rx_payload: pytest.fixture):
     else:  # pragma: no cover
         raise ValueError("ServiceData item not found in decrypted payload")
     assert ble_obj.read() is None
+
+
+def test_rx_bad_crc(ble_obj: FakeBLE, inject_rx_payload: pytest.fixture):
+    """test available() discards a payload with an invalid checksum"""
+    assert inject_rx_payload
+    rx_fifo = ble_obj._spi._spi.state.rx_fifo
+    rx_fifo[-1] = bytearray(rx_fifo[-1])
+    rx_fifo[-1][-1] ^= 0xFF
+    assert not ble_obj.available()
+    assert not ble_obj.rx_cache
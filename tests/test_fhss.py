@@ -0,0 +1,65 @@
+"""Tests related to the frequency hopping link (using the simulated RF medium)."""
+import pytest
+from simulator import Medium
+from conftest import make_link, serve
+from circuitpython_nrf24l01.fhss import HopTable, FhssLink
+
+
+def make_links(medium: Medium, table: HopTable, dwell: int = 0):
+    """create a TX link and an RX link (that is served by a spawned loop)."""
+    tx_node, rx_node = make_link(medium)
+    tx_link, rx_link = (
+        FhssLink(tx_node, table, dwell),
+        FhssLink(rx_node, table, dwell),
+    )
+    serve(medium, rx_link.update)
+    return tx_link, rx_link
+
+
+def test_hop_table():
+    """test that a seed always produces the same sequence of distinct channels"""
+    table = HopTable(7)
+    assert table.channels == HopTable(7).channels != HopTable(8).channels
+    assert sorted(table.channels) == list(range(84))
+    assert len(HopTable(7, length=16)) == 16 and table[84] == table[0]
+    assert sorted(HopTable(1, channels=(3, 40, 77)).channels) == [3, 40, 77]
+    for kwargs in ({"channels": (1, 1)}, {"channels": (126,)}, {"length": 85}):
+        with pytest.raises(ValueError):
+            HopTable(7, **kwargs)  # type: ignore[arg-type]
+
+
+def test_packet_hops(medium: Medium):
+    """test hopping after every packet and finding the sync after a loss"""
+    table = HopTable(7, length=16)
+    tx_link, rx_link = make_links(medium, table)
+    channels = set()
+    for i in range(20):
+        channels.add(tx_link.channel)
+        assert tx_link.send(bytes([i]) * 8)
+        medium.clock.sleep(0.001)
+    assert len(channels) == 16 and rx_link.hops == 20
+    assert rx_link.synced and rx_link.syncs == 1
+    assert [payload[0] for _, payload in rx_link.rx_queue] == list(range(20))
+    medium.link_loss[(tx_link.radio, rx_link.radio)] = 1.0
+    for _ in range(3):
+        assert not tx_link.send(b"lost" * 2)
+    del medium.link_loss[(tx_link.radio, rx_link.radio)]
+    results = []
+    for _ in range(200):
+        results.append(tx_link.send(b"found" * 2))
+        medium.clock.sleep(0.001)
+    assert rx_link.syncs == 2 and all(results[-20:])
+
+
+def test_time_hops(medium: Medium):
+    """test hopping on a time basis through channels with heavy interference"""
+    table = HopTable(7, length=16)
+    for channel in table.channels[:4]:
+        medium.channel_loss[channel] = 0.9
+    tx_link, rx_link = make_links(medium, table, dwell=10)
+    results = []
+    for i in range(100):
+        results.append(tx_link.send(bytes([i]) * 8))
+        medium.clock.sleep(0.002)
+    assert results.count(True) >= 85
+    assert rx_link.syncs == 1 and rx_link.hops > 20
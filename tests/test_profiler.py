@@ -0,0 +1,45 @@
+"""Tests related to the SpiProfiler class."""
+import pytest
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.rf24_network import RF24Network
+from circuitpython_nrf24l01.profiler import SpiProfiler, UNATTRIBUTED
+
+
+def test_profiler(rf24_obj: RF24, capsys: pytest.CaptureFixture):
+    """test attributing SPI transactions to RF24 methods"""
+    spi = rf24_obj._spi
+    profiler = SpiProfiler(rf24_obj)
+    with profiler:
+        assert profiler.enabled
+        rf24_obj.flush_tx()
+        rf24_obj.channel = 5
+        rf24_obj._reg_write(5, 6)  # private methods aren't profiled
+        assert not rf24_obj.read_into(bytearray(32))  # calls any() internally
+    assert not profiler.enabled
+    assert rf24_obj._spi is spi and "flush_tx" not in rf24_obj.__dict__
+    assert type(rf24_obj) is RF24
+    flush = profiler.report["RF24.flush_tx"]
+    assert (flush.calls, flush.transactions, flush.bytes) == (1, 1, 1)
+    assert flush.commands == {0xE1: 1} and flush.elapsed_ns >= 0
+    assert profiler.report["RF24.read_into"].commands == {0x60: 1}
+    assert "RF24.any" not in profiler.report  # nested calls count toward the outer
+    assert profiler.report["RF24.channel"].commands == {0x25: 1}
+    assert profiler.report[UNATTRIBUTED].commands == {0x25: 1}
+    total = profiler.total()
+    assert total.transactions == sum(c.transactions for c in profiler.report.values())
+    profiler.print_report()
+    out, _ = capsys.readouterr()
+    assert "RF24.flush_tx: 1 calls, 1 transactions" in out
+    rf24_obj.flush_tx()  # not recorded after stop()
+    assert profiler.report["RF24.flush_tx"].calls == 1
+    profiler.reset()
+    assert not profiler.report
+
+
+def test_profiler_network(net_obj: RF24Network):
+    """test attributing SPI transactions to network node methods"""
+    with SpiProfiler(net_obj) as profiler:
+        net_obj.update()
+    cost = profiler.report["RF24Network.update"]
+    assert cost.calls == 1 and cost.commands.get(0x60)
+    assert "RF24.read_into" not in profiler.report
@@ -0,0 +1,84 @@
+"""Tests related to the RadioGroup class (using the simulated RF medium)."""
+import pytest
+from simulator import Medium
+from conftest import serve
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.radio_group import RadioGroup
+
+
+def make_group(medium: Medium, count: int, listen: bool) -> RadioGroup:
+    """create a group of radios that use a different channel each."""
+    radios = [medium.add_node(RF24) for _ in range(count)]
+    for i, radio in enumerate(radios):
+        radio.channel = 10 * (i + 1)
+        if listen:
+            radio.open_rx_pipe(1, b"1Node")
+        else:
+            radio.open_tx_pipe(b"1Node")
+        radio.listen = listen
+    return RadioGroup(radios)
+
+
+@pytest.mark.parametrize("count", [1, 3])
+def test_send(medium: Medium, count: int):
+    """test that transmissions are spread across the radios"""
+    receivers, transmitters = (
+        make_group(medium, 3, True),
+        make_group(medium, count, False),
+    )
+    payloads = [bytes([i]) * 32 for i in range(12)]
+
+    serve(medium, receivers.update)
+    start = medium.now_ns
+    assert transmitters.send(payloads) == [True] * len(payloads)
+    elapsed = medium.now_ns - start
+    assert not transmitters.pending
+    medium.run(0.001)  # let the receivers drain the last payload
+    received = receivers.rx_queue
+    assert sorted(payload for _, _, payload in received) == payloads
+    assert {radio for radio, _, _ in received} == set(range(count))
+    assert all(pipe == 1 for _, pipe, _ in received)
+    if count > 1:  # compare with 1 radio transmitting the same payloads
+        single = RadioGroup(transmitters.radios[:1])
+        start = medium.now_ns
+        assert single.send(payloads) == [True] * len(payloads)
+        assert medium.now_ns - start > elapsed * 2
+
+
+def test_queue(medium: Medium):
+    """test queueing a payload for a specific radio"""
+    group = make_group(medium, 2, False)
+    with pytest.raises(IndexError):
+        group.queue(b"spam", radio=2)
+    request = group.queue(b"spam", radio=1)
+    assert not request.done and group.pending == 1
+    while not request.done:
+        group.update()
+    assert request.result is False  # nothing is listening
+    assert group.send(b"spam", radio=0) is False
+
+
+def test_rx_mode(medium: Medium, monkeypatch: pytest.MonkeyPatch):
+    """test that payloads are not queued for radios that only receive"""
+    group = make_group(medium, 2, True)
+    with pytest.raises(ValueError):
+        group.send(b"spam")
+    group.radios[0].listen = False
+    with pytest.raises(ValueError):
+        group.queue(b"spam", radio=1)
+    assert not group.pending
+    # the radio can't start the payload, so send() must not wait forever
+    monkeypatch.setattr(group.radios[0], "write", lambda *args: False)
+    assert group.send([b"spam", b"eggs"]) == [False, False]
+    assert not group.pending
+
+
+def test_timeout(medium: Medium, monkeypatch: pytest.MonkeyPatch):
+    """test that a transmission is aborted if the radio never reports a result"""
+    group = make_group(medium, 1, False)
+    device = medium.device(group.radios[0])
+    monkeypatch.setattr(device, "_try_tx", lambda: None)  # never transmits
+    start = medium.now_ns
+    assert group.send(b"spam") is False
+    assert not group.pending
+    assert medium.now_ns - start < 100000000  # twice the time of 16 attempts
@@ -1,8 +1,19 @@
 """Test functions related to core RF24 functionality."""
+import gc
+import time
+import weakref
 from typing import Optional
 import pytest
-from circuitpython_nrf24l01.rf24 import RF24
+from conftest import ShimSpiDev, ShimDigitalIO
+from circuitpython_nrf24l01.rf24 import (
+    RF24,
+    SHADOW_TRUST,
+    SHADOW_VERIFY,
+    SHADOW_RESYNC,
+)
 from circuitpython_nrf24l01.fake_ble import FakeBLE
+from circuitpython_nrf24l01.radio_profile import RadioProfile
+from circuitpython_nrf24l01.wrapper import SPIDevCtx
 
 
 def test_context(rf24_obj: RF24, ble_obj: FakeBLE):
@@ -104,6 +115,139 @@ def test_read(rf24_obj: RF24, dyn_pl):
     assert rf24_obj.any() == 0
 
 
+def test_read_into(rf24_obj: RF24):
+    """test read_into() and read_view()"""
+    buf = bytearray(34)
+    assert rf24_obj.read_into(buf) == 0
+    assert rf24_obj.read_view() is None
+    inject_rx_fifo(rf24_obj)
+    with pytest.raises(ValueError):
+        rf24_obj.read_into(buf, offset=3)
+    assert rf24_obj.read_into(buf, offset=2) == 32
+    assert buf == bytearray(2) + b"\xFF" * 32
+    inject_rx_fifo(rf24_obj)
+    view = rf24_obj.read_view()
+    assert isinstance(view, memoryview) and view == b"\xFF" * 32
+    with pytest.raises(ValueError):
+        rf24_obj.read_view(33)
+
+
+@pytest.mark.parametrize("dyn_pl", [True, False])
+def test_drain(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch, dyn_pl: bool):
+    """test drain() and read_all()"""
+    rf24_obj.dynamic_payloads = dyn_pl
+    assert not rf24_obj.drain() and rf24_obj.read_all() == []
+    for _ in range(3):
+        inject_rx_fifo(rf24_obj)
+    sessions = []
+    monkeypatch.setattr(
+        rf24_obj._spi._spi, "open", lambda bus, dev: sessions.append((bus, dev))
+    )
+    burst = rf24_obj.drain()
+    assert len(sessions) == 1
+    assert len(burst) == 3
+    for pipe, payload in burst:
+        assert pipe == 2 and payload == b"\xFF" * 32
+    with pytest.raises(IndexError):
+        burst[3]  # pylint: disable=pointless-statement
+    assert not rf24_obj.available() and not rf24_obj.irq_dr
+    inject_rx_fifo(rf24_obj)
+    assert rf24_obj.read_all() == [(2, bytearray(b"\xFF" * 32))]
+
+
+@pytest.mark.parametrize("max_retries", [0, 2])
+def test_stream(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch, max_retries: int):
+    """test stream() against a fake link that drops some payloads"""
+    state = rf24_obj._spi._spi.state
+    fails = {3: 1, 5: 5}  # payload number: how many times it exhausts auto-retries
+    received = []
+
+    def sync_fifo_flags():
+        full = len(state.tx_fifo) >= 3
+        state.registers[7][0] = state.registers[7][0] & 0xFE | full
+        state.registers[0x17][0] &= 0xCF
+        state.registers[0x17][0] |= full << 5 | (not state.tx_fifo) << 4
+
+    def tx_payload(payload):  # a W_TX_PAYLOAD is discarded when TX FIFO is full
+        status = bytearray(state.registers[7])
+        if len(state.tx_fifo) < 3:
+            state.tx_fifo.append(bytes(payload))
+        sync_fifo_flags()
+        return status + bytes(len(payload))
+
+    def transmit(*_):  # transmit 1 payload per NOP while CE pin is active
+        if rf24_obj.ce_pin and state.tx_fifo and not state.registers[7][0] & 0x10:
+            number = state.tx_fifo[0][0]
+            if fails.get(number):
+                fails[number] -= 1
+                state.registers[7][0] |= 0x10
+            else:
+                received.append(state.tx_fifo.pop(0)[0])
+                state.registers[7][0] |= 0x20
+                sync_fifo_flags()
+        return state.registers[7]
+
+    monkeypatch.setitem(state.commands, 0xA0, tx_payload)
+    monkeypatch.setitem(state.commands, 0xFF, transmit)
+    result = rf24_obj.stream([bytes([i]) for i in range(1, 9)], max_retries=max_retries)
+    assert len(result) == 8 and result.elapsed_ns > 0
+    dropped = [3, 5] if not max_retries else [5]
+    assert received == [i for i in range(1, 9) if i not in dropped]
+    assert result.success == [i + 1 not in dropped for i in range(8)]
+    assert result.retries[2] == 1 and result.retries[4] == max_retries + 1
+    assert not rf24_obj.ce_pin
+
+
+@pytest.mark.parametrize("ask_no_ack", [False, True])
+def test_airtime_wait(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch, ask_no_ack):
+    """test that send() sleeps through the expected on-air time"""
+    state = rf24_obj._spi._spi.state
+    done_at = []
+
+    def tx_payload(payload):  # fake an on-air time of 1 ms
+        done_at.append(time.monotonic_ns() + 1000000)
+        return state.registers[7] + (b"\0" * len(payload))
+
+    def non_op(*_):
+        if done_at and time.monotonic_ns() >= done_at[-1]:
+            state.registers[7][0] |= 0x20
+        return state.registers[7]
+
+    monkeypatch.setitem(state.commands, 0xA0, tx_payload)
+    monkeypatch.setitem(state.commands, 0xB0, tx_payload)
+    monkeypatch.setitem(state.commands, 0xFF, non_op)
+    rf24_obj.data_rate = 250  # a 32 byte payload takes ~1.5 ms at 250 kbps
+    rf24_obj.airtime_wait = False
+    assert rf24_obj.send(b"\xFF" * 32, ask_no_ack=ask_no_ack)
+    spin_polls = rf24_obj.tx_polls
+    assert not rf24_obj.tx_polls_saved
+    rf24_obj.airtime_wait = True
+    assert rf24_obj.send(b"\xFF" * 32, ask_no_ack=ask_no_ack)
+    assert rf24_obj.tx_polls < spin_polls
+    assert rf24_obj.tx_polls_saved > 0
+
+
+@pytest.mark.parametrize("airtime_wait", [True, False])
+@pytest.mark.parametrize("keep_fifo", [True, False])
+def test_send_deadline(rf24_obj: RF24, airtime_wait: bool, keep_fifo: bool):
+    """test that send() and resend() give up on a wedged radio"""
+    state = rf24_obj._spi._spi.state
+    rf24_obj.airtime_wait = airtime_wait
+    deadline = time.monotonic_ns() + 2000000
+    result = rf24_obj.send(b"\xFF" * 32, deadline_ns=deadline, keep_fifo=keep_fifo)
+    assert result is None
+    assert time.monotonic_ns() >= deadline
+    assert not rf24_obj.ce_pin
+    assert bool(state.tx_fifo) is keep_fifo
+    if keep_fifo:
+        deadline = time.monotonic_ns() + 1000000
+        assert rf24_obj.resend(deadline_ns=deadline, keep_fifo=False) is None
+        assert not state.tx_fifo
+    # an expired deadline doesn't start any transmissions
+    assert rf24_obj.send([b"\xFF"] * 2, deadline_ns=deadline) == [None] * 2
+    assert not state.tx_fifo
+
+
 def test_tx_full(rf24_obj: RF24):
     """test tx_full attribute"""
     assert not rf24_obj.tx_full
@@ -274,6 +418,22 @@ def test_address(rf24_obj: RF24, pipe: int):
         assert rf24_obj.address(pipe) == addr
 
 
+def test_open_tx_pipe_skip(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test that open_tx_pipe() skips writing an already loaded address"""
+    sessions = []
+    monkeypatch.setattr(
+        rf24_obj._spi._spi, "open", lambda bus, dev: sessions.append((bus, dev))
+    )
+    rf24_obj.open_tx_pipe(b"1Node")
+    assert len(sessions) == 2  # RX_ADDR_P0 (for auto-ack) & TX_ADDRESS
+    sessions.clear()
+    rf24_obj.open_tx_pipe(bytearray(b"1Node"))
+    assert not sessions
+    rf24_obj.open_tx_pipe(b"2Node")
+    assert len(sessions) == 2
+    assert rf24_obj.address() == b"2Node" and rf24_obj.address(0) == b"2Node"
+
+
 def test_rpd(rf24_obj: RF24):
     """test rpd attribute"""
     assert not rf24_obj.rpd
@@ -298,3 +458,246 @@ def test_carrier_functions(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
     assert not rf24_obj.power
     assert not rf24_obj.ce_pin
     assert not rf24_obj._spi._spi.state.registers[6][0] & 0x90
+
+
+def test_batch(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test batch() coalesces register writes into 1 bus session"""
+    sessions = []
+    state = rf24_obj._spi._spi.state
+    monkeypatch.setattr(
+        rf24_obj._spi._spi, "open", lambda bus, dev: sessions.append((bus, dev))
+    )
+    channel = 100 if rf24_obj.channel != 100 else 101
+    sessions.clear()
+    with rf24_obj.batch():
+        rf24_obj.channel = channel
+        rf24_obj.arc = 3
+        with rf24_obj.batch():  # nested blocks flush with the outermost block
+            rf24_obj.crc = 1
+        assert state.registers[5][0] != channel  # writes are deferred
+    assert len(sessions) == 1
+    assert state.registers[5][0] == channel
+    assert state.registers[4][0] & 0x0F == 3
+    assert state.registers[0][0] & 0x0C == 8
+
+    sessions.clear()
+    with rf24_obj.batch():
+        rf24_obj.channel = 76
+        assert rf24_obj.channel == 76  # reads flush deferred writes first
+    assert len(sessions) == 2
+
+
+def test_context_burst(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test that entering the context manager uses 1 bus session"""
+    sessions = []
+    monkeypatch.setattr(
+        rf24_obj._spi._spi, "open", lambda bus, dev: sessions.append((bus, dev))
+    )
+    with rf24_obj:
+        assert len(sessions) == 1
+
+
+def test_context_diff(
+    rf24_obj: RF24, ble_obj: FakeBLE, monkeypatch: pytest.MonkeyPatch
+):
+    """test that entering the context manager only writes changed registers"""
+    writes = []
+    xfer2 = rf24_obj._spi._spi.xfer2
+
+    def record(out_buf, baud_rate):
+        if 0x20 <= out_buf[0] < 0x40:
+            writes.append(out_buf[0] & 0x1F)
+        return xfer2(out_buf, baud_rate)
+
+    monkeypatch.setattr(rf24_obj._spi._spi, "xfer2", record)
+    with rf24_obj:
+        pass
+    writes.clear()
+    with rf24_obj:  # only the CONFIG register changed (powered down on exit)
+        assert writes == [0]
+    with ble_obj:
+        pass
+    writes.clear()
+    with rf24_obj as nrf:
+        assert 0 < len(writes) < 20
+        assert nrf.address_length == 5 and nrf.dynamic_payloads == 0x3F
+    nrf.resync()
+    writes.clear()
+    with rf24_obj:  # all registers are rewritten after resync()
+        assert len(writes) > 20
+
+
+def test_context_power_up(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test that entering the context manager only waits if the radio powers up"""
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    with rf24_obj:
+        assert sleeps == [0.00015]
+        sleeps.clear()
+        with rf24_obj:  # already powered up
+            assert not sleeps
+
+
+def test_chip_image():
+    """test that a radio's register image is shared by objects on the same bus & CSN
+    pin, and that it doesn't outlive the bus"""
+    bus, csn = (ShimSpiDev(), ShimDigitalIO())
+    nrf = RF24(bus, csn, ShimDigitalIO())
+    assert RF24(bus, csn, ShimDigitalIO())._image is nrf._image
+    assert RF24(ShimSpiDev(), csn, ShimDigitalIO())._image is not nrf._image
+    bus_ref = weakref.ref(bus)
+    del bus, nrf
+    gc.collect()
+    assert bus_ref() is None
+
+
+def test_apply_profile(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test loading a RadioProfile and (de)serializing it"""
+    long_range = RadioProfile(
+        channel=10,
+        data_rate=250,
+        pa_level=0,
+        ard=4000,
+        arc=15,
+        ack=True,
+        tx_address=b"1Node",
+        rx_pipes={1: b"2Node", 2: b"3"},
+    )
+    high_rate = RadioProfile(channel=100, data_rate=2, arc=2, tx_address=b"1Node")
+    sessions = []
+    monkeypatch.setattr(
+        rf24_obj._spi._spi, "open", lambda bus, dev: sessions.append((bus, dev))
+    )
+    rf24_obj.apply_profile(long_range)
+    assert len(sessions) == 1
+    assert rf24_obj.channel == 10 and rf24_obj.data_rate == 250
+    assert rf24_obj.ack and rf24_obj.get_auto_retries() == (4000, 15)
+    assert rf24_obj.address(0) == b"1Node" and rf24_obj.address(1) == b"2Node"
+    assert rf24_obj.address(2) == b"3Node"
+    sessions.clear()
+    rf24_obj.apply_profile(long_range)
+    assert not sessions  # nothing changed
+    restored = RadioProfile.from_bytes(bytearray(high_rate.to_bytes()))
+    assert restored.to_bytes() == high_rate.to_bytes()
+    rf24_obj.apply_profile(restored)
+    assert rf24_obj.channel == 100 and rf24_obj.data_rate == 2
+    assert not rf24_obj.ack and rf24_obj.arc == 2
+    for kwargs in ({"channel": 126}, {"data_rate": 3}, {"address_length": 2}):
+        with pytest.raises(ValueError):
+            RadioProfile(**kwargs)  # type: ignore[arg-type]
+    with pytest.raises(IndexError):
+        RadioProfile(rx_pipes={6: b"1Node"})
+    with pytest.raises(TypeError):
+        RadioProfile(chanel=10)
+    with pytest.raises(ValueError):
+        RadioProfile.from_bytes(high_rate.to_bytes()[:-1])
+
+
+def test_apply_profile_non_plus(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test that a RadioProfile re-activates the features of non-plus variants"""
+    profile = RadioProfile(channel=10, tx_address=b"1Node")
+    activations = []
+    monkeypatch.setattr(rf24_obj, "_activate_features", lambda: activations.append(1))
+    rf24_obj.apply_profile(profile)
+    assert not activations  # plus variants don't need the ACTIVATE command
+    rf24_obj._is_plus_variant = False
+    rf24_obj.apply_profile(profile)
+    assert len(activations) == 1
+    rf24_obj.address(0)[0] = 0  # the profile's addresses aren't borrowed
+    assert profile.pipes[0] == b"1Node" and profile.tx_address == b"1Node"
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+def test_spidev_opens_per_send(
+    spi_obj, monkeypatch: pytest.MonkeyPatch, persistent: bool
+):
+    """count how many times the SPI device is opened for 1 call to send()"""
+    spi, csn, ce_pin = spi_obj
+    opens = []
+    monkeypatch.setattr(spi, "open", lambda bus, dev: opens.append((bus, dev)))
+    radio = RF24(SPIDevCtx(spi, csn, persistent=persistent), None, ce_pin)
+
+    def tx_complete(payload):  # fake a successful transmission
+        spi.state.registers[7][0] |= 0x20
+        return spi.state.registers[7] + (b"\0" * len(payload))
+
+    monkeypatch.setitem(spi.state.commands, 0xA0, tx_complete)
+    opens.clear()
+    assert radio.send(b"\xFF" * 32)
+    if persistent:
+        assert not opens
+    else:
+        assert len(opens) >= 2  # 1 per SPI transaction
+    radio._spi.close()
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        SHADOW_TRUST,
+        SHADOW_VERIFY,
+        SHADOW_RESYNC,
+        pytest.param(4, marks=pytest.mark.xfail),
+    ],
+)
+def test_shadow_policy(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch, policy: int):
+    """test getters don't read registers when trusting the shadow copies"""
+    rf24_obj.shadow_policy = policy
+    rf24_obj.resync_interval = 60000
+    rf24_obj.pa_level = -12
+    rf24_obj.data_rate = 2
+    rf24_obj.open_rx_pipe(2, b"3")
+    assert rf24_obj.power is not None  # let SHADOW_RESYNC do its first refresh
+    reads = []
+    read_reg = rf24_obj._reg_read
+    monkeypatch.setattr(
+        rf24_obj, "_reg_read", lambda reg: reads.append(reg) or read_reg(reg)
+    )
+    assert rf24_obj.pa_level == -12
+    assert rf24_obj.data_rate == 2
+    assert rf24_obj.is_lna_enabled
+    assert rf24_obj.channel == rf24_obj._spi._spi.state.registers[5][0]
+    assert rf24_obj.address_length == 5
+    assert rf24_obj.crc == 2
+    assert rf24_obj.auto_ack == 0x3F
+    assert rf24_obj.dynamic_payloads == 0x3F
+    assert rf24_obj.get_payload_length(2) == 32
+    assert rf24_obj.get_auto_retries() == (1500, 15)
+    assert not reads
+    rf24_obj.close_rx_pipe(2)
+    rf24_obj.set_auto_ack(False, 2)
+    if policy == SHADOW_VERIFY:
+        assert reads == [2, 1]  # only read back what was written
+    else:
+        assert not reads
+
+
+def test_shadow_resync(rf24_obj: RF24):
+    """test SHADOW_RESYNC periodically refreshes the shadow copies"""
+    rf24_obj.shadow_policy = SHADOW_TRUST
+    rf24_obj.channel = 42
+    rf24_obj._spi._spi.state.registers[5][0] = 24  # changed without the driver
+    assert rf24_obj.channel == 42
+    rf24_obj.shadow_policy = SHADOW_RESYNC
+    rf24_obj.resync_interval = 0
+    assert rf24_obj.channel == 24
+
+
+def test_shadow_verify(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test SHADOW_VERIFY detects register writes that didn't stick"""
+    spi = rf24_obj._spi._spi
+    xfer = spi.xfer2
+
+    def ignore_channel(out_buf, baud_rate):
+        if out_buf[0] == 0x25:  # write to RF_CH register
+            return spi.state.registers[7]
+        return xfer(out_buf, baud_rate)
+
+    rf24_obj.shadow_policy = SHADOW_VERIFY
+    rf24_obj.channel = 10
+    monkeypatch.setattr(spi, "xfer2", ignore_channel)
+    with pytest.raises(RuntimeError):
+        rf24_obj.channel = 11
+    with pytest.raises(RuntimeError):
+        with rf24_obj.batch():
+            rf24_obj.channel = 12
@@ -0,0 +1,96 @@
+"""Tests related to the AsyncRF24 class."""
+import asyncio
+from typing import List
+import pytest
+from conftest import ShimDigitalIO
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.rf24_async import AsyncRF24
+
+# pylint: disable=redefined-outer-name
+
+
+def finish_tx_after(
+    radio: RF24, monkeypatch: pytest.MonkeyPatch, polls: int, flag: int
+):
+    """Make the fake radio assert a TX IRQ ``flag`` after a number of NOP commands."""
+    state = radio._spi._spi.state
+    count: List[int] = []
+
+    def non_op(*_):
+        count.append(1)
+        if len(count) >= polls:
+            state.registers[7][0] |= flag
+        return state.registers[7]
+
+    monkeypatch.setitem(state.commands, 0xFF, non_op)
+    return count
+
+
+@pytest.mark.parametrize("flag,expected", [(0x20, True), (0x10, False)])
+def test_send(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch, flag, expected):
+    """test that send() yields to the event loop while waiting"""
+    radio = AsyncRF24(rf24_obj)
+    finish_tx_after(rf24_obj, monkeypatch, 4, flag)
+    ticks: List[int] = []
+
+    async def ticker(task):
+        while not task.done():
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(radio.send(b"\xFF" * 32, send_only=True))
+        await ticker(task)
+        return task.result()
+
+    assert asyncio.run(main()) is expected
+    assert ticks
+
+
+def test_send_list(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test send() with multiple payloads"""
+    radio = AsyncRF24(rf24_obj)
+    finish_tx_after(rf24_obj, monkeypatch, 1, 0x20)
+    assert asyncio.run(radio.send([b"\xFF"] * 2, send_only=True)) == [True] * 2
+
+
+def test_send_memoryview(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test send() accepts a memoryview like RF24.send() does"""
+    radio = AsyncRF24(rf24_obj)
+    finish_tx_after(rf24_obj, monkeypatch, 1, 0x20)
+    view = memoryview(bytearray(b"\xFF" * 64))[:32]
+    assert asyncio.run(radio.send(view, send_only=True)) is True
+
+
+def test_receive(rf24_obj: RF24):
+    """test receive()"""
+    radio = AsyncRF24(rf24_obj)
+    assert radio.listen is False  # attributes are forwarded to the RF24 object
+    assert asyncio.run(radio.receive(timeout=0.001)) is None
+    state = rf24_obj._spi._spi.state
+    state.rx_fifo.append(bytearray(b"\xFF" * 32))
+    state.registers[7][0] &= 0xF1
+    state.registers[7][0] |= 4
+    assert asyncio.run(radio.receive(timeout=0.001)) == bytearray(b"\xFF" * 32)
+
+
+def test_wait_for_irq(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test wait_for_irq() with and without an IRQ pin"""
+    irq_pin = ShimDigitalIO()
+    radio = AsyncRF24(rf24_obj, irq_pin)
+    polls = finish_tx_after(rf24_obj, monkeypatch, 1000, 0x20)
+    assert not asyncio.run(radio.wait_for_irq(timeout=0.002))
+    assert len(polls) == 1  # IRQ pin is inactive, so the STATUS byte isn't polled
+    irq_pin.value = False  # IRQ pin is active
+    radio._irq_pin = None
+    polls.extend([1] * 1000)
+    assert asyncio.run(radio.wait_for_irq(timeout=0.002))
+
+
+def test_send_cancelled(rf24_obj: RF24):
+    """test that a cancelled send() aborts the transmission"""
+    radio = AsyncRF24(rf24_obj)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(radio.send(b"\xFF" * 32), 0.002))
+    assert not rf24_obj.ce_pin
+    assert not rf24_obj._spi._spi.state.tx_fifo
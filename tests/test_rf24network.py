@@ -13,6 +13,7 @@ from circuitpython_nrf24l01.network.constants import (
     MAX_FRAG_SIZE,
     AUTO_ROUTING,
     NETWORK_MULTICAST_ADDR,
+    TX_NORMAL,
 )
 
 
@@ -169,6 +170,18 @@ def test_context(spi_obj):
         assert net_b.address_suffix == bytearray(b"\xDD\x99\xB6\xD9\x9D\x66")
 
 
+def test_begin_burst(net_obj: RF24Network, monkeypatch: pytest.MonkeyPatch):
+    """test that assigning a node_address configures the pipes in 1 bus session"""
+    sessions = []
+    monkeypatch.setattr(
+        net_obj._rf24._spi._spi, "open", lambda bus, dev: sessions.append((bus, dev))
+    )
+    net_obj.node_address = 0o15
+    # CONFIGURE (listen = False), the batched pipe setup, CONFIGURE (listen = True)
+    assert len(sessions) == 3
+    assert net_obj._rf24._spi._spi.state.registers[2][0] == 0x3F
+
+
 @pytest.mark.parametrize(
     "logical",
     [0o0, 0o1, 0o12, 0o123, 0o1234, pytest.param(0o20, marks=pytest.mark.xfail)],
@@ -245,6 +258,47 @@ def test_write(net_obj: RF24Network, to_node: int, direction: int, size: int):
     )
 
 
+def test_write_fragments(net_obj: RF24Network, monkeypatch: pytest.MonkeyPatch):
+    """test that fragments are staged in the pre-allocated TX buffer."""
+    sent = []
+
+    def send(buf, *args, **kwargs):
+        # a full frame is the whole buffer; a shorter frame is a view of it
+        assert (buf if isinstance(buf, bytearray) else buf.obj) is net_obj._tx_buf
+        sent.append(bytes(buf))
+        return True
+
+    monkeypatch.setattr(net_obj._rf24, "send", send)
+    message = bytes(range(net_obj.max_message_length))
+    assert net_obj.send(RF24NetworkHeader(0o4, 1), message)
+    assert len(sent) == 6
+    queue = FrameQueueFrag()
+    for buf in sent:
+        frame = RF24NetworkFrame()
+        assert frame.unpack(buf)
+        assert queue.enqueue(frame)
+    frame = queue.dequeue()
+    assert frame.message == message and frame.header.message_type == 1
+
+
+def test_route_cache(net_obj: RF24Network):
+    """test the cached Physical Addresses & next hops"""
+    addr = net_obj._pipe_address(0o14, 5)
+    assert net_obj._pipe_address(0o14, 5) is addr  # cached
+    assert addr == net_obj._make_pipe_address(0o14, 5)
+    route = net_obj._logi_2_phys(0o14, TX_NORMAL)
+    assert net_obj._logi_2_phys(0o14, TX_NORMAL) is route
+    assert net_obj._logi_2_phys(0o14, TX_NORMAL, True)[2]
+    net_obj.address_prefix = b"\xDB"
+    assert net_obj._pipe_address(0o14, 5) != addr  # invalidated
+    net_obj.address_suffix = net_obj.address_suffix  # invalidated (same value)
+    with pytest.raises(TypeError):  # only the setters can change the addresses
+        net_obj.address_suffix[0] = 0  # type: ignore[index]
+    assert net_obj._pipe_address(0o14, 5) == net_obj._make_pipe_address(0o14, 5)
+    net_obj.node_address = 0o4  # invalidates the routes
+    assert net_obj._logi_2_phys(0o14, TX_NORMAL) == (0o14, 5, False)
+
+
 @pytest.mark.parametrize("level", [None, 4])
 @pytest.mark.parametrize("size", [4, MAX_FRAG_SIZE + 1])
 def test_multicast(net_obj: RF24Network, level: Optional[int], size: int):
@@ -253,3 +307,39 @@ def test_multicast(net_obj: RF24Network, level: Optional[int], size: int):
     net_obj.fragmentation = False
     net_obj.max_message_length = MAX_FRAG_SIZE * 2
     assert net_obj.multicast(b"\0" * size, "T", level)
+
+
+def test_update(net_obj: RF24Network):
+    """test update() reads received frames into the pre-allocated RX buffer."""
+    frame = RF24NetworkFrame(RF24NetworkHeader(0, 1), b"1234")
+    frame.header.from_node = 0o1
+    state = net_obj._rf24._spi._spi.state
+    state.registers[0x11][0] = len(frame)  # tell the fake RX FIFO the payload width
+    for _ in range(2):
+        state.rx_fifo.append(bytearray(frame.pack()))
+        state.registers[7][0] &= 0xF1
+        state.registers[7][0] |= 2
+        assert net_obj.update() == 1
+        assert isinstance(net_obj.frame_buf.message, memoryview)
+        assert net_obj.frame_buf.message == b"1234"
+        assert net_obj.available()
+        received = net_obj.read()
+        assert received is not None and received.message == b"1234"
+        assert not isinstance(received.message, memoryview)
+
+
+def test_read_into(net_obj: RF24Network):
+    """test that read() returns a frame the queue won't overwrite and that
+    read_into() copies the next frame into the caller's frame."""
+    for i in range(net_obj.queue.max_queue_size):
+        frame = RF24NetworkFrame(RF24NetworkHeader(0, 1), bytes([i]))
+        assert net_obj.queue.enqueue(frame)
+    received = net_obj.read()
+    assert received is not None and received.message == b"\x00"
+    frame_id = received.header.frame_id
+    assert net_obj.queue.enqueue(RF24NetworkFrame(RF24NetworkHeader(0, 1), b"new"))
+    assert received.message == b"\x00" and received.header.frame_id == frame_id
+    assert net_obj.read_into(frame) and frame.message == b"\x01"
+    while net_obj.available():
+        net_obj.read()
+    assert not net_obj.read_into(frame)
@@ -0,0 +1,71 @@
+"""Tests related to the RxDemux class (using the simulated RF medium)."""
+import pytest
+from simulator import Medium
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.rx_demux import RxDemux, PipeRing, DROP_OLDEST
+
+ADDRESSES = [
+    b"\x78" * 5,
+    b"\xF1\xB6\xB5\xB4\xB3",
+    b"\xCD\xB6\xB5\xB4\xB3",
+    b"\xA3\xB6\xB5\xB4\xB3",
+    b"\x0F\xB6\xB5\xB4\xB3",
+    b"\x05\xB6\xB5\xB4\xB3",
+]
+
+
+def make_multiceiver(medium: Medium):
+    """create a receiver that listens to 6 transmitters (1 per pipe)."""
+    rx_node = medium.add_node(RF24)
+    senders = []
+    for pipe, address in enumerate(ADDRESSES):
+        rx_node.open_rx_pipe(pipe, address)
+        sender = medium.add_node(RF24)
+        sender.open_tx_pipe(address)
+        sender.listen = False
+        senders.append(sender)
+    rx_node.listen = True
+    return rx_node, senders
+
+
+def test_ring():
+    """test the PipeRing overflow policies"""
+    with pytest.raises(ValueError):
+        PipeRing(0)
+    with pytest.raises(ValueError):
+        PipeRing(2, overflow=2)
+    with pytest.raises(ValueError):
+        PipeRing(2).push(bytes(33))
+    for policy, expected in ((0, [b"0", b"1"]), (DROP_OLDEST, [b"1", b"2"])):
+        ring = PipeRing(2, overflow=policy)
+        for i in range(3):
+            ring.push(str(i).encode())
+        assert len(ring) == 2 and ring.dropped == 1
+        assert ring.peek() == expected[0]
+        buf = bytearray(32)
+        assert ring.read_into(buf) == 1 and buf[:1] == expected[0]
+        assert ring.read() == expected[1]
+        assert ring.read() is None and not ring.read_into(buf)
+
+
+@pytest.mark.parametrize("overflow", [0, DROP_OLDEST])
+def test_demux(medium: Medium, overflow: int):
+    """test that a slow pipe drops payloads without stalling the other pipes"""
+    rx_node, senders = make_multiceiver(medium)
+    demux = RxDemux(rx_node, capacity=3, overflow=overflow)
+    fast = []
+    demux.set_callback(5, lambda pipe, payload: fast.append(bytes(payload)))
+    with pytest.raises(IndexError):
+        demux.set_callback(6, None)
+    for count in range(5):
+        for pipe, sender in enumerate(senders):
+            assert sender.send(bytes([pipe, count]) * 4)
+            demux.update()  # the RX FIFO holds only 3 payloads
+    assert demux.available() == 15 and demux.available(5) == 0
+    assert fast == [bytes([5, count]) * 4 for count in range(5)]
+    assert demux.dropped == [2] * 5 + [0]
+    first = 2 if overflow == DROP_OLDEST else 0
+    for pipe in range(5):
+        for count in range(first, first + 3):
+            assert demux.read(pipe) == bytes([pipe, count]) * 4
+        assert demux.read(pipe) is None
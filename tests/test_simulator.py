@@ -0,0 +1,94 @@
+"""Tests related to the simulated RF medium."""
+import pytest
+from simulator import Medium
+from conftest import make_link, serve
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.rf24_network import RF24Network
+from circuitpython_nrf24l01.rf24_mesh import RF24Mesh, RF24MeshNoMaster
+from circuitpython_nrf24l01.network.structs import RF24NetworkHeader
+
+
+def test_send(medium: Medium):
+    """test a transmission with an ACK payload."""
+    tx_node, rx_node = make_link(medium)
+    rx_node.load_ack(b"ack", 1)
+    start = medium.now_ns
+    assert tx_node.send(b"hello") == b"ack"
+    assert 0 < medium.now_ns - start < 2000000  # in simulated time
+    assert rx_node.available() and rx_node.pipe == 1
+    assert rx_node.read() == b"hello"
+    rx_node.channel = 2
+    assert not tx_node.send(b"hello")  # no receiver on this channel
+    assert medium.stats["failed"] == 1
+
+
+@pytest.mark.parametrize("loss", [0.0, 1.0])
+def test_loss(medium: Medium, loss: float):
+    """test that lost packets are retried and eventually fail."""
+    tx_node, rx_node = make_link(medium)
+    medium.link_loss[(tx_node, rx_node)] = loss
+    assert bool(tx_node.send(b"hello")) is not bool(loss)
+    assert rx_node.available() is not bool(loss)
+    assert medium.stats["retries"] == (15 if loss else 0)
+
+
+def test_collisions(medium: Medium):
+    """test that overlapping packets on the same channel are lost."""
+    tx_node, rx_node = make_link(medium)
+    other = medium.add_node(RF24)
+    other.open_tx_pipe(b"2Node")
+    other.listen = False
+    other.arc = 0
+    results = []
+    medium.spawn(lambda: results.append(other.send(b"noise" * 6)))
+    medium.spawn(lambda: results.append(tx_node.send(b"hello")))
+    medium.run(0.1)
+    assert medium.stats["collisions"] >= 2
+    assert results[1] and rx_node.read() == b"hello"  # retried after the collision
+
+
+def test_wait_irq(medium: Medium):
+    """test that a node can idle until its radio receives a payload."""
+    tx_node, rx_node = make_link(medium)
+    rx_node.interrupt_config(data_sent=False, data_fail=False)
+    start = medium.now_ns
+    assert not medium.wait_irq(rx_node, 0.01)  # nothing was sent
+    assert medium.now_ns - start == 10000000
+    medium.spawn(lambda: medium.clock.sleep(0.002) or tx_node.send(b"hello"))
+    start = medium.now_ns
+    assert medium.wait_irq(rx_node, 0.01)
+    assert 2000000 < medium.now_ns - start < 3000000
+    assert rx_node.read() == b"hello"
+
+
+def test_network(medium: Medium):
+    """test routing a message between network nodes (via a parent node)."""
+    nodes = [medium.add_node(RF24Network, addr) for addr in (0, 0o1, 0o11)]
+    received = []
+
+    def run(node):
+        node.update()
+        while node.available():
+            received.append((node.node_address, node.read().message))
+
+    for node in nodes[:2]:
+        serve(medium, run, node, interval=0.001)
+    assert nodes[2].send(RF24NetworkHeader(0, "T"), b"hello")
+    medium.run(0.05)
+    assert received == [(0, b"hello")]
+
+
+def test_mesh_join(medium: Medium):
+    """test that a mesh node gets an address from the master node."""
+    master = medium.add_node(RF24Mesh, 0)
+    node = medium.add_node(RF24MeshNoMaster, 1)
+
+    serve(medium, master.update, interval=0.001)
+    node.renew_address(1)
+    assert node.check_connection()
+    assert master.lookup_address(1) == node.node_address
+    assert node.lookup_node_id(node.node_address) == 1
+    # lookups of unassigned nodes return -2 (not a valid ID or address)
+    assert node.lookup_node_id(0o2 if node.node_address != 0o2 else 0o3) == -2
+    assert node.lookup_address(99) == -2
+    assert medium.now_ns < 1000000000
@@ -0,0 +1,66 @@
+"""Tests related to the spectrum module."""
+import pytest
+from circuitpython_nrf24l01.rf24 import RF24
+from circuitpython_nrf24l01.spectrum import SpectrumMonitor, least_occupied, scan
+
+
+def noisy_rpd(radio: RF24, monkeypatch: pytest.MonkeyPatch, noisy: set) -> list:
+    """make the fake radio's RPD register detect a signal on ``noisy`` channels"""
+    spi = radio._spi._spi
+    xfer, transactions = (spi.xfer2, [])
+
+    def rpd(out_buf, baud_rate):
+        transactions.append(out_buf[0])
+        if out_buf[0] == 9:
+            signal = spi.state.registers[5][0] in noisy and not radio.ce_pin
+            return spi.state.registers[7] + bytes([signal])
+        return xfer(out_buf, baud_rate)
+
+    monkeypatch.setattr(spi, "xfer2", rpd)
+    return transactions
+
+
+def test_scan(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test scan() and its ScanResult"""
+    rf24_obj.channel = 76
+    rf24_obj.listen = False
+    transactions = noisy_rpd(rf24_obj, monkeypatch, {3, 4, 9})
+    with pytest.raises(ValueError):
+        scan(rf24_obj, [126])
+    result = scan(rf24_obj, range(10), dwell_us=0, sweeps=4)
+    assert len(result) == 10 and result.sweeps == 4
+    assert list(result.hits) == [4 if i in (3, 4, 9) else 0 for i in range(10)]
+    assert result.ratios()[3] == 1.0 and result.ratios()[0] == 0.0
+    assert result.cleanest() == 0
+    # 1 write & 1 read per sample; the channel & role are saved and restored once
+    assert len(transactions) == 5 + 2 * 40 + 3
+    assert rf24_obj.channel == 76 and not rf24_obj.listen
+    numpy = pytest.importorskip("numpy")
+    assert numpy.array_equal(result.to_numpy()[3], [3, 4, 1.0])
+
+
+def test_least_occupied():
+    """test that busy neighbors count against a channel"""
+    assert least_occupied(b"\x00\x01\x02\x03", [0.0, 0.0, 0.0, 1.0]) == 0
+    assert least_occupied(b"\x00\x01\x05", [1.0, 0.0, 0.4]) == 5
+    assert least_occupied(b"", []) is None
+
+
+def test_monitor(rf24_obj: RF24, monkeypatch: pytest.MonkeyPatch):
+    """test the rolling occupancy statistics"""
+    rf24_obj.channel = 76
+    noisy = {4, 5, 6, 7}
+    noisy_rpd(rf24_obj, monkeypatch, noisy)
+    with pytest.raises(ValueError):
+        SpectrumMonitor(rf24_obj, smoothing=0)
+    monitor = SpectrumMonitor(rf24_obj, range(8), dwell_us=0, smoothing=0.5)
+    for _ in range(8):
+        monitor.update(2)
+    assert monitor.sweeps == 2
+    assert monitor.occupancy[5] == 0.75 and monitor.occupancy[0] == 0.0
+    assert monitor.cleanest() == 0
+    noisy ^= {0, 1, 2, 3, 4, 5, 6, 7}  # the signals move to channels 0-3
+    monitor.update(8 * 4)
+    assert monitor.cleanest() == 7  # its only neighbor is also getting quieter
+    monitor.stop()
+    assert rf24_obj.channel == 76
@@ -1,5 +1,6 @@
 """Simple tests for Network data structures."""
 import struct
+import time
 from typing import Union, Optional, List
 import pytest
 from circuitpython_nrf24l01.fake_ble import (
@@ -20,6 +21,7 @@ from circuitpython_nrf24l01.network.structs import (
     RF24NetworkFrame,
     FrameQueue,
     FrameQueueFrag,
+    _Struct,
 )
 from circuitpython_nrf24l01.network.constants import (
     MSG_FRAG_FIRST,
@@ -62,6 +64,16 @@ def test_header(to_node: int, msg_t: Union[str, int]):
     assert header.frame_id == header._RF24NetworkHeader__next_id - 1
     assert not header.unpack(b"\0")
     assert header.unpack(data)
+    buf = bytearray(10)
+    header.pack_into(buf, 2)
+    assert buf[2:] == data
+    assert not header.unpack_from(buf, 3)
+    assert header.unpack_from(memoryview(buf), 2)
+    assert header.pack() == data
+    fallback = _Struct("HHHBB")  # used when struct.Struct is not available
+    assert fallback.unpack_from(buf, 2) == struct.unpack("HHHBB", data)
+    fallback.pack_into(buf, 0, *struct.unpack("HHHBB", data))
+    assert fallback.pack(*fallback.unpack_from(buf)) == data
 
 
 @pytest.mark.parametrize(
@@ -76,6 +88,12 @@ def test_net_frame(header, msg):
     assert not frame.unpack(b"\0")
     assert frame.unpack(data)
     assert not frame.is_ack_type()
+    buf = bytearray(len(data) + 1)
+    assert frame.pack_into(buf, 1) == len(data)
+    assert buf[1:] == data
+    assert frame.unpack_from(buf, 1) and frame.message == data[8:]
+    with pytest.raises(AttributeError):
+        frame.spam = None  # type: ignore[attr-defined]
 
 
 def test_queue():
@@ -94,14 +112,50 @@ def test_queue():
         assert msg[0] == len(queue) + 1
 
 
+def test_queue_ring():
+    """test the Frame Queue's ring buffer & duplicate index"""
+    queue = FrameQueue()
+    queue.max_queue_size = 3
+    frame = RF24NetworkFrame(RF24NetworkHeader(0o1, 1), bytearray(b"\x00"))
+    dequeued = []
+    for i in range(10):  # wrap around the ring several times
+        frame.header.frame_id = i
+        frame.message[0] = i
+        assert queue.enqueue(frame)
+        assert not queue.enqueue(frame)  # duplicate
+        if i >= 2:
+            assert len(queue) == 3
+            with pytest.raises(ValueError):
+                queue.max_queue_size = 2
+            dequeued.append(queue.dequeue())
+    # the dequeued frames are owned by the caller (not overwritten by enqueue())
+    assert [f.header.frame_id for f in dequeued] == list(range(8))
+    assert [f.message for f in dequeued] == [bytes([i]) for i in range(8)]
+    result = dequeued[-1]
+    assert queue.enqueue(result)  # not a duplicate after being dequeued
+    queue.max_queue_size = 4
+    peeked = queue.peek()
+    assert queue.dequeue_into(frame) and frame.header.frame_id == 8
+    assert peeked.header.frame_id == 8 and peeked is not frame
+    assert [queue.dequeue().header.frame_id for _ in range(2)] == [9, 7]
+    assert queue.dequeue() is None and not queue.dequeue_into(frame)
+
+
 @pytest.mark.parametrize(
-    "types",
+    "types,counts",
     [
-        [MSG_FRAG_FIRST, MSG_FRAG_LAST],
-        [MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_LAST],
-        pytest.param([MSG_FRAG_MORE, MSG_FRAG_LAST], marks=pytest.mark.xfail),
+        ([MSG_FRAG_FIRST, MSG_FRAG_LAST], [2]),
+        ([MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_LAST], [3, 2]),
+        pytest.param([MSG_FRAG_MORE, MSG_FRAG_LAST], [2], marks=pytest.mark.xfail),
         pytest.param(
-            [MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_MORE], marks=pytest.mark.xfail
+            [MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_MORE],
+            [2, 1, 1],
+            marks=pytest.mark.xfail,
+        ),
+        pytest.param(
+            [MSG_FRAG_FIRST, MSG_FRAG_MORE, MSG_FRAG_LAST],
+            [4, 3],
+            marks=pytest.mark.xfail,
         ),
     ],
     ids=[
@@ -109,9 +163,10 @@ def test_queue():
         "3 fragments",
         "no beginning fragment",
         "non-sequential fragments",
+        "missing fragment",
     ],
 )
-def test_frag_queue(types: List[int]):
+def test_frag_queue(types: List[int], counts: List[int]):
     """test de-fragmenting Frame Queue"""
     queue = FrameQueueFrag()
     frame = RF24NetworkFrame()  # frame_id must be constant for this
@@ -123,12 +178,71 @@ def test_frag_queue(types: List[int]):
             # just for better code coverage
             frame.header.reserved = NETWORK_EXT_DATA
         else:
-            # mock sequence of frames with frag type (allows for non-sequential test)
-            frame.header.reserved = MSG_FRAG_LAST - typ
+            # the number of fragments left (counting this one)
+            frame.header.reserved = counts[i]
         print("queueing frame", frame.header.to_string())
         assert queue.enqueue(frame)
 
 
+def fragments(from_node: int, message: bytes, msg_t: int = 1) -> list:
+    """split a message into fragments the way RF24Network sends them"""
+    chunks = [message[i : i + 24] for i in range(0, len(message), 24)]
+    frames = []
+    for count, chunk_ in enumerate(chunks):
+        header = RF24NetworkHeader(0, MSG_FRAG_MORE)
+        header.from_node, header.frame_id = (from_node, 7)
+        header.reserved = len(chunks) - count
+        if not count:
+            header.message_type = MSG_FRAG_FIRST
+        elif count == len(chunks) - 1:
+            header.message_type, header.reserved = (MSG_FRAG_LAST, msg_t)
+        frames.append(RF24NetworkFrame(header, chunk_))
+    return frames
+
+
+def test_frag_table(monkeypatch):
+    """test reassembling fragmented messages from several senders at once"""
+    queue = FrameQueueFrag()
+    senders = {node: bytes([node]) * 144 for node in (1, 2, 3, 4, 5)}
+    streams = [fragments(node, msg) for node, msg in senders.items()]
+    for frames in zip(*streams):  # interleave the fragments
+        for frame in frames:
+            assert queue.enqueue(frame)
+    assert len(queue) == 5
+    while queue:
+        frame = queue.dequeue()
+        assert frame.header.message_type == 1
+        assert frame.message == senders[frame.header.from_node]
+    assert not queue.frags_expired and not queue.frags_evicted
+
+    # a fragment without the first fragment
+    assert not queue.enqueue(fragments(1, senders[1])[1])
+    assert queue.frags_dropped == 1
+
+    # the last fragment without all the fragments before it
+    frames = fragments(1, senders[1])
+    assert queue.enqueue(frames[0]) and queue.enqueue(frames[1])
+    assert not queue.enqueue(frames[-1])  # frames[2:-1] were lost
+    assert queue.frags_dropped == 2 and not queue
+    assert not queue.enqueue(frames[2])  # the partial message was discarded
+
+    # exceed the memory cap (each 144 byte message reserves 144 bytes)
+    for node in range(1, 9):
+        assert queue.enqueue(fragments(node, bytes([node]) * 144)[0])
+    assert queue.frags_evicted == 1  # 8 * 144 > 1024
+    assert not queue.enqueue(fragments(1, senders[1])[1])  # node 1 was evicted
+    frames = fragments(2, senders[2])
+    for frame in frames[1:]:
+        assert queue.enqueue(frame)
+    assert queue.dequeue().message == senders[2]
+
+    # expire the rest
+    now = time.monotonic_ns() + (queue.frag_timeout + 1) * 1000000
+    monkeypatch.setattr(time, "monotonic_ns", lambda: now)
+    assert not queue.enqueue(fragments(3, senders[3])[1])
+    assert queue.frags_expired == 6
+
+
 @pytest.mark.parametrize("dev_name", [b"n", b"\xFF", None])
 def test_queue_element(ble_obj: FakeBLE, dev_name: Optional[bytes]):
     """test the deciphering of BLE payload data from buffers."""